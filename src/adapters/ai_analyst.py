@@ -9,16 +9,27 @@ Responsabilidad:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 import random
 import re
-from typing import Any
+import time
+from collections import Counter, OrderedDict
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, Awaitable, Callable
 
 
+import httpx
 from pydantic import BaseModel, Field
 from openai import AsyncOpenAI
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 APIConnectionError: type[Exception]
 APITimeoutError: type[Exception]
 APIStatusError: type[Exception]
@@ -45,9 +56,10 @@ except Exception:  # pragma: no cover
     APIStatusError = _FallbackOpenAIError
     RateLimitError = _FallbackOpenAIError
 
-from core.config import AppSettings  # noqa: E402
+from adapters.rate_limiter import TokenBucket, parse_retry_after  # noqa: E402
+from core.config import AppSettings, get_settings, get_user_config_dir  # noqa: E402
 from core.domain.language import Language  # noqa: E402
-from core.domain.models import AnalysisReport, PersonEntity  # noqa: E402
+from core.domain.models import AnalysisReport, PersonEntity, SocialProfile  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +73,101 @@ def build_deepseek_client(*, api_key: str, base_url: str) -> AsyncOpenAI:
     return AsyncOpenAI(api_key=api_key, base_url=base_url)
 
 
+# Clientes compartidos por (event loop, hash(api_key), base_url, timeout): reutilizan
+# pool, DNS y TLS entre llamadas. httpx.AsyncClient queda atado al loop que lo usa, por
+# eso el loop forma parte de la clave (la CLI hace un asyncio.run por comando). La key
+# se guarda hasheada para no dejar el secreto en claro en las claves del dict.
+_CLIENT_CACHE: dict[tuple[int, str, str, float], tuple[asyncio.AbstractEventLoop, AsyncOpenAI]] = {}
+_AI_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+def _get_client(*, api_key: str, base_url: str, timeout: float) -> AsyncOpenAI:
+    loop = asyncio.get_running_loop()
+    key = (id(loop), hashlib.sha256(api_key.encode("utf-8")).hexdigest(), base_url, timeout)
+    cached = _CLIENT_CACHE.get(key)
+    if cached is not None and cached[0] is loop and not cached[1].is_closed():
+        return cached[1]
+
+    # Limpia entradas de loops ya cerrados (ids de objetos pueden reciclarse).
+    for stale_key, (stale_loop, _) in list(_CLIENT_CACHE.items()):
+        if stale_loop.is_closed():
+            _CLIENT_CACHE.pop(stale_key, None)
+
+    client = AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        timeout=timeout,
+        max_retries=0,
+        http_client=httpx.AsyncClient(limits=_AI_HTTP_LIMITS, timeout=timeout, follow_redirects=True),
+    )
+    _CLIENT_CACHE[key] = (loop, client)
+    return client
+
+
+# Un TokenBucket por (event loop, base_url, rpm, tpm): la cuota es de la cuenta/proveedor
+# y debe compartirse entre llamadas concurrentes (p.ej. analyze_persons).
+_THROTTLE_CACHE: dict[tuple[int, str, int, int], tuple[asyncio.AbstractEventLoop, TokenBucket]] = {}
+
+
+def _get_throttle(*, base_url: str, rpm: int, tpm: int) -> TokenBucket | None:
+    if rpm <= 0 and tpm <= 0:
+        return None
+    loop = asyncio.get_running_loop()
+    key = (id(loop), base_url, rpm, tpm)
+    cached = _THROTTLE_CACHE.get(key)
+    if cached is not None and cached[0] is loop:
+        return cached[1]
+    for stale_key, (stale_loop, _) in list(_THROTTLE_CACHE.items()):
+        if stale_loop.is_closed():
+            _THROTTLE_CACHE.pop(stale_key, None)
+    bucket = TokenBucket(rpm=rpm, tpm=tpm)
+    _THROTTLE_CACHE[key] = (loop, bucket)
+    return bucket
+
+
+async def aclose_ai_clients() -> None:
+    """Cierra los clientes IA compartidos asociados al event loop actual."""
+
+    loop = asyncio.get_running_loop()
+    for key, (owner, client) in list(_CLIENT_CACHE.items()):
+        if owner is loop:
+            _CLIENT_CACHE.pop(key, None)
+            await client.close()
+
+
 _JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
+_JSON_DECODER = json.JSONDecoder()
+_H1_RE = re.compile(r"(?m)^##\s*1\.")
+_H6_RE = re.compile(r"(?m)^##\s*6\.")
+_NEXT_H2_RE = re.compile(r"(?m)^##\s+")
+_JUNK_H_RE = re.compile(r"(?im)^##\s*(highlights|confidence)\b")
+
+
+def _json_dumps_bytes(value: object, *, sort_keys: bool = False) -> bytes:
+    """Serializa a JSON compacto en bytes UTF-8 (orjson si está instalado).
+
+    Para hashing y escritura a disco: evita el ida y vuelta str <-> bytes.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(value, option=option)
+    return json.dumps(value, ensure_ascii=False, sort_keys=sort_keys, separators=(",", ":")).encode("utf-8")
+
+
+def _json_dumps(value: object, *, sort_keys: bool = False) -> str:
+    """Serializa a JSON compacto UTF-8 (orjson si está instalado)."""
+
+    if orjson is not None:
+        return _json_dumps_bytes(value, sort_keys=sort_keys).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, sort_keys=sort_keys, separators=(",", ":"))
+
+
+def _json_loads(text: str | bytes) -> Any:
+    # orjson.JSONDecodeError hereda de json.JSONDecodeError: los except existentes siguen valiendo.
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 def _truncate_str(value: object, max_chars: int) -> str | None:
@@ -95,6 +201,77 @@ def _compact_text_samples(value: object, *, max_items: int, max_chars_each: int)
     return out or None
 
 
+# Tablas de prioridad de claves para la evidencia por perfil:
+# (clave de salida, claves de metadata en orden de prioridad, normalizador).
+# Equivale a `meta.get(a) or meta.get(b)` con una sola pasada por tabla.
+_FieldSpec = tuple[str, tuple[str, ...], Callable[[object], object]]
+
+_PROFILE_SIGNAL_FIELDS: tuple[_FieldSpec, ...] = (
+    ("display_name", ("name", "display_name"), lambda v: _truncate_str(v, 160)),
+    ("company", ("company",), lambda v: _truncate_str(v, 160)),
+    ("blog", ("blog", "website"), lambda v: _truncate_str(v, 220)),
+    ("created_at", ("created_at", "created_utc"), lambda v: _truncate_str(v, 64)),
+    ("followers", ("followers",), lambda v: v),
+    ("following", ("following",), lambda v: v),
+    ("public_repos", ("public_repos", "repos"), lambda v: v),
+    ("languages", ("languages", "tech_stack"), lambda v: _limit_list(v, 25) or _truncate_str(v, 220)),
+)
+
+_PROFILE_EVIDENCE_FIELDS: tuple[_FieldSpec, ...] = (
+    ("location", ("location", "location_claim"), lambda v: _truncate_str(v, 140)),
+    # Evidencia opcional (puede no existir según el scraper)
+    ("activity_timestamps", ("commits", "timestamps"), lambda v: _limit_list(v, 60)),
+    (
+        "text_samples",
+        ("comments", "texts"),
+        lambda v: _compact_text_samples(v, max_items=16, max_chars_each=320),
+    ),
+)
+
+
+def _collect_fields(meta: dict[str, Any], table: tuple[_FieldSpec, ...]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for out_key, keys, normalize in table:
+        value: object = None
+        for key in keys:
+            value = meta.get(key)
+            if value:
+                break
+        value = normalize(value)
+        if value is not None:
+            out[out_key] = value
+    return out
+
+
+def _profile_meta(profile: SocialProfile) -> dict[str, Any]:
+    meta = profile.metadata
+    return meta if isinstance(meta, dict) else {}
+
+
+def _profile_evidence(
+    profile: SocialProfile,
+    *,
+    meta: dict[str, Any],
+    clean_url: str,
+    hibp: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Entrada de evidencia de un perfil; solo incluye claves con valor."""
+
+    evidence: dict[str, Any] = {"network": profile.network_name, "username": profile.username}
+    if clean_url:
+        evidence["url"] = clean_url
+    bio = _truncate_str(profile.bio or meta.get("bio"), 420)
+    if bio:
+        evidence["bio"] = bio
+    evidence.update(_collect_fields(meta, _PROFILE_EVIDENCE_FIELDS))
+    signals = _collect_fields(meta, _PROFILE_SIGNAL_FIELDS)
+    if signals:
+        evidence["signals"] = signals
+    if hibp:
+        evidence["hibp_breaches"] = hibp
+    return evidence
+
+
 def _summary_has_six_sections(*, summary: str, language: Language) -> bool:
     text = (summary or "").strip()
     if not text:
@@ -102,32 +279,53 @@ def _summary_has_six_sections(*, summary: str, language: Language) -> bool:
 
     # Exigimos al menos encabezados 1 y 6 para evitar falsos positivos.
     # El patrón es idéntico para todos los idiomas.
-    return bool(re.search(r"(?m)^##\s*1\.", text)) and bool(re.search(r"(?m)^##\s*6\.", text))
+    return bool(_H1_RE.search(text)) and bool(_H6_RE.search(text))
 
 
-def _extract_json_object(text: str) -> str:
-    """Obtiene el primer objeto JSON presente en la respuesta del proveedor."""
-    match = _JSON_FENCE_RE.search(text)
-    if match:
-        return match.group(1).strip()
+def _locate_json_object(text: str) -> tuple[str, dict[str, Any] | None]:
+    """Localiza el primer objeto JSON de la respuesta del proveedor.
 
+    Devuelve `(json_text, decoded)`: `decoded` ya viene parseado cuando hubo que
+    escanear con `raw_decode`, para no volver a parsear el mismo texto.
+    """
+    # Caso común (JSON mode): el cuerpo ya es un objeto desnudo, sin regex.
     stripped = text.strip()
     if stripped.startswith("{") and stripped.endswith("}"):
-        return stripped
+        return stripped, None
 
+    # La regex de fences solo se ejecuta si hay un fence que buscar.
+    if "```" in stripped:
+        match = _JSON_FENCE_RE.search(stripped)
+        if match:
+            return match.group(1).strip(), None
+
+    # Un solo escaneo: decodifica exactamente un objeto desde la primera '{'
+    # (tolera texto antes/después y '}' dentro de strings).
     start = stripped.find("{")
-    end = stripped.rfind("}")
-    if 0 <= start < end:
-        candidate = stripped[start : end + 1]
+    if start >= 0:
         try:
-            json.loads(candidate)
-            return candidate
+            decoded, end = _JSON_DECODER.raw_decode(stripped, start)
+            return stripped[start:end], decoded
         except json.JSONDecodeError:
             pass
 
     raise ValueError("Could not locate a valid JSON object in the AI provider response.")
 
 
+def _extract_json_object(text: str) -> str:
+    """Obtiene el primer objeto JSON presente en la respuesta del proveedor."""
+    return _locate_json_object(text)[0]
+
+
+def _parse_report_payload(text: str) -> _AIReportPayload:
+    # Parseo + validación en una sola pasada (pydantic-core); JSON inválido
+    # levanta ValidationError (subclase de ValueError) -> rama de auto-corrección.
+    json_text, decoded = _locate_json_object(text)
+    if decoded is not None:
+        return _AIReportPayload.model_validate(decoded)
+    return _AIReportPayload.model_validate_json(json_text)
+
+
 def _sanitize_summary_markdown(text: str) -> str:
     """Recorta basura frecuente en 'summary'.
 
@@ -143,21 +341,22 @@ def _sanitize_summary_markdown(text: str) -> str:
         return summary
 
     # Mantener hasta el final de la sección 6 (y cortar cualquier nuevo heading '##' posterior).
-    m6 = re.search(r"(?m)^##\s*6\.", summary)
+    m6 = _H6_RE.search(summary)
     if m6:
         tail = summary[m6.end() :]
-        m_next = re.search(r"(?m)^##\s+", tail)
+        m_next = _NEXT_H2_RE.search(tail)
         if m_next:
             summary = summary[: m6.end() + m_next.start()].rstrip()
 
     # Si el modelo no siguió '## 6.' pero igualmente metió '## Highlights', cortar allí.
-    m_junk = re.search(r"(?im)^##\s*(highlights|confidence)\b", summary)
+    m_junk = _JUNK_H_RE.search(summary)
     if m_junk:
         summary = summary[: m_junk.start()].rstrip()
 
     return summary
 
 
+@lru_cache(maxsize=8)
 def _build_system_prompt(language: Language) -> str:
     # Importante: este prompt está diseñado para minimizar alucinaciones.
     # No pedimos ni mostramos "chain of thought"; pedimos conclusiones breves y basadas en evidencia.
@@ -367,6 +566,7 @@ def _build_system_prompt(language: Language) -> str:
     )
 
 
+@lru_cache(maxsize=8)
 def _build_system_prompt_compact(language: Language) -> str:
     """Versión compacta del prompt para modelos pequeños.
 
@@ -473,6 +673,7 @@ def _build_system_prompt_compact(language: Language) -> str:
     )
 
 
+@lru_cache(maxsize=64)
 def _should_use_compact_prompt(*, base_url: str, model: str) -> bool:
     base = (base_url or "").lower()
     m = (model or "").lower()
@@ -481,6 +682,48 @@ def _should_use_compact_prompt(*, base_url: str, model: str) -> bool:
     return "8b" in m or "instant" in m
 
 
+@lru_cache(maxsize=16)
+def _system_prompt(language: Language, compact: bool) -> str:
+    """Prompt de sistema cacheado por (idioma, compacto)."""
+
+    return _build_system_prompt_compact(language) if compact else _build_system_prompt(language)
+
+
+@lru_cache(maxsize=64)
+def _prompt_budget_tokens(model: str) -> int:
+    """Presupuesto aproximado de tokens para la evidencia de perfiles."""
+
+    m = (model or "").lower()
+    if "8b" in m or "instant" in m:
+        return 3500
+    return 12000
+
+
+def _approx_tokens(text: str) -> int:
+    # Regla rápida ~4 chars/token: suficiente para dimensionar el prompt sin tokenizer.
+    return len(text) // 4 + 1
+
+
+@lru_cache(maxsize=64)
+def _supports_json_mode(*, base_url: str, model: str) -> bool:
+    """Proveedores conocidos que aceptan `response_format={"type": "json_object"}`."""
+
+    base = (base_url or "").lower()
+    m = (model or "").lower()
+    if "api.deepseek.com" in base:
+        # deepseek-reasoner no soporta JSON mode.
+        return "reasoner" not in m
+    return "api.groq.com" in base or "api.openai.com" in base
+
+
+def _supports_stream_usage(*, base_url: str) -> bool:
+    """Proveedores conocidos que aceptan `stream_options={"include_usage": True}`."""
+
+    base = (base_url or "").lower()
+    return "api.openai.com" in base or "api.deepseek.com" in base
+
+
+@lru_cache(maxsize=64)
 def _max_tokens_for_model(model: str) -> int:
     m = (model or "").lower()
     if "8b" in m or "instant" in m:
@@ -488,6 +731,20 @@ def _max_tokens_for_model(model: str) -> int:
     return 1800
 
 
+_MIN_REPORT_TOKENS = 1200
+
+
+def _max_tokens_for_request(model: str, evidence_tokens: int) -> int:
+    """Presupuesto de salida según la evidencia enviada, acotado por el tope del modelo.
+
+    Con poca evidencia el reporte es corto (secciones de "evidencia insuficiente"):
+    pedir menos tokens acorta la generación. El suelo evita cortar el JSON a medias.
+    """
+
+    cap = _max_tokens_for_model(model)
+    return min(cap, max(_MIN_REPORT_TOKENS, evidence_tokens * 2))
+
+
 def _extract_hibp_breaches(meta: dict[str, Any]) -> dict[str, Any] | None:
     breaches_dump = meta.get("breaches")
     if not isinstance(breaches_dump, dict):
@@ -516,13 +773,26 @@ def _safe_retry_after_seconds(exc: Exception) -> float | None:
     headers = getattr(response, "headers", None)
     if not headers:
         return None
-    value = headers.get("retry-after") or headers.get("Retry-After")
-    if not value:
-        return None
-    try:
-        return max(0.0, float(value))
-    except Exception:
-        return None
+    # Segundos o HTTP-date (RFC 7231), mismo parser que el rate limiter de site-lists.
+    return parse_retry_after(headers.get("retry-after") or headers.get("Retry-After"))
+
+
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_CAP_SECONDS = 10.0
+
+
+def _backoff_delay(attempt: int, exc: Exception | None = None, *, cap: float = _BACKOFF_CAP_SECONDS) -> float:
+    """Backoff exponencial con jitter, acotado por `cap`; respeta Retry-After si llega.
+
+    El jitter multiplicativo (x0.5–1.5) descorrelaciona a workers concurrentes que
+    fallaron a la vez, para que no reintenten en bloque.
+    """
+
+    retry_after = _safe_retry_after_seconds(exc) if exc is not None else None
+    if retry_after is not None:
+        # Reintentar antes de Retry-After solo gana otro 429: aquí no aplica `cap`.
+        return retry_after + random.uniform(0.0, 0.35)
+    return min(cap, _BACKOFF_BASE_SECONDS * (2**attempt)) * random.uniform(0.5, 1.5)
 
 
 def _looks_like_model_rejection(exc: Exception) -> bool:
@@ -536,6 +806,77 @@ class _AIReportPayload(BaseModel):
     confidence: float = Field(default=0.5, ge=0.0, le=1.0)
 
 
+def _ai_cache_dir() -> Path:
+    return get_user_config_dir() / "cache" / "ai"
+
+
+def _ai_cache_key(*, system_prompt: str, user_payload: dict[str, Any], model: str, language: Language) -> str:
+    """Hash estable de todo lo que determina la respuesta del proveedor."""
+
+    digest = hashlib.sha256()
+    for part in (
+        system_prompt.encode("utf-8"),
+        _json_dumps_bytes(user_payload, sort_keys=True),
+        model.encode("utf-8"),
+        language.value.encode("utf-8"),
+    ):
+        digest.update(part)
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+# Capa en memoria delante del cache en disco: reintentos/re-análisis del mismo objetivo
+# dentro del proceso no tocan disco ni re-validan JSON. LRU acotada por ruta de entrada.
+_REPORT_MEMO: OrderedDict[Path, tuple[float, AnalysisReport]] = OrderedDict()
+_REPORT_MEMO_MAXSIZE = 256
+
+
+def _memo_report(path: Path, stored_at: float, report: AnalysisReport) -> None:
+    _REPORT_MEMO[path] = (stored_at, report)
+    _REPORT_MEMO.move_to_end(path)
+    while len(_REPORT_MEMO) > _REPORT_MEMO_MAXSIZE:
+        _REPORT_MEMO.popitem(last=False)
+
+
+def _load_cached_report(*, cache_dir: Path, key: str, ttl_seconds: float) -> AnalysisReport | None:
+    """Devuelve un reporte cacheado vigente, o None (best-effort: nunca lanza)."""
+
+    if ttl_seconds <= 0:
+        return None
+    path = cache_dir / f"{key}.json"
+    memo = _REPORT_MEMO.get(path)
+    if memo is not None:
+        if time.time() - memo[0] <= ttl_seconds:
+            _REPORT_MEMO.move_to_end(path)
+            # Copia: el llamador puede mutar el reporte (p.ej. person.analysis).
+            return memo[1].model_copy(deep=True)
+        _REPORT_MEMO.pop(path, None)
+    try:
+        entry = _json_loads(path.read_bytes())
+        stored_at = float(entry["stored_at"])
+        if time.time() - stored_at > ttl_seconds:
+            return None
+        report = AnalysisReport.model_validate(entry["report"])
+        _memo_report(path, stored_at, report)
+        return report.model_copy(deep=True)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.debug("Ignoring unreadable AI cache entry %s: %s", path.name, exc)
+        return None
+
+
+def _store_cached_report(*, cache_dir: Path, key: str, report: AnalysisReport) -> None:
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {"stored_at": time.time(), "report": report.model_dump(mode="json")}
+        path = cache_dir / f"{key}.json"
+        _memo_report(path, entry["stored_at"], report.model_copy(deep=True))
+        path.write_bytes(_json_dumps_bytes(entry))
+    except Exception as exc:
+        logger.debug("Could not persist AI cache entry: %s", exc)
+
+
 def _is_local_base_url(url: str) -> bool:
     url_l = (url or "").strip().lower()
     return url_l.startswith("http://localhost") or url_l.startswith("http://127.0.0.1") or url_l.startswith(
@@ -543,9 +884,81 @@ def _is_local_base_url(url: str) -> bool:
     )
 
 
+# Esqueletos estáticos del análisis heurístico: se rellenan con un único format_map.
+# Idiomas sin esqueleto propio usan el inglés.
+_HEURISTIC_TEXT: dict[Language, dict[str, str]] = {
+    Language.SPANISH: {
+        "summary": (
+            "## 1. 🆔 Identidad y demografía (inferencias)\n"
+            "Evidencia insuficiente para inferir atributos personales de forma responsable.\n"
+            "\n## 2. 🌍 Análisis geo-temporal\n"
+            "No hay timestamps suficientes para triangular zona horaria.\n"
+            "\n## 3. 🧠 Perfil psicológico (OCEAN)\n"
+            "No se observa contenido textual confiable para un perfil psicológico.\n"
+            "\n## 4. 💻 Perfil técnico/profesional\n"
+            "Perfiles confirmados: {confirmed} / {total}.\n"
+            "Redes confirmadas: {networks}.\n"
+            "\n## 5. ⚖️ Ideología y valores\n"
+            "Sin evidencia suficiente para inferencias ideológicas.\n"
+            "\n## 6. ⚠️ OpSec / superficie de ataque\n"
+            "Emails observados: {emails}.{breach_block}\n"
+            "\n> Nota: análisis heurístico (sin IA remota). Motivo: {reason}."
+        ),
+        "breach_header": "Resultados de brechas (HIBP):",
+        "hl_profiles": "Perfiles confirmados: {confirmed}.",
+        "hl_networks": "Redes confirmadas: {networks}.",
+        "hl_breaches": "Se detectaron resultados de HIBP (breach-check).",
+    },
+    Language.PORTUGUESE: {
+        "summary": (
+            "## 1. 🆔 Identidade e demografia (inferências)\n"
+            "Evidência insuficiente para inferir atributos pessoais de forma responsável.\n"
+            "\n## 2. 🌍 Análise geo-temporal\n"
+            "Não há timestamps suficientes para triangular fuso horário.\n"
+            "\n## 3. 🧠 Perfil psicológico (OCEAN)\n"
+            "Não se observa conteúdo textual confiável para um perfil psicológico.\n"
+            "\n## 4. 💻 Perfil técnico/profissional\n"
+            "Perfis confirmados: {confirmed} / {total}.\n"
+            "Redes confirmadas: {networks}.\n"
+            "\n## 5. ⚖️ Ideologia e valores\n"
+            "Sem evidência suficiente para inferências ideológicas.\n"
+            "\n## 6. ⚠️ OpSec / superfície de ataque\n"
+            "Emails observados: {emails}.{breach_block}\n"
+            "\n> Nota: análise heurística (sem IA remota). Motivo: {reason}."
+        ),
+        "breach_header": "Resultados de violações (HIBP):",
+        "hl_profiles": "Perfis confirmados: {confirmed}.",
+        "hl_networks": "Redes confirmadas: {networks}.",
+        "hl_breaches": "Foram detectados resultados do HIBP (breach-check).",
+    },
+    Language.ENGLISH: {
+        "summary": (
+            "## 1. 🆔 Identity & demographics (inference)\n"
+            "Insufficient evidence to infer personal attributes responsibly.\n"
+            "\n## 2. 🌍 Geo-temporal analysis\n"
+            "Not enough timestamps to triangulate timezone.\n"
+            "\n## 3. 🧠 Psychological profile (OCEAN)\n"
+            "No reliable textual evidence for a psychological profile.\n"
+            "\n## 4. 💻 Technical/professional profile\n"
+            "Confirmed profiles: {confirmed} / {total}.\n"
+            "Confirmed networks: {networks}.\n"
+            "\n## 5. ⚖️ Ideology & values\n"
+            "Insufficient evidence for ideological inferences.\n"
+            "\n## 6. ⚠️ OpSec / attack surface\n"
+            "Observed emails: {emails}.{breach_block}\n"
+            "\n> Note: heuristic analysis (no remote AI). Reason: {reason}."
+        ),
+        "breach_header": "HIBP breach results:",
+        "hl_profiles": "Confirmed profiles: {confirmed}.",
+        "hl_networks": "Confirmed networks: {networks}.",
+        "hl_breaches": "HIBP breach-check returned results.",
+    },
+}
+
+
 def _heuristic_analysis(*, person: PersonEntity, language: Language, reason: str) -> AnalysisReport:
-    profiles = list(person.profiles)
-    confirmed = [p for p in profiles if getattr(p, "exists", False)]
+    profiles = person.profiles
+    confirmed = [p for p in profiles if p.exists]
     networks = sorted({(p.network_name or "").lower() for p in confirmed if p.network_name})
     emails = sorted({p.username for p in profiles if isinstance(getattr(p, "username", None), str) and "@" in p.username})
 
@@ -553,7 +966,7 @@ def _heuristic_analysis(*, person: PersonEntity, language: Language, reason: str
     for p in profiles:
         if (p.network_name or "").lower() != "hibp":
             continue
-        md = p.metadata if isinstance(p.metadata, dict) else {}
+        md = _profile_meta(p)
         status = md.get("status_code")
         breaches_dump = md.get("breaches")
         breaches_list: list[dict[str, object]] = []
@@ -575,96 +988,25 @@ def _heuristic_analysis(*, person: PersonEntity, language: Language, reason: str
         more = "" if len(breaches_list) <= 6 else f" (+{len(breaches_list) - 6} more)"
         breach_lines.append(f"- {p.username}: {len(breaches_list)} breaches → {titles}{more}")
 
-    if language == Language.SPANISH:
-        summary = [
-            "## 1. 🆔 Identidad y demografía (inferencias)",
-            "Evidencia insuficiente para inferir atributos personales de forma responsable.",
-            "\n## 2. 🌍 Análisis geo-temporal",
-            "No hay timestamps suficientes para triangular zona horaria.",
-            "\n## 3. 🧠 Perfil psicológico (OCEAN)",
-            "No se observa contenido textual confiable para un perfil psicológico.",
-            "\n## 4. 💻 Perfil técnico/profesional",
-            f"Perfiles confirmados: {len(confirmed)} / {len(profiles)}.",
-            f"Redes confirmadas: {', '.join(networks) if networks else 'N/A'}.",
-            "\n## 5. ⚖️ Ideología y valores",
-            "Sin evidencia suficiente para inferencias ideológicas.",
-            "\n## 6. ⚠️ OpSec / superficie de ataque",
-            f"Emails observados: {', '.join(emails) if emails else 'N/A'}.",
-        ]
-        if breach_lines:
-            summary.append("\nResultados de brechas (HIBP):\n" + "\n".join(breach_lines))
-        summary.append(f"\n> Nota: análisis heurístico (sin IA remota). Motivo: {reason}.")
-        highlights = [
-            f"Perfiles confirmados: {len(confirmed)}.",
-            f"Redes confirmadas: {', '.join(networks) if networks else 'N/A'}.",
-        ]
-        if breach_lines:
-            highlights.append("Se detectaron resultados de HIBP (breach-check).")
-        return AnalysisReport(
-            summary="\n".join(summary).strip(),
-            highlights=highlights,
-            confidence=0.25,
-            model="heuristic",
-            raw={"reason": reason},
-        )
-    if language == Language.PORTUGUESE:
-        summary = [
-            "## 1. 🆔 Identidade e demografia (inferências)",
-            "Evidência insuficiente para inferir atributos pessoais de forma responsável.",
-            "\n## 2. 🌍 Análise geo-temporal",
-            "Não há timestamps suficientes para triangular fuso horário.",
-            "\n## 3. 🧠 Perfil psicológico (OCEAN)",
-            "Não se observa conteúdo textual confiável para um perfil psicológico.",
-            "\n## 4. 💻 Perfil técnico/profissional",
-            f"Perfis confirmados: {len(confirmed)} / {len(profiles)}.",
-            f"Redes confirmadas: {', '.join(networks) if networks else 'N/A'}.",
-            "\n## 5. ⚖️ Ideologia e valores",
-            "Sem evidência suficiente para inferências ideológicas.",
-            "\n## 6. ⚠️ OpSec / superfície de ataque",
-            f"Emails observados: {', '.join(emails) if emails else 'N/A'}.",
-        ]
-        if breach_lines:
-            summary.append("\nResultados de violações (HIBP):\n" + "\n".join(breach_lines))
-        summary.append(f"\n> Nota: análise heurística (sem IA remota). Motivo: {reason}.")
-        highlights = [
-            f"Perfis confirmados: {len(confirmed)}.",
-            f"Redes confirmadas: {', '.join(networks) if networks else 'N/A'}.",
-        ]
-        if breach_lines:
-            highlights.append("Foram detectados resultados do HIBP (breach-check).")
-        return AnalysisReport(
-            summary="\n".join(summary).strip(),
-            highlights=highlights,
-            confidence=0.25,
-            model="heuristic",
-            raw={"reason": reason},
-        )
-    summary = [
-        "## 1. 🆔 Identity & demographics (inference)",
-        "Insufficient evidence to infer personal attributes responsibly.",
-        "\n## 2. 🌍 Geo-temporal analysis",
-        "Not enough timestamps to triangulate timezone.",
-        "\n## 3. 🧠 Psychological profile (OCEAN)",
-        "No reliable textual evidence for a psychological profile.",
-        "\n## 4. 💻 Technical/professional profile",
-        f"Confirmed profiles: {len(confirmed)} / {len(profiles)}.",
-        f"Confirmed networks: {', '.join(networks) if networks else 'N/A'}.",
-        "\n## 5. ⚖️ Ideology & values",
-        "Insufficient evidence for ideological inferences.",
-        "\n## 6. ⚠️ OpSec / attack surface",
-        f"Observed emails: {', '.join(emails) if emails else 'N/A'}.",
-    ]
-    if breach_lines:
-        summary.append("\nHIBP breach results:\n" + "\n".join(breach_lines))
-    summary.append(f"\n> Note: heuristic analysis (no remote AI). Reason: {reason}.")
+    text = _HEURISTIC_TEXT.get(language, _HEURISTIC_TEXT[Language.ENGLISH])
+    networks_str = ", ".join(networks) if networks else "N/A"
+    breach_block = ("\n\n" + text["breach_header"] + "\n" + "\n".join(breach_lines)) if breach_lines else ""
+    summary = text["summary"].format_map({
+        "confirmed": len(confirmed),
+        "total": len(profiles),
+        "networks": networks_str,
+        "emails": ", ".join(emails) if emails else "N/A",
+        "breach_block": breach_block,
+        "reason": reason,
+    })
     highlights = [
-        f"Confirmed profiles: {len(confirmed)}.",
-        f"Confirmed networks: {', '.join(networks) if networks else 'N/A'}.",
+        text["hl_profiles"].format(confirmed=len(confirmed)),
+        text["hl_networks"].format(networks=networks_str),
     ]
     if breach_lines:
-        highlights.append("HIBP breach-check returned results.")
+        highlights.append(text["hl_breaches"])
     return AnalysisReport(
-        summary="\n".join(summary).strip(),
+        summary=summary.strip(),
         highlights=highlights,
         confidence=0.25,
         model="heuristic",
@@ -672,30 +1014,134 @@ def _heuristic_analysis(*, person: PersonEntity, language: Language, reason: str
     )
 
 
+async def _complete_stream(client: AsyncOpenAI, **kwargs: Any) -> tuple[str, dict[str, Any], bool]:
+    """Abre el stream de chat.completions y lo consume (ver `_read_completion_stream`)."""
+
+    stream = await client.chat.completions.create(**kwargs)
+    # Sin await entre `create` y el `try` de la lectura: una cancelación llega ya
+    # dentro de `_read_completion_stream`, que cierra el stream en su `finally`.
+    return await _read_completion_stream(stream)
+
+
+async def _hedged_completion(
+    client: AsyncOpenAI,
+    *,
+    hedge_delay: float,
+    before_hedge: Callable[[], Awaitable[None]] | None = None,
+    **kwargs: Any,
+) -> tuple[str, dict[str, Any], bool]:
+    """Abre y lee la respuesta; si tarda más de `hedge_delay`, un único duplicado.
+
+    Se compite la llamada completa (abrir + leer el stream), lo mismo que mide
+    `hedge_delay`. Gana la primera respuesta exitosa; la otra se cancela y su
+    stream se cierra antes de volver. `before_hedge` (el throttle RPM/TPM) se
+    espera antes de enviar el duplicado. Si ambas fallan, propaga el error de
+    la primera.
+    """
+
+    first = asyncio.create_task(_complete_stream(client, **kwargs))
+    pending: set[asyncio.Task[Any]] = {first}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+        if done:
+            return first.result()
+
+        if before_hedge is not None:
+            gate = asyncio.ensure_future(before_hedge())
+            try:
+                await asyncio.wait({first, gate}, return_when=asyncio.FIRST_COMPLETED)
+                if first.done() and first.exception() is None:
+                    return first.result()
+                await gate
+            finally:
+                gate.cancel()
+
+        pending.add(asyncio.create_task(_complete_stream(client, **kwargs)))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+        return first.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Esperar a los cancelados: su `finally` cierra la respuesta HTTP abierta.
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+_TEMPLATE_SUMMARIES = frozenset({
+    "markdown text with the six sections above.",
+    "texto en markdown con las seis secciones.",
+})
+_TEMPLATE_HIGHLIGHTS = frozenset({
+    "3-5 high-impact deductions.",
+    "lista de 3-5 deducciones rápidas.",
+    "3-5 high impact deductions.",
+})
+_TEMPLATE_MARKERS = tuple(_TEMPLATE_SUMMARIES | _TEMPLATE_HIGHLIGHTS)
+_TEMPLATE_WINDOW = max(len(m) for m in _TEMPLATE_MARKERS)
+
+
 def _looks_like_template_response(*, parsed: _AIReportPayload) -> bool:
     summary = (parsed.summary or "").strip().lower()
-    if summary in (
-        "markdown text with the six sections above.",
-        "texto en markdown con las seis secciones.",
-    ):
+    if summary in _TEMPLATE_SUMMARIES:
         return True
 
-    placeholders = {
-        "3-5 high-impact deductions.",
-        "lista de 3-5 deducciones rápidas.",
-        "3-5 high impact deductions.",
-    }
     hl = [str(x).strip().lower() for x in (parsed.highlights or []) if isinstance(x, str)]
     if not hl:
         return True
-    if len(hl) == 1 and hl[0] in placeholders:
+    if len(hl) == 1 and hl[0] in _TEMPLATE_HIGHLIGHTS:
         return True
-    if any(x in placeholders for x in hl):
+    if any(x in _TEMPLATE_HIGHLIGHTS for x in hl):
         return True
 
     return False
 
 
+async def _read_completion_stream(stream: Any) -> tuple[str, dict[str, Any], bool]:
+    """Consume un stream de chat.completions.
+
+    Devuelve `(texto, meta, es_template)`. Si aparece un placeholder del template
+    se corta el stream en ese punto: no tiene sentido esperar (ni pagar) el resto.
+    """
+
+    parts: list[str] = []
+    meta: dict[str, Any] = {}
+    tail = ""
+    try:
+        async for chunk in stream:
+            if not meta:
+                meta = {"id": getattr(chunk, "id", None), "model": getattr(chunk, "model", None)}
+            usage = getattr(chunk, "usage", None)
+            if usage is not None and hasattr(usage, "model_dump"):
+                # Con `include_usage` el uso llega en un chunk final con `choices == []`.
+                meta["usage"] = usage.model_dump()
+            choices = getattr(chunk, "choices", None) or []
+            if not choices:
+                continue
+            finish_reason = getattr(choices[0], "finish_reason", None)
+            if finish_reason:
+                meta["finish_reason"] = finish_reason
+            delta = getattr(getattr(choices[0], "delta", None), "content", None)
+            if not delta:
+                continue
+            parts.append(delta)
+            # Ventana deslizante: detecta marcadores partidos entre chunks.
+            tail = (tail + delta.lower())[-(_TEMPLATE_WINDOW + len(delta)) :]
+            if any(marker in tail for marker in _TEMPLATE_MARKERS):
+                return "".join(parts).strip(), meta, True
+    finally:
+        await stream.close()
+    return "".join(parts).strip(), meta, False
+
+
+def _confirmed_view(person: PersonEntity, profiles: list[SocialProfile]) -> PersonEntity:
+    # Perfiles ya validados: model_construct evita re-validar/copiar el agregado.
+    return PersonEntity.model_construct(target=person.target, profiles=profiles, analysis=None)
+
+
 async def analyze_person(
     *,
     person: PersonEntity,
@@ -704,11 +1150,18 @@ async def analyze_person(
 ) -> AnalysisReport:
     """Genera un reporte de análisis IA a partir de evidencias públicas."""
 
-    settings = settings or AppSettings()
-
-    clean_person = person.model_copy()
-    clean_person.profiles = [p for p in clean_person.profiles if p.exists]
-
+    settings = settings or get_settings()
+
+    # Un solo filtrado lineal: solo perfiles confirmados llegan al prompt. No copiamos el
+    # PersonEntity; el agregado filtrado solo se materializa si caemos al heurístico.
+    clean_profiles = [p for p in person.profiles if p.exists]
+    if not clean_profiles:
+        # Sin evidencia confirmada el modelo solo puede devolver relleno: ahorramos la llamada.
+        return _heuristic_analysis(
+            person=_confirmed_view(person, clean_profiles),
+            language=language,
+            reason="no_profiles",
+        )
 
     api_key = (settings.ai_api_key.get_secret_value() if settings.ai_api_key else "").strip()
     if not api_key:
@@ -717,147 +1170,172 @@ async def analyze_person(
         if _is_local_base_url(settings.ai_base_url):
             api_key = "local"
         else:
-            return _heuristic_analysis(person=clean_person, language=language, reason="missing_ai_api_key")
+            return _heuristic_analysis(
+                person=_confirmed_view(person, clean_profiles),
+                language=language,
+                reason="missing_ai_api_key",
+            )
 
-    client = AsyncOpenAI(
-        api_key=api_key,
-        base_url=settings.ai_base_url,
-        timeout=settings.ai_timeout_seconds,
-        max_retries=0,
-    )
+    client = _get_client(api_key=api_key, base_url=settings.ai_base_url, timeout=settings.ai_timeout_seconds)
 
     configured_model = settings.ai_model
-    system_prompt = (
-        _build_system_prompt_compact(language)
-        if _should_use_compact_prompt(base_url=settings.ai_base_url, model=configured_model)
-        else _build_system_prompt(language)
+    system_prompt = _system_prompt(
+        language, _should_use_compact_prompt(base_url=settings.ai_base_url, model=configured_model)
     )
 
-    # Preparación de evidencia normalizada (best-effort).
-    profiles_data: list[dict[str, Any]] = []
-    for p in clean_person.profiles:
-        meta = p.metadata if isinstance(p.metadata, dict) else {}
-
-        # Normaliza URL (evita querystrings ruidosas).
-        clean_url = str(p.url).split('?')[0]
-
-        profile_dict: dict[str, Any] = {
-            "network": p.network_name,
-            "username": p.username,
-            "url": clean_url,
-            "bio": _truncate_str(p.bio or meta.get("bio"), 420),
-            "location": _truncate_str(meta.get("location") or meta.get("location_claim"), 140),
-            "signals": {
-                "display_name": _truncate_str(meta.get("name") or meta.get("display_name"), 160),
-                "company": _truncate_str(meta.get("company"), 160),
-                "blog": _truncate_str(meta.get("blog") or meta.get("website"), 220),
-                "created_at": _truncate_str(meta.get("created_at") or meta.get("created_utc"), 64),
-                "followers": meta.get("followers"),
-                "following": meta.get("following"),
-                "public_repos": meta.get("public_repos") or meta.get("repos"),
-                "languages": (
-                    _limit_list(meta.get("languages") or meta.get("tech_stack"), 25)
-                    or _truncate_str(meta.get("languages") or meta.get("tech_stack"), 220)
-                ),
-            },
-            # Evidencia opcional (puede no existir según el scraper)
-            "activity_timestamps": _limit_list(meta.get("commits") or meta.get("timestamps"), 60),
-            "text_samples": _compact_text_samples(meta.get("comments") or meta.get("texts"), max_items=16, max_chars_each=320),
-        }
-
-        if (p.network_name or "").lower() == "hibp":
-            hibp = _extract_hibp_breaches(meta)
-            if hibp:
-                profile_dict["hibp_breaches"] = hibp
-
-        # Eliminar claves vacías
-        profile_dict = {k: v for k, v in profile_dict.items() if v}
-        profiles_data.append(profile_dict)
+    # Preparación de evidencia normalizada (best-effort), en una sola pasada:
+    # cada perfil se lee una vez y alimenta todos los contenedores del payload.
+    candidates: list[dict[str, Any]] = []
+    networks_seen: set[str] = set()
+    confirmed_urls: list[str] = []
+    handles: set[str] = set()
+    emails: set[str] = set()
+    handle_counts: Counter[str] = Counter()
+    breach_summary: list[dict[str, Any]] = []
+    for p in clean_profiles:
+        net = (p.network_name or "").lower()
+        meta = _profile_meta(p)
 
-    # Cap para evitar prompts gigantes cuando un scraper trae demasiado contenido.
-    if len(profiles_data) > 30:
-        profiles_data = profiles_data[:30]
+        # Normaliza URL (evita querystrings ruidosas). Una sola conversión a str por perfil;
+        # `partition` corta en el primer '?' sin construir la lista que crea `split`.
+        url_str = str(p.url or "")
+        clean_url = url_str.partition("?")[0]
 
-    confirmed_networks = sorted({(p.network_name or "").lower() for p in clean_person.profiles if p.network_name})
-    confirmed_urls = [str(p.url).split("?")[0] for p in clean_person.profiles if getattr(p, "url", None)]
-    # Cap to avoid giant payloads when Sherlock is enabled.
-    if len(confirmed_urls) > 60:
-        confirmed_urls = confirmed_urls[:60]
+        if net:
+            networks_seen.add(net)
+        # Cap to avoid giant payloads when Sherlock is enabled.
+        if clean_url and len(confirmed_urls) < 60:
+            confirmed_urls.append(clean_url)
 
-    handles: list[str] = []
-    emails: list[str] = []
-    for p in clean_person.profiles:
         u = (p.username or "").strip()
-        if not u:
-            continue
-        if "@" in u:
-            emails.append(u.lower())
-        else:
-            handles.append(u)
-
-    handle_counts: dict[str, int] = {}
-    for h in handles:
-        key = h.lower()
-        handle_counts[key] = handle_counts.get(key, 0) + 1
-    reused_handles = sorted([h for h, c in handle_counts.items() if c >= 2])
+        if u:
+            if "@" in u:
+                emails.add(u.lower())
+            else:
+                handles.add(u)
+                handle_counts[u.lower()] += 1
 
-    breach_summary: list[dict[str, Any]] = []
-    for p in clean_person.profiles:
-        if (p.network_name or "").lower() != "hibp":
-            continue
-        md = p.metadata if isinstance(p.metadata, dict) else {}
-        hibp = _extract_hibp_breaches(md)
+        hibp = _extract_hibp_breaches(meta) if net == "hibp" else None
         if hibp:
             breach_summary.append({"email": p.username, "count": hibp.get("count"), "top": hibp.get("top")})
+
+        candidates.append(_profile_evidence(p, meta=meta, clean_url=clean_url, hibp=hibp))
+
+    # Cap por presupuesto de tokens (no por número de perfiles) para evitar prompts
+    # gigantes: primero los perfiles con texto/timestamps, que son los más informativos.
+    candidates.sort(key=lambda d: not (d.get("text_samples") or d.get("activity_timestamps")))
+    budget = _prompt_budget_tokens(configured_model)
+    used_tokens = 0
+    profiles_data: list[dict[str, Any]] = []
+    for profile_dict in candidates:
+        cost = _approx_tokens(_json_dumps(profile_dict))
+        if used_tokens + cost > budget:
+            continue
+        used_tokens += cost
+        profiles_data.append(profile_dict)
+
+    confirmed_networks = sorted(networks_seen)
+
+    reused_handles = sorted(h for h, c in handle_counts.items() if c >= 2)
+
     has_text = any(bool(p.get("text_samples")) for p in profiles_data)
     has_timestamps = any(bool(p.get("activity_timestamps")) for p in profiles_data)
 
     user_payload = {
-        "target_query": clean_person.target,
+        "target_query": person.target,
         "evidence_count": len(profiles_data),
         "confirmed_networks": confirmed_networks,
         "confirmed_urls": confirmed_urls[:60],
         "signals": {
             "has_text_samples": has_text,
             "has_activity_timestamps": has_timestamps,
-            "emails": sorted(set(emails))[:20],
-            "handles": sorted(set(handles))[:40],
+            "emails": sorted(emails)[:20],
+            "handles": sorted(handles)[:40],
             "reused_handles": reused_handles[:20],
             "breach_summary": breach_summary[:10],
         },
         "profiles": profiles_data,
         "output_language": language.value,
     }
+    if len(profiles_data) < len(candidates):
+        # Aviso al modelo: la evidencia se recortó por presupuesto, no es que no exista.
+        user_payload["profiles_omitted"] = len(candidates) - len(profiles_data)
 
+    # El system prompt es estático por idioma/modelo y va SIEMPRE primero: los proveedores
+    # (OpenAI/DeepSeek) cachean prefijos idénticos. Los turnos de corrección se añaden al final.
     request_messages = [
         {"role": "system", "content": system_prompt},
-        {"role": "user", "content": json.dumps(user_payload, ensure_ascii=False)},
+        {"role": "user", "content": _json_dumps(user_payload)},
     ]
 
+    # Misma evidencia + mismo prompt + mismo modelo => mismo reporte: evitamos la llamada remota.
+    cache_dir = _ai_cache_dir()
+    cache_key = _ai_cache_key(
+        system_prompt=system_prompt,
+        user_payload=user_payload,
+        model=configured_model,
+        language=language,
+    )
+    if settings.ai_cache_enabled:
+        cached = _load_cached_report(cache_dir=cache_dir, key=cache_key, ttl_seconds=settings.ai_cache_ttl_seconds)
+        if cached is not None:
+            return cached
+
     last_error: Exception | None = None
     fallback_model: str | None = None
     base_url_l = (settings.ai_base_url or "").lower()
     if "api.groq.com" in base_url_l:
         # Modelo ampliamente disponible en Groq (fallback seguro).
         fallback_model = "llama-3.1-8b-instant"
+    # JSON mode: el proveedor garantiza un objeto JSON; _extract_json_object queda como red de seguridad.
+    json_mode = _supports_json_mode(base_url=settings.ai_base_url, model=configured_model)
+    # Uso de tokens en el stream (chunk final sin choices); solo donde se acepta.
+    stream_usage = _supports_stream_usage(base_url=settings.ai_base_url)
+    # Tras una respuesta-template, la corrección se envía "hedged": si tarda bastante más
+    # que la llamada anterior, se lanza un duplicado y gana la primera respuesta.
+    hedge_delay: float | None = None
+    # Throttling proactivo (RPM/TPM): esperamos antes de enviar en lugar de gastar un
+    # RTT en un 429. El backoff ante 429 sigue como red de seguridad.
+    throttle = _get_throttle(base_url=settings.ai_base_url, rpm=settings.ai_rpm, tpm=settings.ai_tpm)
     # Reintentos: el proveedor puede devolver timeouts o JSON malformado.
     for attempt in range(max(1, settings.ai_max_retries + 1)):
         try:
             used_model = configured_model
-            response = await client.chat.completions.create(
-                model=used_model,
-                messages=request_messages,  # type: ignore[arg-type]
-                temperature=0.2,
-                max_tokens=_max_tokens_for_model(used_model),
-            )
-
-            content = (response.choices[0].message.content or "").strip()
-            json_text = _extract_json_object(content)
-            data: Any = json.loads(json_text)
-            parsed = _AIReportPayload.model_validate(data)
+            extra: dict[str, Any] = {"response_format": {"type": "json_object"}} if json_mode else {}
+            if stream_usage:
+                extra["stream_options"] = {"include_usage": True}
+            request_kwargs: dict[str, Any] = {
+                "model": used_model,
+                "messages": request_messages,
+                "temperature": 0.2,
+                "max_tokens": _max_tokens_for_request(used_model, used_tokens),
+                # Streaming: el texto llega mientras el modelo genera y podemos abortar templates.
+                "stream": True,
+                **extra,
+            }
+            # Los proveedores cuentan entrada + max_tokens contra el TPM.
+            request_cost = sum(_approx_tokens(m["content"]) for m in request_messages) + request_kwargs["max_tokens"]
+            if throttle is not None:
+                await throttle.acquire(request_cost)
+            delay, hedge_delay = hedge_delay, None
+            started = time.monotonic()
+            if delay is not None:
+                # El duplicado también es una request: se cobra al mismo cubo.
+                before_hedge = partial(throttle.acquire, request_cost) if throttle is not None else None
+                content, stream_meta, template_hit = await _hedged_completion(
+                    client, hedge_delay=delay, before_hedge=before_hedge, **request_kwargs
+                )
+            else:
+                content, stream_meta, template_hit = await _complete_stream(client, **request_kwargs)
+            elapsed = time.monotonic() - started
 
-            missing_sections = not _summary_has_six_sections(summary=parsed.summary, language=language)
-            if _looks_like_template_response(parsed=parsed) or missing_sections:
+            if template_hit:
+                is_template, missing_sections = True, False
+            else:
+                parsed = _parse_report_payload(content)
+                is_template = _looks_like_template_response(parsed=parsed)
+                missing_sections = not _summary_has_six_sections(summary=parsed.summary, language=language)
+            if is_template or missing_sections:
                 last_error = ValueError("ai_returned_template")
                 if attempt >= settings.ai_max_retries:
                     break
@@ -900,16 +1378,16 @@ async def analyze_person(
                             "'highlights' must be a real list grounded in the provided evidence."
                         )
                 request_messages.append({"role": "user", "content": fix})
-                await asyncio.sleep(0.5)
+                hedge_delay = max(1.0, elapsed * 1.25)
                 continue
 
-            raw: dict[str, object] = {}
-            try:
-                raw = response.model_dump()  # type: ignore
-            except Exception:
-                raw = {"raw_text": content}
+            # Solo metadatos; el texto crudo duplica summary/highlights en cada
+            # export y entrada de cache, así que se guarda únicamente bajo demanda.
+            raw: dict[str, object] = dict(stream_meta)
+            if settings.ai_keep_raw_text:
+                raw["raw_text"] = content
 
-            return AnalysisReport(
+            report = AnalysisReport(
                 summary=_sanitize_summary_markdown(parsed.summary),
                 highlights=parsed.highlights,
                 confidence=(
@@ -920,11 +1398,22 @@ async def analyze_person(
                 model=used_model,
                 raw=raw,
             )
+            if settings.ai_cache_enabled:
+                _store_cached_report(cache_dir=cache_dir, key=cache_key, report=report)
+            return report
 
         except APIStatusError as exc:
             # 400/404 por modelo no disponible (muy común en presets): intentar fallback una vez.
             last_error = exc
             status = getattr(exc, "status_code", None)
+            if json_mode and status == 400 and "response_format" in str(exc).lower():
+                # El modelo/proveedor rechaza JSON mode: repetir sin el flag.
+                json_mode = False
+                continue
+            if stream_usage and status == 400 and "stream_options" in str(exc).lower():
+                # Compatible "a medias": repetir sin pedir el uso en el stream.
+                stream_usage = False
+                continue
             if (
                 fallback_model
                 and configured_model != fallback_model
@@ -932,21 +1421,21 @@ async def analyze_person(
                 and _looks_like_model_rejection(exc)
             ):
                 configured_model = fallback_model
+                json_mode = _supports_json_mode(base_url=settings.ai_base_url, model=configured_model)
                 # Si cambiamos a un modelo pequeño, también compactamos el prompt.
-                request_messages[0]["content"] = (
-                    _build_system_prompt_compact(language)
-                    if _should_use_compact_prompt(base_url=settings.ai_base_url, model=configured_model)
-                    else _build_system_prompt(language)
+                # Lista nueva en vez de mutar el dict del system: el prefijo original
+                # no se altera y el proveedor puede seguir cacheándolo.
+                fallback_prompt = _system_prompt(
+                    language, _should_use_compact_prompt(base_url=settings.ai_base_url, model=configured_model)
                 )
+                request_messages = [{"role": "system", "content": fallback_prompt}, *request_messages[1:]]
                 # No cuenta como 'fallo final': reintenta inmediato con el fallback.
                 continue
 
             if status == 429:
                 if attempt >= settings.ai_max_retries:
                     break
-                retry_after = _safe_retry_after_seconds(exc)
-                base = retry_after if retry_after is not None else (1.25 * (2**attempt))
-                await asyncio.sleep(base + random.uniform(0.0, 0.35))
+                await asyncio.sleep(_backoff_delay(attempt, exc, cap=settings.ai_max_backoff_seconds))
                 continue
             break
 
@@ -954,9 +1443,7 @@ async def analyze_person(
             last_error = exc
             if attempt >= settings.ai_max_retries:
                 break
-            retry_after = _safe_retry_after_seconds(exc)
-            base = retry_after if retry_after is not None else (1.25 * (2**attempt))
-            await asyncio.sleep(base + random.uniform(0.0, 0.35))
+            await asyncio.sleep(_backoff_delay(attempt, exc, cap=settings.ai_max_backoff_seconds))
 
         except (json.JSONDecodeError, ValueError) as exc:
             last_error = exc
@@ -971,7 +1458,7 @@ async def analyze_person(
             else:
                 fix = "Your response was not valid JSON. Rewrite ONLY valid JSON (no extra text, no fences)."
             request_messages.append({"role": "user", "content": fix})
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(_backoff_delay(attempt, cap=settings.ai_max_backoff_seconds))
 
         except Exception as exc:
             last_error = exc
@@ -985,7 +1472,31 @@ async def analyze_person(
     logger.warning("AI analysis fell back to heuristic. Reason: %s", error_detail)
 
     return _heuristic_analysis(
-        person=clean_person,
+        person=_confirmed_view(person, clean_profiles),
         language=language,
         reason=f"provider_failed:{type(last_error).__name__ if last_error else 'unknown'}",
     )
+
+
+async def analyze_persons(
+    persons: list[PersonEntity],
+    *,
+    language: Language,
+    settings: AppSettings | None = None,
+    concurrency: int = 4,
+) -> list[AnalysisReport]:
+    """Analiza varios objetivos reutilizando el cliente compartido.
+
+    Devuelve los reportes en el mismo orden que `persons`. Cada objetivo va en su
+    propia request (el reporte de 6 secciones no cabe N veces en un `max_tokens`),
+    pero se solapan hasta `concurrency` llamadas sobre el mismo pool de conexiones.
+    """
+
+    settings = settings or get_settings()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(person: PersonEntity) -> AnalysisReport:
+        async with semaphore:
+            return await analyze_person(person=person, language=language, settings=settings)
+
+    return list(await asyncio.gather(*(_one(p) for p in persons)))
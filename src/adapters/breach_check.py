@@ -1,21 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import threading
 import uuid
 from typing import Iterable
 
 import httpx
+from pydantic import TypeAdapter, ValidationError
 
 try:
     import tls_client  # type: ignore
 except Exception:  # pragma: no cover
     tls_client = None  # type: ignore
 
+try:
+    import h2  # type: ignore  # noqa: F401 — habilita HTTP/2 en httpx (extra opcional)
+except Exception:  # pragma: no cover
+    h2 = None  # type: ignore
+
 from core.domain.models import (
     HaveibeenpwnedBreach,
     HaveibeenpwnedProfiles,
     SocialProfile,
 )
-from core.config import AppSettings
+from core.config import AppSettings, get_settings
+from adapters.http_client import response_json
 
 
 def _build_hibp_headers() -> dict[str, str]:
@@ -42,111 +52,180 @@ def _build_hibp_headers() -> dict[str, str]:
     }
 
 
-def enrich_profiles_with_breach_data(
-    emails: Iterable[str],
-) -> list[SocialProfile]:
-    settings = AppSettings()
+# Sesión tls_client compartida por proceso: es síncrona (no depende del event loop),
+# así que se reutiliza entre llamadas y conserva conexiones/handshakes con HIBP.
+_TLS_SESSION: object | None = None
+_TLS_SESSION_LOCK = threading.Lock()
+# tls_client.Session no es thread-safe: las peticiones desde `asyncio.to_thread`
+# se serializan sobre la sesión compartida.
+_TLS_REQUEST_LOCK = threading.Lock()
 
-    tls_session = None
-    if tls_client is not None:
-        try:
-            tls_session = tls_client.Session(
-                client_identifier="chrome_120",
-                random_tls_extension_order=True,  # type: ignore[call-arg]
-            )
-        except Exception:
-            tls_session = None
+# Validación de la lista completa en una sola pasada por pydantic-core.
+_BREACH_LIST_ADAPTER = TypeAdapter(list[HaveibeenpwnedBreach])
+
+_HIBP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
 
-    httpx_client: httpx.Client | None = None
-    if tls_session is None:
-        httpx_client = httpx.Client(
-            timeout=httpx.Timeout(settings.http_timeout_seconds),
-            follow_redirects=True,
-        )
 
-    profiles: list[SocialProfile] = []
+def _close_tls_session() -> None:
+    global _TLS_SESSION
+    session, _TLS_SESSION = _TLS_SESSION, None
     try:
-        for email in emails:
-            unified_url = f"https://haveibeenpwned.com/unifiedsearch/{email}"
+        session.close()  # type: ignore[union-attr]
+    except Exception:
+        pass
 
-            status_code: int | None = None
-            payload: object | None = None
-            error: str | None = None
-            headers = _build_hibp_headers()
 
+def _get_tls_session() -> object | None:
+    global _TLS_SESSION
+    if tls_client is None:
+        return None
+    with _TLS_SESSION_LOCK:
+        if _TLS_SESSION is None:
             try:
-                if tls_session is not None:
-                    response = tls_session.get(unified_url, headers=headers)
-                    status_code = response.status_code or 0
-                    payload = response.json() if status_code == 200 else None
-                else:
-                    assert httpx_client is not None
-                    response = httpx_client.get(unified_url, headers=headers)
-                    status_code = response.status_code
-                    payload = response.json() if status_code == 200 else None
-            except OSError:
-                # Some tls_client wheels depend on musl (libc.musl-*.so.1).
-                # If the runtime loader fails, fall back to httpx instead of crashing.
-                try:
-                    if httpx_client is None:
-                        httpx_client = httpx.Client(
-                            timeout=httpx.Timeout(settings.http_timeout_seconds),
-                            follow_redirects=True,
-                        )
-                    response = httpx_client.get(unified_url, headers=headers)
-                    status_code = response.status_code
-                    payload = response.json() if status_code == 200 else None
-                except Exception:
-                    error = "hibp_request_failed_oserror"
-                    continue
-            except Exception:
-                error = "hibp_request_failed"
-                continue
-
-            if status_code != 200 or not isinstance(payload, dict):
-                profiles.append(
-                    SocialProfile(
-                        url=unified_url,
-                        username=email,
-                        network_name="hibp",
-                        exists=False,
-                        metadata={
-                            "source": "haveibeenpwned_unifiedsearch",
-                            "status_code": status_code,
-                            "error": error or (f"hibp_http_{status_code}" if status_code else "hibp_no_response"),
-                        },
-                    )
+                _TLS_SESSION = tls_client.Session(
+                    client_identifier="chrome_120",
+                    random_tls_extension_order=True,  # type: ignore[call-arg]
                 )
-                continue
-
-            raw_breaches = payload.get("Breaches", [])
-            breaches: list[HaveibeenpwnedBreach] = []
-            if isinstance(raw_breaches, list):
-                for breach_data in raw_breaches:
-                    if not isinstance(breach_data, dict):
-                        continue
-                    try:
-                        breaches.append(HaveibeenpwnedBreach(**breach_data))
-                    except Exception:
-                        continue
-
-            hibp = HaveibeenpwnedProfiles(email=email, breaches=breaches)
-            profiles.append(
-                SocialProfile(
-                    url=unified_url,
-                    username=email,
-                    network_name="hibp",
-                    exists=True,
-                    metadata={
-                        "source": "haveibeenpwned_unifiedsearch",
-                        "status_code": status_code,
-                        "breach_count": len(breaches),
-                        "breaches": hibp.model_dump(mode="json"),
-                    },
+            except Exception:
+                return None
+            atexit.register(_close_tls_session)
+        return _TLS_SESSION
+
+
+def _fetch_unified(
+    *,
+    tls_session: object | None,
+    url: str,
+    headers: dict[str, str],
+) -> tuple[int, object | None]:
+    """GET síncrono vía tls_client (se ejecuta en un hilo)."""
+
+    with _TLS_REQUEST_LOCK:
+        response = tls_session.get(url, headers=headers)  # type: ignore[union-attr]
+        status_code = response.status_code or 0
+        return status_code, (response.json() if status_code == 200 else None)
+
+
+def _parse_breaches(raw_breaches: object) -> list[HaveibeenpwnedBreach]:
+    """Parsea la lista de brechas; los elementos malformados se descartan."""
+
+    if not isinstance(raw_breaches, list):
+        return []
+    try:
+        return _BREACH_LIST_ADAPTER.validate_python(raw_breaches)
+    except ValidationError:
+        pass
+    # Camino lento solo si algún elemento no valida: conservar los válidos.
+    breaches: list[HaveibeenpwnedBreach] = []
+    for breach_data in raw_breaches:
+        if not isinstance(breach_data, dict):
+            continue
+        try:
+            breaches.append(HaveibeenpwnedBreach.model_validate(breach_data))
+        except ValidationError:
+            continue
+    return breaches
+
+
+async def _lookup_email(
+    email: str,
+    *,
+    tls_session: object | None,
+    httpx_client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+) -> SocialProfile | None:
+    unified_url = f"https://haveibeenpwned.com/unifiedsearch/{email}"
+
+    status_code: int | None = None
+    payload: object | None = None
+    error: str | None = None
+    headers = _build_hibp_headers()
+
+    async with semaphore:
+        try:
+            if tls_session is not None:
+                status_code, payload = await asyncio.to_thread(
+                    _fetch_unified, tls_session=tls_session, url=unified_url, headers=headers
                 )
+            else:
+                response = await httpx_client.get(unified_url, headers=headers)
+                status_code = response.status_code
+                payload = response_json(response) if status_code == 200 else None
+        except OSError:
+            # Some tls_client wheels depend on musl (libc.musl-*.so.1).
+            # If the runtime loader fails, fall back to httpx instead of crashing.
+            try:
+                response = await httpx_client.get(unified_url, headers=headers)
+                status_code = response.status_code
+                payload = response_json(response) if status_code == 200 else None
+            except Exception:
+                error = "hibp_request_failed_oserror"
+                return None
+        except Exception:
+            error = "hibp_request_failed"
+            return None
+
+    if status_code != 200 or not isinstance(payload, dict):
+        return SocialProfile(
+            url=unified_url,
+            username=email,
+            network_name="hibp",
+            exists=False,
+            metadata={
+                "source": "haveibeenpwned_unifiedsearch",
+                "status_code": status_code,
+                "error": error or (f"hibp_http_{status_code}" if status_code else "hibp_no_response"),
+            },
+        )
+
+    breaches = _parse_breaches(payload.get("Breaches", []))
+
+    hibp = HaveibeenpwnedProfiles(email=email, breaches=breaches)
+    return SocialProfile(
+        url=unified_url,
+        username=email,
+        network_name="hibp",
+        exists=True,
+        metadata={
+            "source": "haveibeenpwned_unifiedsearch",
+            "status_code": status_code,
+            "breach_count": len(breaches),
+            "breaches": hibp.model_dump(mode="json"),
+        },
+    )
+
+
+async def enrich_profiles_with_breach_data(
+    emails: Iterable[str],
+    *,
+    settings: AppSettings | None = None,
+) -> list[SocialProfile]:
+    """Consulta HIBP para cada email en paralelo (acotado por `hibp_concurrency`).
+
+    Los fallos son locales a cada email: uno que falle no invalida el resto.
+    El orden de salida respeta el orden de entrada.
+    """
+
+    settings = settings or get_settings()
+    emails = list(emails)
+    if not emails:
+        return []
+
+    tls_session = _get_tls_session()
+
+    semaphore = asyncio.Semaphore(settings.hibp_concurrency)
+    # unifiedsearch responde directo (200/404): sin redirects. HTTP/2 si `h2` está instalado.
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.http_timeout_seconds),
+        limits=_HIBP_LIMITS,
+        http2=h2 is not None,
+        follow_redirects=False,
+    ) as httpx_client:
+        results = await asyncio.gather(
+            *(
+                _lookup_email(email, tls_session=tls_session, httpx_client=httpx_client, semaphore=semaphore)
+                for email in emails
             )
-    finally:
-        if httpx_client is not None:
-            httpx_client.close()
+        )
 
-    return profiles
+    return [profile for profile in results if profile is not None]
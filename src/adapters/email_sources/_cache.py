@@ -0,0 +1,44 @@
+"""Cache en memoria (TTL + LRU) para lookups deterministas por email.
+
+Por qué:
+- Gravatar y similares responden lo mismo para el mismo hash durante horas;
+  repetir el GET en la misma sesión solo añade latencia y consumo de rate limit.
+- Acotado en tamaño (LRU) y en tiempo (TTL) para no crecer sin límite.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+from adapters.ttl_cache import TTLCache
+from core.domain.models import SocialProfile
+
+
+class ProfileTTLCache(TTLCache[SocialProfile]):
+    """LRU de `SocialProfile` con expiración por entrada.
+
+    Devuelve copias profundas: los llamadores pueden mutar el perfil sin
+    contaminar el cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 10_000,
+        ttl_seconds: float = 86_400.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(
+            maxsize=maxsize,
+            ttl_seconds=ttl_seconds,
+            clock=clock,
+            copy_value=lambda profile: profile.model_copy(deep=True),
+        )
+
+
+# Compartido por los scanners de Gravatar; clave: (network_name, sha256 del email).
+GRAVATAR_CACHE = ProfileTTLCache()
+
+# Solo respuestas definitivas: un 429/5xx no dice nada sobre el email.
+CACHEABLE_STATUS = frozenset({200, 404})
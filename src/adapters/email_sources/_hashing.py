@@ -0,0 +1,32 @@
+"""Identidad del email compartida por los scanners de Gravatar.
+
+`GravatarScanner` y `GravatarProfileScanner` corren sobre el mismo email en la
+misma ronda: memoizamos normalización + SHA256 para calcularlo una sola vez y
+construimos la metadata base en un único sitio.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from typing import Any
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+@lru_cache(maxsize=4096)
+def email_sha256(email: str) -> str:
+    """SHA256 (hex) del email normalizado, como lo espera Gravatar."""
+
+    return hashlib.sha256(normalize_email(email).encode("utf-8")).hexdigest()
+
+
+_BASE_KEYS = ("status_code", "final_url", "email_sha256", "normalized_email")
+
+
+def email_metadata(*, status_code: int, final_url: str, email_sha256: str, email: str) -> dict[str, Any]:
+    """Metadata base común a los scanners de Gravatar."""
+
+    return dict(zip(_BASE_KEYS, (status_code, final_url, email_sha256, email)))
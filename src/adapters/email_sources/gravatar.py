@@ -2,8 +2,8 @@
 
 Implementación:
 - Normaliza el email (strip + lower).
-- Calcula MD5 del email normalizado.
-- Consulta el avatar con `d=404` para determinar existencia.
+- Calcula SHA256 del email normalizado (MD5 está deprecado en Gravatar).
+- Consulta el avatar con `d=404` vía HEAD para determinar existencia (sin bajar la imagen).
 
 Notas:
 - 200 => existe gravatar
@@ -12,49 +12,53 @@ Notas:
 
 from __future__ import annotations
 
-import hashlib
-from typing import Any
-
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.email_sources._cache import CACHEABLE_STATUS, GRAVATAR_CACHE
+from adapters.email_sources._hashing import email_metadata, email_sha256 as _email_sha256, normalize_email
+from adapters.http_client import get_shared_client, head_or_get
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
 
-def _normalize_email(email: str) -> str:
-    return email.strip().lower()
-
-
 class GravatarScanner(OSINTScanner):
     _base_url = "https://www.gravatar.com"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
-    async def scan(self, username: str) -> SocialProfile:
-        email = _normalize_email(username)
-        # Hash público (Gravatar requiere MD5 del email normalizado).
-        email_md5 = hashlib.md5(email.encode("utf-8")).hexdigest()  # nosec - hash público
+    async def scan(self, username: str, *, bypass_cache: bool = False) -> SocialProfile:
+        email = normalize_email(username)
+        # Hash público del email normalizado (Gravatar acepta SHA256); memoizado.
+        email_sha256 = _email_sha256(email)
+        cache_key = ("gravatar", email_sha256)
+        if not bypass_cache:
+            cached = GRAVATAR_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
 
         # `d=404` hace que el recurso devuelva 404 si no existe.
-        avatar_url = f"{self._base_url}/avatar/{email_md5}?s=200&d=404"
+        avatar_url = f"{self._base_url}/avatar/{email_sha256}?s=200&d=404"
 
-        async with build_async_client(self._settings) as client:
-            response = await client.get(avatar_url)
+        client = get_shared_client(self._settings)
+        # HEAD: solo interesa el status; la imagen no se descarga y la conexión
+        # vuelve al pool (un GET en stream sin leer obligaría a cerrarla).
+        response = await head_or_get(client, avatar_url)
+        final_url = str(response.url)
+        status_code = response.status_code
 
-        exists = response.status_code == 200
-        metadata: dict[str, Any] = {
-            "status_code": response.status_code,
-            "final_url": str(response.url),
-            "email_md5": email_md5,
-            "normalized_email": email,
-        }
+        exists = status_code == 200
+        metadata = email_metadata(
+            status_code=status_code, final_url=final_url, email_sha256=email_sha256, email=email
+        )
 
-        return SocialProfile(
-            url=str(response.url),
+        profile = SocialProfile(
+            url=final_url,
             username=email,
             network_name="gravatar",
             exists=exists,
             metadata=metadata,
-            image_url=str(response.url) if exists else None,
+            image_url=final_url if exists else None,
         )
+        if status_code in CACHEABLE_STATUS:
+            GRAVATAR_CACHE.set(cache_key, profile)
+        return profile
@@ -1,82 +1,106 @@
-"""Scanner OSINT: Gravatar profile JSON (email).
+"""Scanner OSINT: Gravatar profile (email), API REST v3.
 
-Consulta `https://en.gravatar.com/<md5>.json`.
-- 200 => hay perfil público en Gravatar (puede incluir displayName, aboutMe, urls, etc.)
+Consulta `https://api.gravatar.com/v3/profiles/<sha256>`.
+- 200 => hay perfil público en Gravatar (display_name, description, cuentas verificadas, etc.)
 - 404 => no hay perfil público
+
+Con `gravatar_api_key` configurada se envía `Authorization: Bearer` (límite de rate mayor).
 """
 
 from __future__ import annotations
 
-import hashlib
-import json
-from typing import Any
+from pydantic import BaseModel, ConfigDict, ValidationError
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.email_sources._cache import CACHEABLE_STATUS, GRAVATAR_CACHE
+from adapters.email_sources._hashing import email_metadata, email_sha256, normalize_email
+from adapters.http_client import get_shared_client
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
 
-def _normalize_email(email: str) -> str:
-    return email.strip().lower()
+class _V3Link(BaseModel):
+    model_config = ConfigDict(extra="ignore")
 
+    url: str | None = None
+    label: str | None = None
+    service_label: str | None = None
 
-def _email_md5(email: str) -> str:
-    return hashlib.md5(email.encode("utf-8")).hexdigest()  # nosec - hash público requerido por Gravatar
 
+class _V3Profile(BaseModel):
+    """Subconjunto tipado del esquema `GET /v3/profiles/{sha256}`."""
 
-class GravatarProfileScanner(OSINTScanner):
-    _base_url = "https://en.gravatar.com"
+    model_config = ConfigDict(extra="ignore")
+
+    display_name: str | None = None
+    description: str | None = None
+    avatar_url: str | None = None
+    profile_url: str | None = None
+    location: str | None = None
+    verified_accounts: list[_V3Link] = []
+    links: list[_V3Link] = []
 
-    def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
 
-    async def scan(self, username: str) -> SocialProfile:
-        email = _normalize_email(username)
-        h = _email_md5(email)
+def _profile_links(profile: _V3Profile) -> list[dict[str, str]]:
+    """Cuentas verificadas + links del perfil, con la forma `{title, value}` de la API v2."""
 
-        url = f"{self._base_url}/{h}.json"
+    out = [{"title": acc.service_label or "", "value": acc.url} for acc in profile.verified_accounts if acc.url]
+    out.extend({"title": link.label or "", "value": link.url} for link in profile.links if link.url)
+    return out
 
-        async with build_async_client(self._settings) as client:
-            response = await client.get(url)
 
-        exists = response.status_code == 200
-        metadata: dict[str, Any] = {
-            "status_code": response.status_code,
-            "final_url": str(response.url),
-            "email_md5": h,
-            "normalized_email": email,
-        }
+class GravatarProfileScanner(OSINTScanner):
+    _base_url = "https://api.gravatar.com/v3/profiles"
+
+    def __init__(self, settings: AppSettings | None = None) -> None:
+        self._settings = settings or get_settings()
+
+    async def scan(self, username: str, *, bypass_cache: bool = False) -> SocialProfile:
+        email = normalize_email(username)
+        h = email_sha256(email)
+        cache_key = ("gravatar_profile", h)
+        if not bypass_cache:
+            cached = GRAVATAR_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+        url = f"{self._base_url}/{h}"
+        headers: dict[str, str] = {"Accept": "application/json"}
+        if self._settings.gravatar_api_key:
+            headers["Authorization"] = f"Bearer {self._settings.gravatar_api_key.get_secret_value()}"
+
+        client = get_shared_client(self._settings)
+        response = await client.get(url, headers=headers)
+        final_url = str(response.url)
+        status_code = response.status_code
+
+        exists = status_code == 200
+        metadata = email_metadata(status_code=status_code, final_url=final_url, email_sha256=h, email=email)
 
         bio: str | None = None
         image_url: str | None = None
 
         if exists:
             try:
-                payload = json.loads(response.text)
-                entry = None
-                if isinstance(payload, dict):
-                    arr = payload.get("entry")
-                    if isinstance(arr, list) and arr:
-                        entry = arr[0]
-                if isinstance(entry, dict):
-                    bio = entry.get("aboutMe") if isinstance(entry.get("aboutMe"), str) else None
-                    thumb = entry.get("thumbnailUrl")
-                    image_url = thumb if isinstance(thumb, str) else None
-                    display = entry.get("displayName")
-                    if isinstance(display, str):
-                        metadata["display_name"] = display
-                    preferred = entry.get("preferredUsername")
-                    if isinstance(preferred, str):
-                        metadata["preferred_username"] = preferred
-                    urls = entry.get("urls")
-                    if isinstance(urls, list):
-                        metadata["urls"] = urls
-            except Exception as exc:
+                # Parseo + validación en un paso (pydantic-core), directo desde los bytes.
+                payload = _V3Profile.model_validate_json(response.content)
+            except ValidationError as exc:
                 metadata["parse_error"] = str(exc)
-
-        return SocialProfile(
-            url=str(response.url),
+            else:
+                bio = payload.description or None
+                image_url = payload.avatar_url
+                if payload.display_name:
+                    metadata["display_name"] = payload.display_name
+                if payload.profile_url is not None:
+                    metadata["profile_url"] = payload.profile_url
+                if payload.location:
+                    metadata["location"] = payload.location
+                urls = _profile_links(payload)
+                if urls:
+                    metadata["urls"] = urls
+
+        profile = SocialProfile(
+            url=final_url,
             username=email,
             network_name="gravatar_profile",
             exists=exists,
@@ -84,3 +108,6 @@ class GravatarProfileScanner(OSINTScanner):
             bio=bio,
             image_url=image_url,
         )
+        if status_code in CACHEABLE_STATUS and "parse_error" not in metadata:
+            GRAVATAR_CACHE.set(cache_key, profile)
+        return profile
@@ -9,41 +9,47 @@ Usamos heurística de contenido para marcar existencia.
 
 from __future__ import annotations
 
+import re
 from typing import Any
 from urllib.parse import quote
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.http_client import get_shared_client
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
 
+# Heurística: si no hay claves, suele aparecer alguno de estos mensajes.
+# Una sola alternancia precompilada = una pasada sobre el HTML (en C) para todos.
+# Marcadores ASCII: se buscan en los bytes crudos, sin detectar charset ni decodificar.
+_NOT_FOUND_RE = re.compile(rb"No results|No keys found|No matching keys")
+
+
 class OpenPGPKeysScanner(OSINTScanner):
     _base_url = "https://keys.openpgp.org"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile:
         email = username.strip().lower()
         url = f"{self._base_url}/search?q={quote(email)}"
 
-        async with build_async_client(self._settings) as client:
-            response = await client.get(url)
+        client = get_shared_client(self._settings)
+        response = await client.get(url)
+        final_url = str(response.url)
+        status_code = response.status_code
 
-        text = response.text or ""
-        # Heurística: si no hay claves, suele aparecer un mensaje de "No results".
-        not_found_markers = ["No results", "No keys found", "No matching keys"]
-        found = response.status_code == 200 and not any(m in text for m in not_found_markers)
+        found = status_code == 200 and _NOT_FOUND_RE.search(response.content) is None
 
         metadata: dict[str, Any] = {
-            "status_code": response.status_code,
-            "final_url": str(response.url),
+            "status_code": status_code,
+            "final_url": final_url,
             "heuristic": "content",
         }
 
         return SocialProfile(
-            url=str(response.url),
+            url=final_url,
             username=email,
             network_name="openpgp_keys",
             exists=found,
@@ -11,8 +11,8 @@ from __future__ import annotations
 from typing import Any
 from urllib.parse import quote
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.http_client import get_shared_client
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
@@ -21,27 +21,29 @@ class UbuntuKeyserverScanner(OSINTScanner):
     _base_url = "https://keyserver.ubuntu.com"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile:
         email = username.strip().lower()
         url = f"{self._base_url}/pks/lookup?op=index&search={quote(email)}"
 
-        async with build_async_client(self._settings) as client:
-            response = await client.get(url)
+        client = get_shared_client(self._settings)
+        response = await client.get(url)
+        final_url = str(response.url)
+        status_code = response.status_code
 
-        text = response.text or ""
         # Heurística: cuando no hay resultados suele aparecer "No results".
-        found = response.status_code == 200 and "No results" not in text
+        # Marcador ASCII: búsqueda directa en los bytes, sin decodificar el cuerpo.
+        found = status_code == 200 and b"No results" not in response.content
 
         metadata: dict[str, Any] = {
-            "status_code": response.status_code,
-            "final_url": str(response.url),
+            "status_code": status_code,
+            "final_url": final_url,
             "heuristic": "content",
         }
 
         return SocialProfile(
-            url=str(response.url),
+            url=final_url,
             username=email,
             network_name="ubuntu_keyserver",
             exists=found,
@@ -8,17 +8,28 @@ Por qué un wrapper:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Any
 from urllib.parse import urljoin
 
 import httpx
 
-from core.config import AppSettings
+from core.config import AppSettings, get_settings
 
 try:
-    from bs4 import BeautifulSoup
+    import h2  # type: ignore  # noqa: F401 — habilita HTTP/2 en httpx (extra opcional)
 except Exception:  # pragma: no cover
-    BeautifulSoup = None  # type: ignore
+    h2 = None  # type: ignore
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 # ---------------------------------------------------------------------------
@@ -79,10 +90,17 @@ def _build_proxy_url(
 # Async HTTP Client Builder
 # ---------------------------------------------------------------------------
 
+# Mismos topes que el default de httpx (100/20): `httpx.Limits()` a secas los quita.
+_DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
 def build_async_client(
     settings: AppSettings | None = None,
     *,
     extra_headers: dict[str, str] | None = None,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
+    cookies: CookieJar | None = None,
 ) -> httpx.AsyncClient:
     """Crea un ``httpx.AsyncClient`` con defaults seguros.
 
@@ -95,7 +113,7 @@ def build_async_client(
     messages, debug logs, or tracebacks.
     """
 
-    settings = settings or AppSettings()
+    settings = settings or get_settings()
     headers: dict[str, str] = {
         "User-Agent": settings.user_agent,
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -114,14 +132,292 @@ def build_async_client(
         follow_redirects=True,
         headers=headers,
         proxy=proxy,
+        limits=limits or _DEFAULT_LIMITS,
+        cookies=cookies,
+        # HTTP/2 requiere el paquete `h2`; sin él httpx lanzaría ImportError.
+        http2=http2 and h2 is not None,
     )
 
 
+# ---------------------------------------------------------------------------
+# Shared (pooled) client
+# ---------------------------------------------------------------------------
+
+# keepalive_expiry > default (5 s): entre perfil/actividad de un handle y el siguiente
+# (o tras un backoff por 429) la conexión a api.github.com / reddit.com sigue caliente.
+_SHARED_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0)
+
+# Un cliente por (event loop, configuración efectiva). httpx.AsyncClient queda atado
+# al loop en el que abre conexiones y la CLI hace un asyncio.run por comando.
+_SHARED_CLIENTS: dict[tuple[int, str], tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def _shared_client_fingerprint(settings: AppSettings) -> str:
+    proxy_base, proxy_auth = _build_proxy_url(settings)
+    digest = hashlib.sha256()
+    # Las credenciales del proxy solo entran hasheadas en la clave.
+    for part in (settings.user_agent, str(settings.http_timeout_seconds), proxy_base or "", *(proxy_auth or ())):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _no_cookies_jar() -> CookieJar:
+    # El cliente compartido vive todo el comando: sin jar persistente, las cookies
+    # que fija un sitio (Instagram, Reddit, ...) no viajan al siguiente scanner ni
+    # al siguiente objetivo. `allowed_domains=[]` rechaza cualquier Set-Cookie.
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def get_shared_client(settings: AppSettings | None = None) -> httpx.AsyncClient:
+    """Devuelve un ``httpx.AsyncClient`` compartido para peticiones sueltas.
+
+    Por qué: los scanners hacen un único GET; con un cliente nuevo por llamada se
+    paga TCP+TLS cada vez. El cliente compartido mantiene keep-alive, pool y HTTP/2
+    (si ``h2`` está disponible) entre scanners. No se cierra con ``async with``: usar :func:`close_shared_clients`.
+    Headers por petición: pasarlos en ``client.get(url, headers=...)``.
+    """
+
+    settings = settings or get_settings()
+    loop = asyncio.get_running_loop()
+    key = (id(loop), _shared_client_fingerprint(settings))
+    cached = _SHARED_CLIENTS.get(key)
+    if cached is not None and cached[0] is loop and not cached[1].is_closed:
+        return cached[1]
+
+    for stale_key, (stale_loop, _) in list(_SHARED_CLIENTS.items()):
+        if stale_loop.is_closed():
+            _SHARED_CLIENTS.pop(stale_key, None)
+
+    # HTTP/2 (si `h2` está instalado): varios scanners contra el mismo host
+    # (gravatar, keyservers) multiplexan sobre una sola conexión TLS.
+    client = build_async_client(settings, limits=_SHARED_LIMITS, http2=True, cookies=_no_cookies_jar())
+    _SHARED_CLIENTS[key] = (loop, client)
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Cierra los clientes compartidos asociados al event loop actual."""
+
+    loop = asyncio.get_running_loop()
+    for key, (owner, client) in list(_SHARED_CLIENTS.items()):
+        if owner is loop:
+            _SHARED_CLIENTS.pop(key, None)
+            await client.aclose()
+
+
+# Status con los que un servidor indica que no soporta (o bloquea) HEAD.
+HEAD_FALLBACK_STATUS = frozenset({403, 405, 501})
+
+
+async def head_or_get(client: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+    """Comprueba existencia con HEAD (sin cuerpo); repite con GET si HEAD no se acepta."""
+
+    response = await client.head(url, **kwargs)
+    if response.status_code in HEAD_FALLBACK_STATUS:
+        response = await client.get(url, **kwargs)
+    return response
+
+
+def response_json(response: httpx.Response) -> Any:
+    """`response.json()` decodificado con orjson si está disponible.
+
+    Las APIs JSON (GitHub, Reddit, HIBP) responden en UTF-8: orjson parsea los
+    bytes directamente, sin la detección de encoding ni el `str` intermedio de httpx.
+    Lanza `ValueError` ante JSON inválido, igual que `response.json()`.
+    """
+
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 # ---------------------------------------------------------------------------
 # HTML Metadata Extraction
 # ---------------------------------------------------------------------------
 
-def extract_html_metadata(*, html: str, base_url: str | None = None) -> dict[str, Any]:
+@lru_cache(maxsize=None)
+def _get_beautifulsoup() -> Any | None:
+    # Import perezoso (bs4 tarda decenas de ms): solo se paga al extraer metadata.
+    try:
+        from bs4 import BeautifulSoup
+    except Exception:  # pragma: no cover
+        return None
+    return BeautifulSoup
+
+
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+
+# Compilados una vez al importar (antes se reconstruía el dict en cada llamada).
+_SOCIAL_PATTERNS: dict[str, re.Pattern[str]] = {
+    "github": re.compile(r"github\.com/([a-zA-Z0-9_\-]+)"),
+    "gitlab": re.compile(r"gitlab\.com/([a-zA-Z0-9_\-]+)"),
+    "twitter": re.compile(r"(?:twitter|x)\.com/([a-zA-Z0-9_]+)"),
+    "linkedin": re.compile(r"linkedin\.com/in/([a-zA-Z0-9_\-]+)"),
+    "instagram": re.compile(r"instagram\.com/([a-zA-Z0-9_.]+)"),
+    "youtube": re.compile(r"youtube\.com/(?:@|channel/|c/)([a-zA-Z0-9_\-]+)"),
+    "tiktok": re.compile(r"tiktok\.com/@([a-zA-Z0-9_.]+)"),
+    "facebook": re.compile(r"facebook\.com/([a-zA-Z0-9_.]+)"),
+    "medium": re.compile(r"medium\.com/@([a-zA-Z0-9_.\-]+)"),
+    "dev.to": re.compile(r"dev\.to/([a-zA-Z0-9_]+)"),
+    "behance": re.compile(r"behance\.net/([a-zA-Z0-9_\-]+)"),
+    "dribbble": re.compile(r"dribbble\.com/([a-zA-Z0-9_\-]+)"),
+    "soundcloud": re.compile(r"soundcloud\.com/([a-zA-Z0-9_\-]+)"),
+    "twitch": re.compile(r"twitch\.tv/([a-zA-Z0-9_]+)"),
+    "telegram": re.compile(r"t\.me/([a-zA-Z0-9_]+)"),
+    "reddit": re.compile(r"reddit\.com/(?:u|user)/([a-zA-Z0-9_\-]+)"),
+    "keybase": re.compile(r"keybase\.io/([a-zA-Z0-9_]+)"),
+    "mastodon": re.compile(r"(@[a-zA-Z0-9_]+@[a-zA-Z0-9.\-]+)"),
+}
+
+
+def _resolve_url(base_url: str | httpx.URL, value: str) -> str:
+    if value.startswith(("http://", "https://")):
+        return value  # ya absoluta: nada que resolver
+    if isinstance(base_url, httpx.URL):
+        # URL ya parseada por httpx (p. ej. `response.url`): sin volver a parsear la base.
+        try:
+            return str(base_url.join(value))
+        except httpx.InvalidURL:
+            return value
+    return urljoin(base_url, value)
+
+
+class HeadMetadataParser(HTMLParser):
+    """Parser incremental (stdlib) de `<head>`: title, meta description y og:image.
+
+    Se alimenta por trozos con `feed()`; `done` pasa a True al cerrar `</head>`
+    (o al abrir `<body>`) para que el llamador deje de leer la respuesta.
+
+    Con `collect_body=True` también recorre lo que se le dé del body (el llamador
+    acota cuánto lee) y `metadata()` añade `emails`, `social_links` y
+    `external_links` con las mismas reglas que `extract_html_metadata`: emails del
+    texto visible (sin `<script>`/`<style>`) y de `mailto:`, enlaces de `<a href>`
+    y del HTML crudo.
+    """
+
+    def __init__(self, *, collect_body: bool = False) -> None:
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self._collect_body = collect_body
+        self._raw_parts: list[str] = []
+        self._text_parts: list[str] = []
+        self._hrefs: list[str] = []
+        self._in_script = False
+        self._in_title = False
+        self._title_parts: list[str] = []
+        self._meta_description: str | None = None
+        self._og_image: str | None = None
+
+    def feed(self, data: str) -> None:
+        if self._collect_body:
+            self._raw_parts.append(data)
+        super().feed(data)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._collect_body:
+            # Separador solo entre nodos: un texto partido entre dos `feed()` llega
+            # en varios `handle_data` y debe volver a unirse sin espacios.
+            self._text_parts.append(" ")
+            if tag in ("script", "style"):
+                self._in_script = True
+            elif tag == "a":
+                href = dict(attrs).get("href")
+                if href is not None:
+                    self._hrefs.append(href)
+        if self.done:
+            return
+        if tag == "body":
+            self.done = True
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "meta":
+            attr = dict(attrs)
+            content = (attr.get("content") or "").strip()
+            if not content:
+                return
+            if (attr.get("name") or "").lower() == "description" and self._meta_description is None:
+                self._meta_description = content
+            elif (attr.get("property") or "").lower() == "og:image" and self._og_image is None:
+                self._og_image = content
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._collect_body:
+            self._text_parts.append(" ")
+        if tag in ("script", "style"):
+            self._in_script = False
+        elif tag == "title":
+            self._in_title = False
+        elif tag == "head":
+            self.done = True
+
+    def handle_data(self, data: str) -> None:
+        if self._collect_body and not self._in_script:
+            self._text_parts.append(data)
+        if self._in_title and not self.done:
+            self._title_parts.append(data)
+
+    def metadata(self, *, base_url: str | httpx.URL | None = None) -> dict[str, Any]:
+        """Mismas keys que `extract_html_metadata` (las del body solo con `collect_body`)."""
+
+        out: dict[str, Any] = {}
+        title = "".join(self._title_parts).strip()
+        if title:
+            out["title"] = title
+        if self._meta_description:
+            out["meta_description"] = self._meta_description
+        if self._og_image:
+            out["og_image"] = _resolve_url(base_url, self._og_image) if base_url else self._og_image
+        if self._collect_body:
+            out.update(
+                _body_link_metadata(
+                    page_text="".join(self._text_parts),
+                    hrefs=self._hrefs,
+                    html="".join(self._raw_parts),
+                )
+            )
+        return out
+
+
+def _body_link_metadata(*, page_text: str, hrefs: list[str], html: str) -> dict[str, Any]:
+    """emails / social_links / external_links a partir de texto, hrefs y HTML crudo."""
+
+    mailtos = [href.replace("mailto:", "") for href in hrefs if href.startswith("mailto:")]
+    emails_found = sorted(set(_EMAIL_RE.findall(" ".join([page_text, *mailtos]))))
+
+    social_links: list[dict[str, str]] = []
+    seen_socials: set[tuple[str, str]] = set()
+    for network, pattern in _SOCIAL_PATTERNS.items():
+        for source in [*hrefs, html]:
+            for match in pattern.finditer(source):
+                username = match.group(1)
+                if (network, username.lower()) in seen_socials:
+                    continue
+                seen_socials.add((network, username.lower()))
+                # Reconstruct URL from match.
+                url_match = match.group(0)
+                if not url_match.startswith("http"):
+                    url_match = f"https://{url_match}"
+                social_links.append({
+                    "network": network,
+                    "url": url_match,
+                    "username": username,
+                })
+
+    # Up to 20 external links.
+    external_links = [href for href in hrefs if href.startswith("http")][:20]
+
+    out: dict[str, Any] = {}
+    if emails_found:
+        out["emails"] = emails_found
+    if social_links:
+        out["social_links"] = social_links
+    if external_links:
+        out["external_links"] = external_links
+    return out
+
+
+def extract_html_metadata(*, html: str, base_url: str | httpx.URL | None = None) -> dict[str, Any]:
     """Extrae metadata ligera de HTML.
 
     Requisitos:
@@ -138,6 +434,7 @@ def extract_html_metadata(*, html: str, base_url: str | None = None) -> dict[str
 
     if not html:
         return {}
+    BeautifulSoup = _get_beautifulsoup()
     if BeautifulSoup is None:
         return {}
 
@@ -157,70 +454,7 @@ def extract_html_metadata(*, html: str, base_url: str | None = None) -> dict[str
     if og and og.get("content"):
         og_image = str(og.get("content")).strip()
         if base_url:
-            og_image = urljoin(base_url, og_image)
-
-    # ── Extract emails from full page text ──
-    import re as _re  # noqa: E402 — lazy import to keep top-level light
-    page_text = soup.get_text(" ", strip=True) + " "
-    # Also scan href="mailto:..." links.
-    for a in soup.find_all("a", href=True):
-        href = str(a["href"])
-        if href.startswith("mailto:"):
-            page_text += " " + href.replace("mailto:", "") + " "
-    email_pattern = _re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
-    emails_found = sorted(set(email_pattern.findall(page_text)))
-
-    # ── Extract social media links ──
-    _SOCIAL_PATTERNS: dict[str, _re.Pattern[str]] = {
-        "github": _re.compile(r"github\.com/([a-zA-Z0-9_\-]+)"),
-        "gitlab": _re.compile(r"gitlab\.com/([a-zA-Z0-9_\-]+)"),
-        "twitter": _re.compile(r"(?:twitter|x)\.com/([a-zA-Z0-9_]+)"),
-        "linkedin": _re.compile(r"linkedin\.com/in/([a-zA-Z0-9_\-]+)"),
-        "instagram": _re.compile(r"instagram\.com/([a-zA-Z0-9_.]+)"),
-        "youtube": _re.compile(r"youtube\.com/(?:@|channel/|c/)([a-zA-Z0-9_\-]+)"),
-        "tiktok": _re.compile(r"tiktok\.com/@([a-zA-Z0-9_.]+)"),
-        "facebook": _re.compile(r"facebook\.com/([a-zA-Z0-9_.]+)"),
-        "medium": _re.compile(r"medium\.com/@([a-zA-Z0-9_.\-]+)"),
-        "dev.to": _re.compile(r"dev\.to/([a-zA-Z0-9_]+)"),
-        "behance": _re.compile(r"behance\.net/([a-zA-Z0-9_\-]+)"),
-        "dribbble": _re.compile(r"dribbble\.com/([a-zA-Z0-9_\-]+)"),
-        "soundcloud": _re.compile(r"soundcloud\.com/([a-zA-Z0-9_\-]+)"),
-        "twitch": _re.compile(r"twitch\.tv/([a-zA-Z0-9_]+)"),
-        "telegram": _re.compile(r"t\.me/([a-zA-Z0-9_]+)"),
-        "reddit": _re.compile(r"reddit\.com/(?:u|user)/([a-zA-Z0-9_\-]+)"),
-        "keybase": _re.compile(r"keybase\.io/([a-zA-Z0-9_]+)"),
-        "mastodon": _re.compile(r"(@[a-zA-Z0-9_]+@[a-zA-Z0-9.\-]+)"),
-    }
-
-    social_links: list[dict[str, str]] = []
-    seen_socials: set[tuple[str, str]] = set()
-
-    all_links = [str(a.get("href", "")) for a in soup.find_all("a", href=True)]
-    full_html = html  # also scan raw HTML for social references
-
-    for network, pattern in _SOCIAL_PATTERNS.items():
-        for source in all_links + [full_html]:
-            for match in pattern.finditer(source):
-                username = match.group(1)
-                if (network, username.lower()) in seen_socials:
-                    continue
-                seen_socials.add((network, username.lower()))
-                # Reconstruct URL from match.
-                url_match = match.group(0)
-                if not url_match.startswith("http"):
-                    url_match = f"https://{url_match}"
-                social_links.append({
-                    "network": network,
-                    "url": url_match,
-                    "username": username,
-                })
-
-    # ── Collect external links (up to 20) ──
-    external_links: list[str] = []
-    for a in soup.find_all("a", href=True):
-        href = str(a["href"])
-        if href.startswith("http") and len(external_links) < 20:
-            external_links.append(href)
+            og_image = _resolve_url(base_url, og_image)
 
     out: dict[str, Any] = {}
     if title:
@@ -229,11 +463,13 @@ def extract_html_metadata(*, html: str, base_url: str | None = None) -> dict[str
         out["meta_description"] = meta_description
     if og_image:
         out["og_image"] = og_image
-    if emails_found:
-        out["emails"] = emails_found
-    if social_links:
-        out["social_links"] = social_links
-    if external_links:
-        out["external_links"] = external_links
+    # Emails (texto + mailto:), enlaces sociales y externos: mismas reglas que el parser incremental.
+    out.update(
+        _body_link_metadata(
+            page_text=soup.get_text(" ", strip=True),
+            hrefs=[str(a["href"]) for a in soup.find_all("a", href=True)],
+            html=html,
+        )
+    )
     return out
 
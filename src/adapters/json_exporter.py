@@ -12,14 +12,25 @@ from pathlib import Path
 
 from core.domain.models import PersonEntity
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 def export_person_json(*, person: PersonEntity, output_path: Path) -> Path:
     """Exporta `PersonEntity` a JSON UTF-8 con formato estable."""
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     payload = person.model_dump(mode="json")
-    output_path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    if orjson is not None:
+        # Mismo formato (indent 2, claves ordenadas, salto final) y ya en bytes UTF-8.
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        output_path.write_bytes(orjson.dumps(payload, option=option))
+        return output_path
+    # Sin orjson: `json.dump` codifica por trozos directamente al fichero, sin
+    # materializar el documento entero como str (ni su copia en bytes).
+    with output_path.open("w", encoding="utf-8", newline="\n") as fh:
+        json.dump(payload, fh, ensure_ascii=False, indent=2, sort_keys=True)
+        fh.write("\n")
     return output_path
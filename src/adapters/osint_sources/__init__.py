@@ -6,6 +6,7 @@ Por qué un paquete:
 """
 
 from adapters.osint_sources.aboutme import AboutMeScanner
+from adapters.osint_sources.batch import scan_all
 from adapters.osint_sources.behance import BehanceScanner
 from adapters.osint_sources.devto import DevToScanner
 from adapters.osint_sources.dribbble import DribbbleScanner
@@ -47,4 +48,5 @@ __all__ = [
     "TelegramScanner",
     "TwitchScanner",
     "XScanner",
+    "scan_all",
 ]
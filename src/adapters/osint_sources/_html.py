@@ -0,0 +1,82 @@
+"""Parseo HTML para los scanners que extraen metadatos del perfil.
+
+Por qué:
+- `selectolax` (backend lexbor, en C) parsea páginas de varios KB mucho más
+  rápido que `html.parser` de BeautifulSoup, que es Python puro.
+- Es un extra opcional: si no está instalado caemos a BeautifulSoup (con
+  `lxml` si está disponible). Ambos backends soportan selectores CSS, así que
+  la API es la misma.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=None)
+def _selectolax_parser() -> Any | None:
+    # Import perezoso y memoizado: ni selectolax ni bs4 se cargan al importar
+    # los scanners, solo cuando alguno parsea HTML por primera vez.
+    try:
+        from selectolax.parser import HTMLParser  # type: ignore
+    except Exception:
+        return None
+    return HTMLParser
+
+
+@lru_cache(maxsize=None)
+def _beautifulsoup() -> Any:
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup
+
+
+@lru_cache(maxsize=None)
+def bs4_features() -> str:
+    """Parser para BeautifulSoup: `lxml` (libxml2, en C) si está instalado."""
+
+    try:
+        import lxml  # type: ignore  # noqa: F401
+    except Exception:
+        return "html.parser"
+    return "lxml"
+
+
+def parse_html(html: str | bytes) -> Any:
+    """Devuelve el árbol del documento con el backend disponible."""
+
+    parser = _selectolax_parser()
+    if parser is not None:
+        return parser(html)
+    return _beautifulsoup()(html, bs4_features())
+
+
+def css_first(tree: Any, selector: str) -> Any | None:
+    if _selectolax_parser() is not None:
+        return tree.css_first(selector)
+    return tree.select_one(selector)
+
+
+def css_all(tree: Any, selector: str) -> list[Any]:
+    if _selectolax_parser() is not None:
+        return tree.css(selector)
+    return tree.select(selector)
+
+
+def node_text(node: Any) -> str:
+    if _selectolax_parser() is not None:
+        return node.text()
+    return node.get_text()
+
+
+def node_attr(node: Any | None, name: str) -> str | None:
+    """Atributo del nodo; `None` si el nodo no existe o el valor está vacío."""
+
+    if node is None:
+        return None
+    if _selectolax_parser() is not None:
+        value = node.attributes.get(name)
+    else:
+        value = node.get(name)
+    return value or None
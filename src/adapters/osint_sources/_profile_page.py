@@ -0,0 +1,49 @@
+"""Base declarativa para scanners de "perfil público por URL".
+
+Por qué:
+- Varios scanners (Behance, dev.to, npm, Keybase, ...) eran copias del mismo
+  flujo: GET a una URL con el username, existencia por status 200 y metadata
+  mínima. Cada uno declara ahora solo su URL y su nombre de red.
+- Optimizaciones transversales (cliente compartido, HEAD, parseo) se aplican
+  aquí una sola vez.
+"""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+from adapters.http_client import get_shared_client
+from core.config import AppSettings, get_settings
+from core.domain.models import SocialProfile
+from core.interfaces.scanner import OSINTScanner
+
+
+class ProfilePageScanner(OSINTScanner):
+    """Existencia por status code sobre `_url_template.format(username=...)`."""
+
+    _url_template: ClassVar[str]
+    _network_name: ClassVar[str]
+
+    def __init__(self, settings: AppSettings | None = None) -> None:
+        self._settings = settings or get_settings()
+
+    async def scan(self, username: str) -> SocialProfile:
+        url = self._url_template.format(username=username)
+
+        client = get_shared_client(self._settings)
+        response = await client.get(url)
+        final_url = str(response.url)
+        status_code = response.status_code
+
+        metadata: dict[str, Any] = {
+            "status_code": status_code,
+            "final_url": final_url,
+        }
+
+        return SocialProfile(
+            url=final_url,
+            username=username,
+            network_name=self._network_name,
+            exists=status_code == 200,
+            metadata=metadata,
+        )
@@ -6,138 +6,189 @@ Implementación mínima:
 
 from __future__ import annotations
 
+import json
+import re
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.http_client import get_shared_client
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
-from bs4 import BeautifulSoup
 
-#todo: extraccion de js (evaluar selecto lax? xpath?)
+from ._html import css_all, css_first, node_attr, node_text, parse_html
+
+
+_LD_FIELDS = ("address", "jobTitle", "knowsAbout", "sameAs")
+
+# Fallback si no hay JSON-LD válido: una sola pasada sobre el HTML para los
+# cuatro campos (antes eran cuatro `re.search` independientes).
+_FIELDS_RE = re.compile(
+    r'"(address|jobTitle)":"(.*?)",|"(knowsAbout|sameAs)":\s*\[(.*?)\]',
+    re.IGNORECASE | re.DOTALL,
+)
+_QUOTED_RE = re.compile(r'"(.*?)"')
+
+
+def _find_ld_person(data: Any) -> dict[str, Any] | None:
+    """Primer objeto JSON-LD (o nodo de `@graph`) con alguno de los campos."""
+
+    if isinstance(data, list):
+        for item in data:
+            found = _find_ld_person(item)
+            if found is not None:
+                return found
+        return None
+    if not isinstance(data, dict):
+        return None
+    if any(k in data for k in _LD_FIELDS):
+        return data
+    return _find_ld_person(data.get("@graph"))
+
+
+def _ld_text(value: Any) -> str | None:
+    if isinstance(value, str):
+        return value or None
+    if isinstance(value, dict):
+        # PostalAddress / Thing: nos quedamos con lo legible.
+        if value.get("name"):
+            return str(value["name"])
+        parts = [value.get(k) for k in ("addressLocality", "addressRegion", "addressCountry")]
+        return ", ".join(str(p) for p in parts if isinstance(p, str) and p) or None
+    return None
+
+
+def _ld_list(value: Any) -> list[str]:
+    items = value if isinstance(value, list) else [value]
+    return [t for t in (_ld_text(i) for i in items) if t]
+
+
+def _extract_fields(tree: Any, html: str) -> dict[str, Any]:
+    """`address`/`jobTitle`/`knowsAbout`/`sameAs` del perfil.
+
+    Prefiere el bloque JSON-LD (un `json.loads`); si no existe o no parsea,
+    aplica `_FIELDS_RE` una sola vez sobre el HTML.
+    """
+
+    for node in css_all(tree, 'script[type="application/ld+json"]'):
+        try:
+            person = _find_ld_person(json.loads(node_text(node)))
+        except ValueError:
+            continue
+        if person is not None:
+            return {
+                "address": _ld_text(person.get("address")),
+                "jobTitle": _ld_text(person.get("jobTitle")),
+                "knowsAbout": _ld_list(person["knowsAbout"]) if "knowsAbout" in person else None,
+                "sameAs": _ld_list(person.get("sameAs") or []),
+            }
+
+    fields: dict[str, Any] = {}
+    for m in _FIELDS_RE.finditer(html):
+        if m.group(1):
+            fields.setdefault(m.group(1), m.group(2))
+        else:
+            fields.setdefault(m.group(3), _QUOTED_RE.findall(m.group(4)))
+    return fields
+
+#todo: extraccion de js (xpath?)
 class AboutMeScanner(OSINTScanner):
     _base_url = "https://about.me"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile | list[SocialProfile]:
-        import re
         url = f"{self._base_url}/{username}"
 
-        async with build_async_client(self._settings) as client:
-            response = await client.get(url)
-            metadata: dict[str, Any] = {
-                "status_code": response.status_code,
-                "final_url": str(response.url),
-            }
-            exists = response.status_code == 200
-            name = None
-            description = None
-
-            if exists:
-                html = response.text if hasattr(response, "text") else await response.aread()
-                if not isinstance(html, str):
-                    html = html.decode(errors="ignore")
-
-                soup = BeautifulSoup(html, "html.parser")
-                #validamos existencia real del perfil con el div que contiene el nombre
-                #pattern_exist_div = r'<title>(.*?)</title>'
-                title_soup = soup.find("title")
-                #ne = re.search(pattern_exist_div, html, re.IGNORECASE | re.DOTALL)
-                title= title_soup.text if title_soup is not None else None
-
-                if title is not None:
-                    who = title.replace("| about.me", "").strip(" ·-")
-                    #metadata["name"] = who
-                    # who = username userlastname - New Orleans, Louisiana
-                    name= who.split(" - ")[0].strip()
-                    metadata["name"]= name
-
-                    bio_soup = soup.find("meta", {"property": "og:description"})
-                    bio= bio_soup.get("content") if bio_soup and bio_soup.get("content") else None
-                    #pattern_bio = r'"bio":"(.*?)",'
-                    #nb = re.search(pattern_bio, html, re.IGNORECASE | re.DOTALL)
-                    #bio= nb.group(1) if nb is not None else None
-                    metadata["bio"] = bio
-
-                    description_section_soup = soup.find("section", {"class": "bio"})
-                    if description_section_soup is not None:
-                        description= description_section_soup.find("p").text if description_section_soup and description_section_soup.find("p") else None
-                    #pattern_desc = r'"description":"(.*?)",'
-                    #nd = re.search(pattern_desc, html, re.IGNORECASE | re.DOTALL)
-                    #description= nd.group(1) if nd is not None else None
-                    metadata["description"] = description
-
-                    #pattern_avatar = r'"image":{"url":"(.*?)",'
-
-                    avatar_soup = soup.find("meta", {"property": "og:image"})
-                    avatar= avatar_soup.get("content") if avatar_soup and avatar_soup.get("content") else None
-                    #na = re.search(pattern_avatar, html, re.IGNORECASE | re.DOTALL)
-                    if avatar is not None:
-                        metadata["avatar_url"] = avatar
-
-
-                    pattern_location = r'"address":"(.*?)",'
-                    nl = re.search(pattern_location, html, re.IGNORECASE | re.DOTALL)
-                    location= nl.group(1) if nl is not None else None
-                    if location is None:
-                        location= who.split(" - ")[1].strip() if len(who.split(" - "))>1 else None
-                    metadata["location"] = location
-
-                    pattern_job=r'"jobTitle":"(.*?)",'
-                    nj= re.search(pattern_job, html, re.IGNORECASE | re.DOTALL)
-                    job= nj.group(1) if nj is not None else None
-                    metadata["jobTitle"] = job
-
-                    pattern_interests = r'"knowsAbout":\s*\[(.*?)\]'
-                    ni = re.search(pattern_interests, html, re.IGNORECASE | re.DOTALL)
-                    if ni:
-                        # Extrae todos los elementos entre comillas
-                        interests = re.findall(r'"(.*?)"', ni.group(1))
-                    else:
-                        interests = None
-                    metadata["interests"] = interests
-
-                    pattern_socials = r'"sameAs":\s*\[(.*?)\]'
-                    ns = re.search(pattern_socials, html, re.IGNORECASE | re.DOTALL)
-
-                    social_links = []
-                    if ns:
-                        # Extrae todos los elementos entre comillas
-                        social_links = re.findall(r'"(.*?)"', ns.group(1))
-
-                    metadata["social_links"] = social_links
-
-
-
-
-
-                if name is not None:
-                    exists = True
-                    metadata["name"] = name
-
-
-            main_profile= SocialProfile(
-                url=str(response.url),
+        client = get_shared_client(self._settings)
+        response = await client.get(url)
+        final_url = str(response.url)
+        status_code = response.status_code
+        metadata: dict[str, Any] = {
+            "status_code": status_code,
+            "final_url": final_url,
+        }
+        if status_code != 200:
+            # Camino negativo (el más común): sin parsear ni construir nada más.
+            return SocialProfile(
+                url=final_url,
                 username=username,
                 network_name="aboutme",
-                exists=exists,
+                exists=False,
                 metadata=metadata,
             )
 
-            # Creamos perfiles adicionales para que aparezcan en la tabla
-            extra_profiles = []
-
-            if "social_links" in metadata:
-                for link in metadata["social_links"]:
-                    extra_profiles.append(SocialProfile(
-                        url=link,
-                        username=link.split("/")[-1],
-                        network_name="aboutme_social_link",
-                        exists=True,
-                        metadata={"source": "aboutme", "from_username": username},
-                    ))
+        description = None
+        # httpx decodifica (charset de la respuesta) y cachea `.text`: una sola pasada.
+        html = response.text
+
+        tree = parse_html(html)
+        #validamos existencia real del perfil con el div que contiene el nombre
+        #pattern_exist_div = r'<title>(.*?)</title>'
+        title_node = css_first(tree, "title")
+        #ne = re.search(pattern_exist_div, html, re.IGNORECASE | re.DOTALL)
+        title= node_text(title_node) if title_node is not None else None
+
+        if title is not None:
+            who = title.replace("| about.me", "").strip(" ·-")
+            #metadata["name"] = who
+            # who = username userlastname - New Orleans, Louisiana
+            name= who.split(" - ")[0].strip()
+            metadata["name"]= name
+
+            bio= node_attr(css_first(tree, 'meta[property="og:description"]'), "content")
+            #pattern_bio = r'"bio":"(.*?)",'
+            #nb = re.search(pattern_bio, html, re.IGNORECASE | re.DOTALL)
+            #bio= nb.group(1) if nb is not None else None
+            metadata["bio"] = bio
+
+            description_node = css_first(tree, "section.bio p")
+            if description_node is not None:
+                description= node_text(description_node)
+            #pattern_desc = r'"description":"(.*?)",'
+            #nd = re.search(pattern_desc, html, re.IGNORECASE | re.DOTALL)
+            #description= nd.group(1) if nd is not None else None
+            metadata["description"] = description
+
+            #pattern_avatar = r'"image":{"url":"(.*?)",'
+
+            avatar= node_attr(css_first(tree, 'meta[property="og:image"]'), "content")
+            #na = re.search(pattern_avatar, html, re.IGNORECASE | re.DOTALL)
+            if avatar is not None:
+                metadata["avatar_url"] = avatar
+
+
+            fields = _extract_fields(tree, html)
+
+            location= fields.get("address")
+            if location is None:
+                location= who.split(" - ")[1].strip() if len(who.split(" - "))>1 else None
+            metadata["location"] = location
+
+            metadata["jobTitle"] = fields.get("jobTitle")
+            metadata["interests"] = fields.get("knowsAbout")
+            metadata["social_links"] = fields.get("sameAs") or []
+
+        main_profile= SocialProfile(
+            url=final_url,
+            username=username,
+            network_name="aboutme",
+            exists=True,
+            metadata=metadata,
+        )
+
+        # Creamos perfiles adicionales para que aparezcan en la tabla
+        extra_profiles = []
+
+        if "social_links" in metadata:
+            for link in metadata["social_links"]:
+                extra_profiles.append(SocialProfile(
+                    url=link,
+                    username=link.split("/")[-1],
+                    network_name="aboutme_social_link",
+                    exists=True,
+                    metadata={"source": "aboutme", "from_username": username},
+                ))
 
 
         # Retornamos todos los perfiles (el principal y los extras)
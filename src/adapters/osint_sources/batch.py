@@ -0,0 +1,37 @@
+"""Ejecución concurrente de scanners sobre un mismo objetivo.
+
+Cada scanner es un GET independiente (I/O-bound): lanzarlos juntos reduce la
+latencia total de la suma de latencias a la del más lento. El semáforo acota
+cuántas peticiones hay en vuelo a la vez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+
+from core.domain.models import SocialProfile
+from core.interfaces.scanner import OSINTScanner
+
+ScanOutcome = SocialProfile | list[SocialProfile] | BaseException
+
+
+async def scan_all(
+    username: str,
+    scanners: Iterable[OSINTScanner],
+    *,
+    concurrency: int = 20,
+) -> list[ScanOutcome]:
+    """Ejecuta `scan(username)` en todos los scanners, en paralelo.
+
+    Devuelve un resultado por scanner, en el mismo orden. Los fallos se
+    devuelven como la excepción (no se propagan) para no cancelar al resto.
+    """
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(scanner: OSINTScanner) -> SocialProfile | list[SocialProfile]:
+        async with semaphore:
+            return await scanner.scan(username)
+
+    return list(await asyncio.gather(*(_one(s) for s in scanners), return_exceptions=True))
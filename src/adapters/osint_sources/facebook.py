@@ -23,8 +23,8 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.http_client import get_shared_client
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
@@ -68,7 +68,7 @@ class FacebookScanner(OSINTScanner):
     _base_url = "https://www.facebook.com"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile:
         url = f"{self._base_url}/{username}"
@@ -81,10 +81,9 @@ class FacebookScanner(OSINTScanner):
             "Sec-Fetch-Site": "none",
         }
 
-        async with build_async_client(self._settings, extra_headers=headers) as client:
-            response = await client.get(url, follow_redirects=True)
+        client = get_shared_client(self._settings)
+        response = await client.get(url, headers=headers, follow_redirects=True)
 
-        html = response.text or ""
         final_url = str(response.url)
         status = response.status_code
 
@@ -101,6 +100,8 @@ class FacebookScanner(OSINTScanner):
         is_login_redirect = "/login" in final_url or "/checkpoint" in final_url
         # Generic "page not found" or profile doesn't exist.
         is_not_found = status == 404
+        # Solo se decodifica el body si hay algo que parsear (login/404 no lo necesitan).
+        html = (response.text or "") if status == 200 and not is_login_redirect else ""
 
         if is_login_redirect:
             metadata["blocked"] = True
@@ -10,7 +10,7 @@ from __future__ import annotations
 from typing import Any
 
 from adapters.specific_scrapers import fetch_github_deep
-from core.config import AppSettings
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
@@ -21,7 +21,7 @@ class GitHubScanner(OSINTScanner):
     _base_url = "https://github.com"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile | list[SocialProfile]:
         public_url = f"{self._base_url}/{username}"
@@ -6,47 +6,51 @@ Implementación mínima:
 
 from __future__ import annotations
 
+import html
+import re
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.http_client import get_shared_client
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
-from bs4 import BeautifulSoup
+
+
+# Solo interesa el <title>: una regex sobre los bytes evita construir el árbol HTML.
+_TITLE_RE = re.compile(rb"<title[^>]*>([^<]*)</title>", re.IGNORECASE)
 
 
 class GitLabScanner(OSINTScanner):
     _base_url = "https://gitlab.com"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile:
         url = f"{self._base_url}/{username}"
 
-        async with build_async_client(self._settings) as client:
-            response = await client.get(url)
+        client = get_shared_client(self._settings)
+        response = await client.get(url)
+        final_url = str(response.url)
+        status_code = response.status_code
 
-        exists = response.status_code == 200
+        exists = status_code == 200
         name = None
         if exists:
             # Extraer <title> del HTML
-            html = response.text if hasattr(response, "text") else await response.aread()
-            if not isinstance(html, str):
-                html = html.decode(errors="ignore")
-            soup = BeautifulSoup(html, "html.parser")
-            title_soup = soup.find("title")
-            if title_soup:
-                name = title_soup.text.replace("· GitLab", "").strip(" ·-")
+            m = _TITLE_RE.search(response.content)
+            if m is not None:
+                title = html.unescape(m.group(1).decode("utf-8", "ignore"))
+                name = title.replace("· GitLab", "").strip(" ·-")
 
         metadata: dict[str, Any] = {
-            "status_code": response.status_code,
-            "final_url": str(response.url),
+            "status_code": status_code,
+            "final_url": final_url,
             "name": name,
             "server": response.headers.get("server"),
         }
         return SocialProfile(
-            url=str(response.url),
+            url=final_url,
             username=username,
             network_name="gitlab",
             exists=exists,
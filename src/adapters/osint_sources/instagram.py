@@ -21,8 +21,8 @@ import json
 import re
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.http_client import get_shared_client
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
@@ -104,7 +104,7 @@ class InstagramScanner(OSINTScanner):
     _base_url = "https://www.instagram.com"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile:
         url = f"{self._base_url}/{username}/"
@@ -117,10 +117,9 @@ class InstagramScanner(OSINTScanner):
             "Sec-Fetch-Site": "none",
         }
 
-        async with build_async_client(self._settings, extra_headers=headers) as client:
-            response = await client.get(url)
+        client = get_shared_client(self._settings)
+        response = await client.get(url, headers=headers)
 
-        html = response.text or ""
         final_url = str(response.url)
         status = response.status_code
 
@@ -128,6 +127,8 @@ class InstagramScanner(OSINTScanner):
         # But it may also redirect to login pages for blocked requests.
         is_login_redirect = "/accounts/login" in final_url
         exists = status == 200 and not is_login_redirect and username.lower() in final_url.lower()
+        # El body solo se decodifica si el perfil existe y hay metadata que extraer.
+        html = (response.text or "") if exists else ""
 
         metadata: dict[str, Any] = {
             "status_code": status,
@@ -11,83 +11,76 @@ from __future__ import annotations
 
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.http_client import get_shared_client
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
-from bs4 import BeautifulSoup
+
+from ._html import css_all, css_first, node_attr, node_text, parse_html
 
 
 class MediumScanner(OSINTScanner):
     _base_url = "https://medium.com"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile:
         url = f"{self._base_url}/@{username}"
 
 
-        async with build_async_client(self._settings) as client:
-            response = await client.get(url)
-            metadata: dict[str, Any] = {
-            "status_code": response.status_code,
-            "final_url": str(response.url),
-            }
-            if response.status_code == 200:
-                soup = BeautifulSoup(await response.aread(), "html.parser")
-
-                html = response.text if hasattr(response, "text") else await response.aread()
-                if not isinstance(html, str):
-                    html = html.decode(errors="ignore")
-                #"<meta data-rh="true" property="og:title" content="Chad Hamre – Medium" />"
-                metatitle_soup = soup.find("meta", {"property": "og:title"})
-                name = None
-                if metatitle_soup and metatitle_soup.get("content"):
-                    name = metatitle_soup.get("content")
-
+        client = get_shared_client(self._settings)
+        response = await client.get(url)
+        final_url = str(response.url)
+        status_code = response.status_code
+        metadata: dict[str, Any] = {
+        "status_code": status_code,
+        "final_url": final_url,
+        }
+        if status_code == 200:
+            # `get()` ya cargó el cuerpo: `.text` decodifica una vez y httpx lo cachea.
+            tree = parse_html(response.text)
+            #"<meta data-rh="true" property="og:title" content="Chad Hamre – Medium" />"
+            name = node_attr(css_first(tree, 'meta[property="og:title"]'), "content")
 
 
-                if name is not None and name != "Medium":
-                    exists = True
-                    name= name.replace("– Medium", "").strip()
 
+            if name is not None and name != "Medium":
+                exists = True
+                name= name.replace("– Medium", "").strip()
 
-                    description_soup = soup.find("meta", {"name": "description"})
-                    if description_soup and description_soup.get("content"):
-                        description = description_soup.get("content")
-                        metadata["description"] = description
 
-                    avatar_soup = soup.find("meta", {"property": "og:image"})
-                    if avatar_soup and avatar_soup.get("content"):
-                        avatar_url = avatar_soup.get("content")
-                        metadata["avatar_url"] = avatar_url
+                description = node_attr(css_first(tree, 'meta[name="description"]'), "content")
+                if description:
+                    metadata["description"] = description
 
+                avatar_url = node_attr(css_first(tree, 'meta[property="og:image"]'), "content")
+                if avatar_url:
+                    metadata["avatar_url"] = avatar_url
 
-                    titles_soup = soup.find_all("h2")
-                    titles = [t.get_text().strip() for t in titles_soup if t.get_text().strip()]
 
-                    contents_soup = soup.find_all("h3")
-                    contents = [c.get_text().strip() for c in contents_soup if c.get_text().strip()]
+                titles = [t for t in (node_text(n).strip() for n in css_all(tree, "h2")) if t]
 
-                    posts=[]
+                contents = [c for c in (node_text(n).strip() for n in css_all(tree, "h3")) if c]
 
-                    for t, c in zip(titles, contents):
-                        posts.append({"title": t.strip(), "content": c.strip()})
-                    if posts:
-                        metadata["recent_posts"] = posts
+                posts=[]
 
-                else:
-                    name = None
-                    exists = False
+                for t, c in zip(titles, contents):
+                    posts.append({"title": t.strip(), "content": c.strip()})
+                if posts:
+                    metadata["recent_posts"] = posts
 
-                metadata["name"] = name
             else:
+                name = None
                 exists = False
 
+            metadata["name"] = name
+        else:
+            exists = False
+
 
         return SocialProfile(
-            url=str(response.url),
+            url=final_url,
             username=username,
             network_name="medium",
             exists=exists,
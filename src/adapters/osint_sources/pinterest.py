@@ -11,70 +11,67 @@ from __future__ import annotations
 
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.http_client import HEAD_FALLBACK_STATUS, get_shared_client
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
-from bs4 import BeautifulSoup
+
+from ._html import css_all, css_first, node_attr, node_text, parse_html
+
 
 class PinterestScanner(OSINTScanner):
     _base_url = "https://www.pinterest.com"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile:
-        import re
         url = f"{self._base_url}/{username}/"
 
-        async with build_async_client(self._settings) as client:
+        client = get_shared_client(self._settings)
+        # HEAD primero: en un perfil inexistente (404) no se descarga el HTML.
+        # Solo con 200 (o si HEAD no se acepta) hace falta el cuerpo para la metadata.
+        response = await client.head(url)
+        if response.status_code == 200 or response.status_code in HEAD_FALLBACK_STATUS:
             response = await client.get(url)
+        final_url = str(response.url)
+        status_code = response.status_code
 
-        exists = response.status_code == 200
+        exists = status_code == 200
         metadata: dict[str, Any] = {
-            "status_code": response.status_code,
-            "final_url": str(response.url),
+            "status_code": status_code,
+            "final_url": final_url,
         }
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        if response.status_code == 200:
-            # Extraer <title> del HTML
-            html = response.text if hasattr(response, "text") else await response.aread()
-            if not isinstance(html, str):
-                html = html.decode(errors="ignore")
+        if status_code == 200:
+            # El árbol solo se construye si el perfil puede existir (antes también en 404).
+            # Un único parseo: nombre, descripción, avatar y web salen del mismo árbol.
+            tree = parse_html(response.text)
 
             #validamos existencia real del perfil con el div que contiene el nombre
-            exist_soup = soup.find("div", {"data-test-id": "profile-name"})
-            exist= exist_soup.find("div").text if exist_soup and exist_soup.find("div") else None
-            name= exist if exist is not None else None
+            name_node = css_first(tree, 'div[data-test-id="profile-name"] div')
+            name = node_text(name_node) if name_node is not None else None
 
 
             if name is not None:
                 exists = True
                 metadata["name"] = name
 
-                pattern_desc = r'<span class="WuRgKB aMgNKE YfEt3H v_eFe4 qnEc35 hxKTA7 mm0O_j" data-test-id="main-user-description-text">(.*?)</span>'
-
-                nd = re.search(pattern_desc, html, re.IGNORECASE | re.DOTALL)
-                if nd is not None:
-                    description = nd.group(1)
+                # Anclado en `data-test-id` (las clases CSS de Pinterest rotan).
+                desc_node = css_first(tree, 'span[data-test-id="main-user-description-text"]')
+                description = node_text(desc_node).strip() if desc_node is not None else ""
+                if description:
                     metadata["description"] = description
 
-                pattern_avatar = fr'<img alt="{re.escape(name)}" class="iFOUS5" draggable="true" fetchpriority="auto" loading="auto" src="(.*?)"/>'
-                na = re.search(pattern_avatar, html, re.IGNORECASE | re.DOTALL)
-                if na is not None:
-                    avatar_url = na.group(1)
+                # El árbol ya está construido: sin regex dinámica ni `re.escape(name)`.
+                avatar_url = next(
+                    (node_attr(n, "src") for n in css_all(tree, "img.iFOUS5") if node_attr(n, "alt") == name),
+                    None,
+                )
+                if avatar_url:
                     metadata["avatar_url"] = avatar_url
 
-                #pattern_website = r'<span class="WuRgKB eMU5i5 YfEt3H v_eFe4 qnEc35 hxKTA7 rszMzv">(.*?)</span>'
-                website_section_soup= soup.find("div", {"data-test-id": "website-icon-and-url"})
-                website= website_section_soup.find("span") if website_section_soup and website_section_soup.find("span") else None
-
-                website_url= website.text if website and website.text else None
-
-                #nw = re.search(pattern_website, html, re.IGNORECASE | re.DOTALL)
-
-
+                website = css_first(tree, 'div[data-test-id="website-icon-and-url"] span')
+                website_url = (node_text(website) or None) if website is not None else None
                 if website_url is not None:
                     metadata["other_websites"] = website_url
 
@@ -83,7 +80,7 @@ class PinterestScanner(OSINTScanner):
 
 
         return SocialProfile(
-            url=str(response.url),
+            url=final_url,
             username=username,
             network_name="pinterest",
             exists=exists,
@@ -9,7 +9,7 @@ from __future__ import annotations
 from typing import Any
 
 from adapters.specific_scrapers import fetch_reddit_deep
-from core.config import AppSettings
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
@@ -18,7 +18,7 @@ class RedditScanner(OSINTScanner):
     _base_url = "https://www.reddit.com"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile:
         public_url = f"{self._base_url}/user/{username}/"
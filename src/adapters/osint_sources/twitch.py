@@ -8,56 +8,57 @@ from __future__ import annotations
 
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.http_client import get_shared_client
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
-from bs4 import BeautifulSoup
+
+from ._html import css_first, node_attr, parse_html
+
 
 class TwitchScanner(OSINTScanner):
     _base_url = "https://www.twitch.tv"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile:
         #import re
         url = f"{self._base_url}/{username}"
 
-        async with build_async_client(self._settings) as client:
-            response = await client.get(url)
+        client = get_shared_client(self._settings)
+        response = await client.get(url)
 
         metadata: dict[str, Any] = {
             "status_code": response.status_code,
             "final_url": str(response.url),
         }
 
+        exists = False
         if response.status_code == 200:
             # Extraer <title> del HTML
-            html = response.text if hasattr(response, "text") else await response.aread()
-            if not isinstance(html, str):
-                html = html.decode(errors="ignore")
-            soup = BeautifulSoup(html, "html.parser")
-            title_soup = soup.find("meta", {"property": "og:title"})
+            # Solo se leen tres <meta>: selectolax (si está) evita el árbol completo de bs4.
+            tree = parse_html(response.text)
+            title_node = css_first(tree, 'meta[property="og:title"]')
 
             name = None
-            if title_soup:
-                name = title_soup.get("content", "").replace("Twitch", "").strip(" ·-")
+            if title_node is not None:
+                name = (node_attr(title_node, "content") or "").replace("Twitch", "").strip(" ·-")
                 metadata["name"] = name
-            if title_soup is not None:
+            if title_node is not None:
                 exists = True
 
                 #pattern_desc = r'<meta name="description" content="(.*?)"'
-                desc_soup = soup.find("meta", {"name": "description"})
+                desc_node = css_first(tree, 'meta[name="description"]')
 
-                if desc_soup is not None:
-                    description = desc_soup.get("content")
+                if desc_node is not None:
+                    description = node_attr(desc_node, "content")
                     metadata["description"] = description
 
                 #pattern_avatar = r'<meta property="og:image" content="(.*?)"'
-                avatar_soup = soup.find("meta", {"property": "og:image"})
-                if avatar_soup is not None:
-                    avatar_url = avatar_soup.get("content")
+                avatar_node = css_first(tree, 'meta[property="og:image"]')
+                if avatar_node is not None:
+                    avatar_url = node_attr(avatar_node, "content")
                     metadata["avatar_url"] = avatar_url
                 #na = re.search(pattern_avatar, html, re.IGNORECASE | re.DOTALL)
 
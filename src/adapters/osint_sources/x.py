@@ -12,8 +12,8 @@ from __future__ import annotations
 
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+from adapters.http_client import get_shared_client, head_or_get
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
@@ -22,13 +22,14 @@ class XScanner(OSINTScanner):
     _base_url = "https://x.com"
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+        self._settings = settings or get_settings()
 
     async def scan(self, username: str) -> SocialProfile:
         url = f"{self._base_url}/{username}"
 
-        async with build_async_client(self._settings) as client:
-            response = await client.get(url)
+        client = get_shared_client(self._settings)
+        # Solo se usa el status: HEAD evita descargar el HTML (GET si HEAD no se acepta).
+        response = await head_or_get(client, url)
 
         exists = response.status_code == 200
         metadata: dict[str, Any] = {
@@ -8,47 +8,92 @@ Extrae (si existe):
 - <title>
 - meta[name=description]
 - meta[property=og:image]
+- emails del texto visible y de los enlaces `mailto:` (alimentan la expansión de `hunt`)
+- social_links / external_links de los `<a href>` (y del HTML crudo)
+
+La respuesta se lee en streaming con un parser incremental (sin BeautifulSoup) y
+se corta tras `_SCAN_LIMIT` bytes: emails y enlaces suelen estar en el body, así
+que no basta con `<head>`, pero una página enorme no se descarga entera (lo que
+aparezca más allá del tope no se ve).
+Respuestas que no son HTML (según `Content-Type`) se descartan sin leer el cuerpo.
+
+Concurrencia: un tope global (`max_concurrency`, por defecto
+`settings.enrich_concurrency`) más un `DomainRateLimiter` sin delay que acota cada
+host a `per_domain_concurrency`: muchos perfiles del mismo host no lo saturan y
+los de hosts distintos avanzan en paralelo.
 """
 
 from __future__ import annotations
 
 import asyncio
 
-from adapters.http_client import build_async_client, extract_html_metadata
+from adapters.http_client import HeadMetadataParser, build_async_client
+from adapters.rate_limiter import DomainRateLimiter
 from core.config import AppSettings
 from core.domain.models import SocialProfile
 
 
+_SCAN_LIMIT = 64 * 1024
+
+
+def _is_html(content_type: str | None) -> bool:
+    # Permisivo: sin Content-Type, `text/*` (hay servidores que sirven HTML como
+    # text/plain) o cualquier tipo *html/*xml. Se descartan binarios y JSON.
+    if not content_type:
+        return True
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith("text/") or "html" in media_type or "xml" in media_type
+
+
 async def enrich_profiles_from_html(
     *,
     profiles: list[SocialProfile],
     settings: AppSettings,
-    max_concurrency: int = 20,
+    max_concurrency: int | None = None,
 ) -> None:
-    sem = asyncio.Semaphore(max(1, max_concurrency))
+    # Solo perfiles existentes, sin bio ni imagen (no insistimos) y con URL HTTP(S).
+    # Si no queda ninguno, ni siquiera se crea el cliente.
+    todo = [
+        p
+        for p in profiles
+        if p.exists and not (p.bio or p.image_url) and str(p.url).startswith(("http://", "https://"))
+    ]
+    if not todo:
+        return
+
+    sem = asyncio.Semaphore(max(1, max_concurrency or settings.enrich_concurrency))
+    # Solo acota concurrencia por host (sin delay/jitter, como `specific_scrapers`):
+    # el delay se aplica bajo el lock global del limiter y un host ocupado frenaría
+    # a todos los demás.
+    rate_limiter = DomainRateLimiter(
+        per_domain_concurrency=settings.per_domain_concurrency,
+        delay_ms=0,
+        jitter_ms=0,
+    )
 
     async with build_async_client(settings) as client:
 
         async def enrich_one(p: SocialProfile) -> None:
-            if not p.exists:
-                return
-            # Si ya tenemos bio o imagen, no insistimos.
-            if p.bio or p.image_url:
-                return
-
-            # Solo HTTP(S)
             url = str(p.url)
-            if not (url.startswith("http://") or url.startswith("https://")):
-                return
-
-            async with sem:
+            # Primero el slot del dominio: una tarea en espera de su host no
+            # ocupa plaza global mientras otros hosts podrían avanzar.
+            async with rate_limiter.throttle(url), sem:
                 try:
-                    resp = await client.get(url)
-                    if resp.status_code < 200 or resp.status_code >= 400:
-                        return
-
-                    html = resp.text or ""
-                    meta = extract_html_metadata(html=html, base_url=str(resp.url))
+                    async with client.stream("GET", url) as resp:
+                        if resp.status_code < 200 or resp.status_code >= 400:
+                            return
+                        if not _is_html(resp.headers.get("content-type")):
+                            # Imagen/PDF/JSON: no hay <head> que leer; se cierra sin descargar.
+                            return
+
+                        parser = HeadMetadataParser(collect_body=True)
+                        async for chunk in resp.aiter_text():
+                            parser.feed(chunk)
+                            if resp.num_bytes_downloaded >= _SCAN_LIMIT:
+                                break
+                        else:
+                            parser.close()
+                        meta = parser.metadata(base_url=resp.url)
                     if not meta:
                         return
 
@@ -68,4 +113,4 @@ async def enrich_profiles_from_html(
                 except Exception:
                     return
 
-        await asyncio.gather(*(enrich_one(p) for p in profiles))
+        await asyncio.gather(*(enrich_one(p) for p in todo))
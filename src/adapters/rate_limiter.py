@@ -9,6 +9,7 @@ Diseño:
 - Un semáforo *por dominio* (hostname) limita requests concurrentes al mismo origen.
 - Un delay mínimo + jitter temporal entre requests al mismo dominio.
 - Retry con backoff exponencial y parsing de Retry-After en 429/503.
+- Token bucket RPM/TPM para APIs con cuota por minuto (proveedor IA).
 """
 
 from __future__ import annotations
@@ -19,7 +20,7 @@ import time
 from collections import defaultdict
 from contextlib import asynccontextmanager
 from email.utils import parsedate_to_datetime
-from typing import AsyncIterator
+from typing import AsyncIterator, Callable
 from urllib.parse import urlparse
 
 import httpx
@@ -182,6 +183,75 @@ class DomainRateLimiter:
         return base + random.uniform(0.1, 0.5)
 
 
+# ---------------------------------------------------------------------------
+# TokenBucket (RPM/TPM)
+# ---------------------------------------------------------------------------
+
+class TokenBucket:
+    """Limitador proactivo de requests y tokens por minuto.
+
+    Dos cubos que se rellenan de forma continua a ``rpm/60`` y ``tpm/60`` por
+    segundo. ``acquire()`` espera lo justo para respetar la cuota en vez de
+    descubrirla con un 429. Un límite ``<= 0`` desactiva ese cubo.
+    """
+
+    def __init__(
+        self,
+        *,
+        rpm: int = 0,
+        tpm: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rpm = max(0, rpm)
+        self._tpm = max(0, tpm)
+        self._clock = clock
+        self._requests = float(self._rpm)
+        self._tokens = float(self._tpm)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._rpm or self._tpm)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        if self._rpm:
+            self._requests = min(float(self._rpm), self._requests + elapsed * self._rpm / 60.0)
+        if self._tpm:
+            self._tokens = min(float(self._tpm), self._tokens + elapsed * self._tpm / 60.0)
+
+    def _wait_time(self, cost: float) -> float:
+        """Segundos hasta que haya 1 request y `cost` tokens disponibles."""
+        wait = 0.0
+        if self._rpm and self._requests < 1.0:
+            wait = max(wait, (1.0 - self._requests) * 60.0 / self._rpm)
+        if self._tpm and self._tokens < cost:
+            wait = max(wait, (cost - self._tokens) * 60.0 / self._tpm)
+        return wait
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Espera hasta poder enviar una request de ~`tokens` tokens."""
+        if not self.enabled:
+            return
+        # Una request mayor que el cubo entero solo puede esperar a que esté lleno.
+        cost = float(min(max(0, tokens), self._tpm)) if self._tpm else 0.0
+        # El lock serializa la espera: los llamadores salen en orden FIFO.
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self._wait_time(cost)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self._rpm:
+                self._requests -= 1.0
+            if self._tpm:
+                self._tokens -= cost
+
+
 # ---------------------------------------------------------------------------
 # Helper: request con retry integrado
 # ---------------------------------------------------------------------------
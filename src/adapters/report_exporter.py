@@ -7,17 +7,13 @@ Por qué está en adapters:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 import sys
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
-try:
-    from weasyprint import HTML
-except (ImportError, OSError):
-    # Missing system libraries (cairo, pango, gdk-pixbuf) cause OSError.
-    HTML = None
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
 from core.domain.language import Language
 from core.domain.models import PersonEntity
@@ -567,13 +563,33 @@ _STRINGS: dict[Language, dict[str, object]] = {
     },}
 
 
+def _bytecode_cache() -> BytecodeCache | None:
+    """Caché en disco del bytecode de las plantillas.
+
+    Evita recompilar `report.html` en cada proceso (cada comando de la CLI es un
+    proceso nuevo). Jinja usa un directorio temporal por usuario y valida la
+    caché con el checksum del fuente. Si no es utilizable, se compila en memoria.
+    """
+
+    try:
+        return FileSystemBytecodeCache()
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
 def _get_env() -> Environment:
+    # Memoizado: el Environment cachea las plantillas compiladas; recrearlo en
+    # cada render obligaba a releer y compilar `report.html` cada vez.
     import markupsafe
 
     templates_dir = _resolve_templates_dir()
     env = Environment(
         loader=FileSystemLoader(str(templates_dir)),
         autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=_bytecode_cache(),
+        # Las plantillas van empaquetadas: no hace falta comprobar mtime en cada get_template.
+        auto_reload=False,
     )
 
     # ── Markdown → HTML filter ──
@@ -739,35 +755,31 @@ def render_person_html(*, person: PersonEntity, language: Language) -> str:
     generated_at_local = datetime.now().astimezone().isoformat(timespec="seconds")
 
     profiles_total = len(person.profiles)
-    profiles_confirmed = [p for p in person.profiles if p.exists]
-    profiles_unconfirmed = [p for p in person.profiles if not p.exists]
-
-    def _source_for_profile(profile) -> str:
-        md = getattr(profile, "metadata", None)
-        if isinstance(md, dict):
-            value = md.get("source")
-            if value:
-                return str(value)
-        return "unknown"
-
-    for p in person.profiles:
-        try:
-            setattr(p, "_source", _source_for_profile(p))
-        except Exception:
-            pass
 
+    # Una sola pasada: clasifica, agrupa por fuente y resuelve la fuente de cada
+    # perfil sin escribir atributos sobre los modelos.
+    profiles_confirmed: list = []
+    confirmed_rows: list[tuple[object, str]] = []
     unconfirmed_by_source_map: dict[str, list] = {}
-    for p in profiles_unconfirmed:
-        source = _source_for_profile(p)
-        unconfirmed_by_source_map.setdefault(source, []).append(p)
-
-    unconfirmed_by_source = sorted(
-        unconfirmed_by_source_map.items(),
-        key=lambda kv: (kv[0] != "sherlock", kv[0]),
-    )
+    total_unconfirmed = 0
+    for p in person.profiles:
+        md = p.metadata
+        source = str(md.get("source") or "unknown") if isinstance(md, dict) else "unknown"
+        if p.exists:
+            profiles_confirmed.append(p)
+            confirmed_rows.append((p, source))
+        else:
+            total_unconfirmed += 1
+            unconfirmed_by_source_map.setdefault(source, []).append(p)
+
+    # Sherlock primero; el resto por nombre de fuente.
+    unconfirmed_by_source: list[tuple[str, list]] = []
+    sherlock_items = unconfirmed_by_source_map.pop("sherlock", None)
+    if sherlock_items is not None:
+        unconfirmed_by_source.append(("sherlock", sherlock_items))
+    unconfirmed_by_source.extend(sorted(unconfirmed_by_source_map.items()))
 
     # Cap unconfirmed leads.
-    total_unconfirmed = len(profiles_unconfirmed)
     capped_unconfirmed: list[tuple[str, list]] = []
     remaining = _MAX_UNCONFIRMED
     for source, items in unconfirmed_by_source:
@@ -815,6 +827,7 @@ def render_person_html(*, person: PersonEntity, language: Language) -> str:
         report_id=report_id,
         profiles_total=profiles_total,
         profiles_confirmed=profiles_confirmed,
+        confirmed_rows=confirmed_rows,
         profiles_confirmed_count=len(profiles_confirmed),
         profiles_unconfirmed_count=total_unconfirmed,
         unconfirmed_by_source=capped_unconfirmed,
@@ -828,33 +841,51 @@ def render_person_html(*, person: PersonEntity, language: Language) -> str:
     )
 
 
-def export_person_html(*, person: PersonEntity, output_path: Path, language: Language) -> Path:
+def export_person_html(
+    *,
+    person: PersonEntity,
+    output_path: Path,
+    language: Language,
+    html: str | None = None,
+) -> Path:
     """Exporta el agregado como HTML.
 
     Por qué existe:
     - Sirve como fallback cuando el render PDF no está soportado por el entorno.
     - Útil para depurar el contenido del reporte y el template.
+
+    `html`: render ya hecho (p. ej. el del PDF fallido) para no repetir Jinja.
     """
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    html = render_person_html(person=person, language=language)
+    if html is None:
+        html = render_person_html(person=person, language=language)
     output_path.write_text(html, encoding="utf-8")
     return output_path
 
 
-def export_person_pdf(*, person: PersonEntity, output_path: Path, language: Language) -> Path:
+def export_person_pdf(
+    *,
+    person: PersonEntity,
+    output_path: Path,
+    language: Language,
+    html: str | None = None,
+) -> Path:
     """Exporta el agregado `PersonEntity` como PDF.
 
     Diseño:
-    - Sincrónico: WeasyPrint es CPU/IO local. La CLI puede ejecutarlo en un
-      thread si fuese necesario más adelante.
+    - Sincrónico: WeasyPrint es CPU/IO local. Desde código async usar
+      :func:`export_person_pdf_async`.
+    - `html`: render ya hecho, compartido con el fallback HTML.
     """
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    html = render_person_html(person=person, language=language)
+    if html is None:
+        html = render_person_html(person=person, language=language)
     base_url = str(_resolve_templates_dir())
 
-    if HTML is None:
+    weasy_html = _weasyprint_html()
+    if weasy_html is None:
         raise ImportError(
             "WeasyPrint is not available (likely missing system libraries: "
             "cairo, pango, gdk-pixbuf). Install them and retry. "
@@ -872,5 +903,55 @@ def export_person_pdf(*, person: PersonEntity, output_path: Path, language: Lang
         warnings.filterwarnings("ignore", message=".*fsSelection.*")
         warnings.filterwarnings("ignore", message=".*instantiateVariableFont.*")
         warnings.filterwarnings("ignore", category=DeprecationWarning)
-        HTML(string=html, base_url=base_url).write_pdf(str(output_path))
+        weasy_html(string=html, base_url=base_url).write_pdf(str(output_path), font_config=_font_config())
     return output_path
+
+
+async def export_person_pdf_async(
+    *,
+    person: PersonEntity,
+    output_path: Path,
+    language: Language,
+    html: str | None = None,
+) -> Path:
+    """Igual que :func:`export_person_pdf`, en un thread para no bloquear el event loop."""
+
+    return await asyncio.to_thread(
+        export_person_pdf,
+        person=person,
+        output_path=output_path,
+        language=language,
+        html=html,
+    )
+
+
+@lru_cache(maxsize=1)
+def _weasyprint_html():
+    """Clase `weasyprint.HTML`, importada la primera vez que se exporta un PDF.
+
+    Importar WeasyPrint carga cairo/pango (cientos de ms): no se paga en el
+    arranque de comandos que no generan PDF. `None` si no está disponible.
+    """
+
+    try:
+        from weasyprint import HTML
+    except (ImportError, OSError):
+        # Missing system libraries (cairo, pango, gdk-pixbuf) cause OSError.
+        return None
+    return HTML
+
+
+@lru_cache(maxsize=1)
+def _font_config():
+    """`FontConfiguration` compartida entre exportaciones.
+
+    WeasyPrint crea una nueva (fontconfig + caras FreeType) en cada `write_pdf`
+    si no se le pasa una; reutilizarla evita repetir ese coste por reporte.
+    """
+
+    try:
+        from weasyprint.text.fonts import FontConfiguration
+    except ImportError:
+        # WeasyPrint < 53.
+        from weasyprint.fonts import FontConfiguration  # type: ignore
+    return FontConfiguration()
@@ -15,8 +15,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from typing import Any
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 
 from adapters.http_client import build_async_client, extract_html_metadata
 from adapters.rate_limiter import (
@@ -56,6 +57,79 @@ def _interpolate(url_template: str, username: str) -> str:
         return url_template
 
 
+@dataclass(frozen=True, slots=True)
+class SherlockSite:
+    """Entrada del manifest ya interpretada (una vez, no por username)."""
+
+    name: str
+    network_name: str
+    url_template: str | None
+    url_main: Any
+    error_types: tuple[str, ...]
+    error_codes: tuple[int, ...] | None
+    error_msg: Any
+    headers: dict[str, Any] | None
+    request_method: str
+    is_nsfw: bool
+
+
+def _compile_site(site_name: str, info: dict[str, Any]) -> SherlockSite:
+    url_t = info.get("url")
+    error_type = info.get("errorType")
+    if isinstance(error_type, str):
+        error_types: tuple[str, ...] = (error_type,)
+    elif isinstance(error_type, list):
+        error_types = tuple(t for t in error_type if isinstance(t, str))
+    else:
+        error_types = ()
+
+    error_codes = info.get("errorCode")
+    if isinstance(error_codes, int):
+        error_codes = (error_codes,)
+    elif isinstance(error_codes, list):
+        error_codes = tuple(c for c in error_codes if isinstance(c, int))
+    else:
+        error_codes = None
+
+    headers = info.get("headers")
+    request_method = info.get("request_method")
+    return SherlockSite(
+        name=site_name,
+        network_name=_slug(site_name),
+        url_template=url_t if isinstance(url_t, str) and url_t else None,
+        url_main=info.get("urlMain"),
+        error_types=error_types,
+        error_codes=error_codes,
+        error_msg=info.get("errorMsg"),
+        headers=headers if isinstance(headers, dict) else None,
+        request_method=request_method.upper() if isinstance(request_method, str) else "GET",
+        is_nsfw=_is_nsfw(info),
+    )
+
+
+# Último manifest compilado: `load_sherlock_data` devuelve el mismo dict memoizado,
+# así que hunts repetidos (y el conteo de progreso) reutilizan la compilación. Se
+# guarda la referencia al manifest (así su id no se reutiliza) y se asume de solo
+# lectura, como documenta `load_sherlock_data`.
+_compiled_cache: tuple[Mapping[str, Any], tuple[SherlockSite, ...], tuple[SherlockSite, ...]] | None = None
+
+
+def sherlock_sites(manifest: Mapping[str, Any], *, no_nsfw: bool) -> tuple[SherlockSite, ...]:
+    """Sitios chequeables del manifest (sin `$schema` ni entradas no-dict)."""
+
+    global _compiled_cache
+    cached = _compiled_cache
+    if cached is None or cached[0] is not manifest:
+        all_sites = tuple(
+            _compile_site(site_name, info)
+            for site_name, info in manifest.items()
+            if site_name != "$schema" and isinstance(info, dict)
+        )
+        cached = (manifest, all_sites, tuple(site for site in all_sites if not site.is_nsfw))
+        _compiled_cache = cached
+    return cached[2] if no_nsfw else cached[1]
+
+
 def _contains_any(text: str, needle: Any) -> bool:
     if not needle:
         return False
@@ -86,43 +160,21 @@ async def run_sherlock_username(
         retry_max_attempts=settings.retry_max_attempts,
     )
 
-    # Manifest es dict: site_name -> info
-    items: list[tuple[str, dict[str, Any]]] = []
-
-    for site_name, info in manifest.items():
-        if site_name == "$schema":
-            continue
-        if not isinstance(info, dict):
-            continue
-        if no_nsfw and _is_nsfw(info):
-            continue
-        items.append((site_name, info))
-    total = len(items) * max(1, len(usernames))
+    sites = sherlock_sites(manifest, no_nsfw=no_nsfw)
+    total = len(sites) * max(1, len(usernames))
     if progress_callback:
         # Primer tick: permite inicializar la UI.
         progress_callback(0, total, "")
 
     async with build_async_client(settings) as client:
 
-        async def check(site_name: str, info: dict[str, Any], username: str) -> SocialProfile | None:
-            url_t = info.get("url")
-            if not isinstance(url_t, str) or not url_t:
+        async def check(site: SherlockSite, username: str) -> SocialProfile | None:
+            if site.url_template is None:
                 return None
 
-            url = _interpolate(url_t, username)
-            error_type = info.get("errorType")
-            if isinstance(error_type, str):
-                error_types = [error_type]
-            elif isinstance(error_type, list):
-                error_types = [t for t in error_type if isinstance(t, str)]
-            else:
-                error_types = []
-
-            headers = info.get("headers") if isinstance(info.get("headers"), dict) else None
-            request_method = info.get("request_method")
-            if not isinstance(request_method, str):
-                request_method = "GET"
-            request_method = request_method.upper()
+            url = _interpolate(site.url_template, username)
+            error_types = site.error_types
+            request_method = site.request_method
 
             async with sem:
                 try:
@@ -131,7 +183,7 @@ async def run_sherlock_username(
                         request_method,
                         url,
                         rate_limiter,
-                        headers=headers,
+                        headers=site.headers,
                     )
                     text = "" if request_method == "HEAD" else (resp.text or "")
 
@@ -144,14 +196,7 @@ async def run_sherlock_username(
                         exists = 200 <= status < 300
 
                     if "status_code" in error_types and exists is None:
-                        error_codes = info.get("errorCode")
-                        if isinstance(error_codes, int):
-                            error_codes = [error_codes]
-                        if isinstance(error_codes, list):
-                            error_codes = [c for c in error_codes if isinstance(c, int)]
-                        else:
-                            error_codes = None
-
+                        error_codes = site.error_codes
                         if status < 200 or status >= 300:
                             exists = False
                         elif error_codes and status in error_codes:
@@ -160,9 +205,8 @@ async def run_sherlock_username(
                             exists = True
 
                     if "message" in error_types and exists is None:
-                        error_msg = info.get("errorMsg")
                         # Si el errorMsg aparece, entonces NO existe.
-                        exists = not _contains_any(text, error_msg)
+                        exists = not _contains_any(text, site.error_msg)
 
                     if exists is None:
                         # Fallback conservador
@@ -171,12 +215,12 @@ async def run_sherlock_username(
                     if not exists:
                         return None
 
-                    html_meta = extract_html_metadata(html=text, base_url=final_url)
+                    html_meta = extract_html_metadata(html=text, base_url=resp.url)
                     metadata: dict[str, Any] = {
                         "source": "sherlock",
-                        "site_name": site_name,
-                        "url_main": info.get("urlMain"),
-                        "errorType": error_types,
+                        "site_name": site.name,
+                        "url_main": site.url_main,
+                        "errorType": list(error_types),
                         "status_code": status,
                         "final_url": final_url,
                         **html_meta,
@@ -185,22 +229,22 @@ async def run_sherlock_username(
                     return SocialProfile(
                         url=final_url,
                         username=username,
-                        network_name=_slug(site_name),
+                        network_name=site.network_name,
                         exists=True,
                         metadata=metadata,
                         bio=html_meta.get("meta_description"),
                         image_url=html_meta.get("og_image"),
                     )
                 except Exception as exc:
-                    logger.debug("Sherlock check failed for %s on %s: %s", username, site_name, exc)
+                    logger.debug("Sherlock check failed for %s on %s: %s", username, site.name, exc)
                     return exc  # Return exception to count it
 
         tasks: list[asyncio.Future[SocialProfile | None]] = []
         task_labels: dict[asyncio.Future[SocialProfile | None], str] = {}
-        for name, info in items:
+        for site in sites:
             for username in usernames:
-                label = f"sherlock:{name}:{username}"
-                t = asyncio.create_task(check(name, info, username), name=label)
+                label = f"sherlock:{site.name}:{username}"
+                t = asyncio.create_task(check(site, username), name=label)
                 tasks.append(t)
                 task_labels[t] = label
 
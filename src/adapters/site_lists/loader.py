@@ -4,6 +4,13 @@ Soporta formatos tipo:
 - Username: {"sites": [...]} (WhatsMyName wmn-data.json)
 - Email:    {"sites": [...]} (email-data.json)
 
+Rendimiento:
+- `model_validate_json` sobre los bytes del archivo: pydantic-core parsea y
+  valida en una sola pasada (Rust), sin `json.loads` ni el dict intermedio.
+- El resultado se memoiza por (ruta, mtime, tamaño): hunts repetidos en el mismo
+  proceso (agente, wizard) no releen ni revalidan listas de cientos de sitios.
+  Si el archivo cambia en disco, la clave cambia y se vuelve a cargar.
+
 Nota legal:
 - El repo no incluye datasets. El usuario puede descargarlos y apuntar a rutas
   locales mediante env vars o flags.
@@ -11,19 +18,31 @@ Nota legal:
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel
 
 from adapters.site_lists.models import EmailSitesFile, UsernameSitesFile
 
 
+_M = TypeVar("_M", bound=BaseModel)
+
+
+@lru_cache(maxsize=8)
+def _load_cached(model: type[_M], path: str, mtime_ns: int, size: int) -> _M:
+    return model.model_validate_json(Path(path).read_bytes())
+
+
+def _load(model: type[_M], path: Path) -> _M:
+    st = path.stat()
+    return _load_cached(model, str(path.resolve()), st.st_mtime_ns, st.st_size)
+
+
 def load_username_sites(path: Path) -> UsernameSitesFile:
-    raw = path.read_text(encoding="utf-8")
-    data = json.loads(raw)
-    return UsernameSitesFile.model_validate(data)
+    return _load(UsernameSitesFile, path)
 
 
 def load_email_sites(path: Path) -> EmailSitesFile:
-    raw = path.read_text(encoding="utf-8")
-    data = json.loads(raw)
-    return EmailSitesFile.model_validate(data)
+    return _load(EmailSitesFile, path)
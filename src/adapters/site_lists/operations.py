@@ -6,9 +6,14 @@ Implementa un subset práctico de operaciones comunes.
 from __future__ import annotations
 
 import hashlib
+from functools import lru_cache
 from urllib.parse import quote
 
 
+# Memoizada: el runner aplica la misma operación al mismo email en cada sitio de
+# la lista; el digest se calcula una vez por (valor, operación).
+# Los hashes se mantienen (md5/sha1/sha256): son los que espera cada sitio remoto.
+@lru_cache(maxsize=1024)
 def apply_input_operation(value: str, operation: str | None) -> str:
     v = value
     if operation is None:
@@ -98,6 +98,9 @@ async def run_username_sites(
                     resp = await request_with_retry(
                         client, "GET", url, rate_limiter,
                     )
+                    if resp.status_code != site.e_code:
+                        # La mayoría de sitios descarta por status: sin decodificar el body.
+                        return None
                     text = resp.text or ""
 
                     found = _match_found(
@@ -111,7 +114,7 @@ async def run_username_sites(
                     if not found:
                         return None
 
-                    html_meta = extract_html_metadata(html=text, base_url=str(resp.url))
+                    html_meta = extract_html_metadata(html=text, base_url=resp.url)
 
                     metadata: dict[str, Any] = {
                         "status_code": resp.status_code,
@@ -188,6 +191,8 @@ async def run_email_sites(
                         headers=headers,
                         content=data,
                     )
+                    if resp.status_code != site.e_code:
+                        return None
 
                     text = resp.text or ""
                     found = _match_found(
@@ -201,7 +206,7 @@ async def run_email_sites(
                     if not found:
                         return None
 
-                    html_meta = extract_html_metadata(html=text, base_url=str(resp.url))
+                    html_meta = extract_html_metadata(html=text, base_url=resp.url)
 
                     metadata: dict[str, Any] = {
                         "status_code": resp.status_code,
@@ -5,53 +5,141 @@ Objetivo:
 - Reducir scraping HTML cuando hay endpoints JSON oficiales.
 
 Estos scrapers están en adapters porque son I/O puro (HTTP).
+Usan el cliente compartido (`get_shared_client`): perfil + actividad van al mismo
+host y reutilizan la conexión (keep-alive / HTTP/2) en vez de un handshake por llamada.
+Los headers específicos de cada API se pasan por petición.
+El JSON se decodifica con `response_json` (orjson si está instalado).
+
+Cache: las respuestas definitivas (200/404) se guardan en memoria con TTL corto
+(`API_CACHE`); re-enriquecer el mismo handle en la sesión no repite el GET.
+Un 403/429/5xx no se cachea. `bypass_cache=True` fuerza la consulta.
+
+429/503: se reintenta respetando `Retry-After` (o backoff exponencial con jitter)
+hasta `settings.retry_max_attempts`, igual que los site-lists. Si el servidor pide
+esperar más de `_MAX_RETRY_WAIT_SECONDS` no se bloquea el hunt: se devuelve la respuesta.
+
+Concurrencia por host: con muchos handles (hunt con varios usernames, agente) las
+llamadas a api.github.com / reddit.com comparten un `DomainRateLimiter` por event
+loop, acotado a `settings.per_domain_concurrency`, sobre el mismo pool caliente.
 """
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
-
-
-async def fetch_github_user(*, username: str, settings: AppSettings | None = None) -> dict[str, Any] | None:
-    settings = settings or AppSettings()
+import httpx
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+from adapters.http_client import get_shared_client, response_json
+from adapters.rate_limiter import DomainRateLimiter, parse_retry_after
+from adapters.ttl_cache import TTLCache
+from core.config import AppSettings, get_settings
+
+
+# Clave: URL consultada. Valor: resultado ya normalizado (dict/list o None si 404).
+API_CACHE: TTLCache[Any] = TTLCache(maxsize=2048, ttl_seconds=600.0)
+_CACHEABLE_STATUS = frozenset({200, 404})
+_MISS = object()
+_MAX_RETRY_WAIT_SECONDS = 30.0
+
+# Un limiter por (event loop, concurrencia por dominio): se comparte entre todas las
+# llamadas del mismo comando. Sin delay/jitter: solo acota peticiones simultáneas.
+_LIMITER_CACHE: dict[tuple[int, int], tuple[asyncio.AbstractEventLoop, DomainRateLimiter]] = {}
+
+
+def _get_limiter(settings: AppSettings) -> DomainRateLimiter:
+    loop = asyncio.get_running_loop()
+    key = (id(loop), settings.per_domain_concurrency)
+    cached = _LIMITER_CACHE.get(key)
+    if cached is not None and cached[0] is loop:
+        return cached[1]
+    for stale_key, (stale_loop, _) in list(_LIMITER_CACHE.items()):
+        if stale_loop.is_closed():
+            _LIMITER_CACHE.pop(stale_key, None)
+    limiter = DomainRateLimiter(
+        per_domain_concurrency=settings.per_domain_concurrency,
+        delay_ms=0,
+        jitter_ms=0,
+    )
+    _LIMITER_CACHE[key] = (loop, limiter)
+    return limiter
+
+
+async def _get_with_backoff(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    headers: dict[str, str],
+    settings: AppSettings,
+) -> httpx.Response:
+    max_retries = settings.retry_max_attempts
+    limiter = _get_limiter(settings)
+    attempt = 0
+    while True:
+        # El slot se libera antes del backoff: esperar no ocupa concurrencia del host.
+        async with limiter.throttle(url):
+            resp = await client.get(url, headers=headers)
+        if not DomainRateLimiter.should_retry(resp.status_code) or attempt >= max_retries:
+            return resp
+        retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+        if retry_after is not None and retry_after > _MAX_RETRY_WAIT_SECONDS:
+            return resp
+        await asyncio.sleep(DomainRateLimiter.backoff_delay(attempt, retry_after))
+        attempt += 1
+
+
+async def fetch_github_user(
+    *,
+    username: str,
+    settings: AppSettings | None = None,
+    bypass_cache: bool = False,
+) -> dict[str, Any] | None:
+    settings = settings or get_settings()
     url = f"https://api.github.com/users/{username}"
+    if not bypass_cache:
+        cached = API_CACHE.get(url, _MISS)
+        if cached is not _MISS:
+            return cached
     headers = {
         # GitHub requiere UA. Accept JSON versión estable.
         "Accept": "application/vnd.github+json",
     }
 
-    async with build_async_client(settings, extra_headers=headers) as client:
-        resp = await client.get(url)
-
-    if resp.status_code == 404:
-        return None
-    if resp.status_code != 200:
-        return None
-
-    data = resp.json()
-    # Campos útiles (si existen)
-    return {
-        "api": "github",
-        "login": data.get("login"),
-        "name": data.get("name"),
-        "bio": data.get("bio"),
-        "company": data.get("company"),
-        "location": data.get("location"),
-        "blog": data.get("blog"),
-        "email": data.get("email"),
-        "twitter_username": data.get("twitter_username"),
-        "avatar_url": data.get("avatar_url"),
-        "html_url": data.get("html_url"),
-        "public_repos": data.get("public_repos"),
-        "followers": data.get("followers"),
-        "following": data.get("following"),
-        "created_at": data.get("created_at"),
-        "updated_at": data.get("updated_at"),
-    }
+    client = get_shared_client(settings)
+    resp = await _get_with_backoff(client, url, headers=headers, settings=settings)
+
+    result = _parse_github_user(response_json(resp)) if resp.status_code == 200 else None
+    if resp.status_code in _CACHEABLE_STATUS:
+        API_CACHE.set(url, result)
+    return result
+
+
+# Campos útiles del perfil (si existen); el resto del payload se descarta.
+_GITHUB_USER_FIELDS = (
+    "login",
+    "name",
+    "bio",
+    "company",
+    "location",
+    "blog",
+    "email",
+    "twitter_username",
+    "avatar_url",
+    "html_url",
+    "public_repos",
+    "followers",
+    "following",
+    "created_at",
+    "updated_at",
+)
+
+
+def _parse_github_user(data: dict[str, Any]) -> dict[str, Any]:
+    result: dict[str, Any] = {"api": "github"}
+    result.update({field: data.get(field) for field in _GITHUB_USER_FIELDS})
+    return result
 
 
 async def fetch_github_recent_events(
@@ -59,6 +147,7 @@ async def fetch_github_recent_events(
     username: str,
     limit: int = 10,
     settings: AppSettings | None = None,
+    bypass_cache: bool = False,
 ) -> list[dict[str, Any]]:
     """Extrae eventos públicos recientes (útil para commits en PushEvent).
 
@@ -67,16 +156,21 @@ async def fetch_github_recent_events(
     - No inferimos atributos sensibles; solo capturamos evidencia textual/temporal.
     """
 
-    settings = settings or AppSettings()
+    settings = settings or get_settings()
     url = f"https://api.github.com/users/{username}/events/public"
     headers = {"Accept": "application/vnd.github+json"}
+    cache_key = (url, max(0, int(limit)))
+    if not bypass_cache:
+        cached = API_CACHE.get(cache_key, _MISS)
+        if cached is not _MISS:
+            return cached
 
     try:
-        async with build_async_client(settings, extra_headers=headers) as client:
-            resp = await client.get(url)
+        client = get_shared_client(settings)
+        resp = await _get_with_backoff(client, url, headers=headers, settings=settings)
         if resp.status_code != 200:
             return []
-        data = resp.json()
+        data = response_json(resp)
         if not isinstance(data, list):
             return []
         out: list[dict[str, Any]] = []
@@ -84,6 +178,7 @@ async def fetch_github_recent_events(
             if not isinstance(ev, dict):
                 continue
             out.append(ev)
+        API_CACHE.set(cache_key, out)
         return out
     except Exception:
         return []
@@ -94,15 +189,22 @@ async def fetch_github_deep(
     username: str,
     limit_events: int = 10,
     settings: AppSettings | None = None,
+    bypass_cache: bool = False,
 ) -> dict[str, Any] | None:
     """Combina perfil base + actividad reciente (mensajes de commits si hay PushEvent)."""
 
-    settings = settings or AppSettings()
-    base = await fetch_github_user(username=username, settings=settings)
+    settings = settings or get_settings()
+    # Perfil y eventos son independientes: en paralelo sobre el mismo pool (una
+    # sola ventana de RTT). Si el perfil no existe, los eventos se descartan.
+    base, events = await asyncio.gather(
+        fetch_github_user(username=username, settings=settings, bypass_cache=bypass_cache),
+        fetch_github_recent_events(
+            username=username, limit=limit_events, settings=settings, bypass_cache=bypass_cache
+        ),
+    )
     if base is None:
         return None
 
-    events = await fetch_github_recent_events(username=username, limit=limit_events, settings=settings)
     commits: list[dict[str, Any]] = []
     for ev in events:
         if ev.get("type") != "PushEvent":
@@ -125,9 +227,18 @@ async def fetch_github_deep(
     }
 
 
-async def fetch_reddit_user_about(*, username: str, settings: AppSettings | None = None) -> dict[str, Any] | None:
-    settings = settings or AppSettings()
+async def fetch_reddit_user_about(
+    *,
+    username: str,
+    settings: AppSettings | None = None,
+    bypass_cache: bool = False,
+) -> dict[str, Any] | None:
+    settings = settings or get_settings()
     url = f"https://www.reddit.com/user/{username}/about.json"
+    if not bypass_cache:
+        cached = API_CACHE.get(url, _MISS)
+        if cached is not _MISS:
+            return cached
 
     # Reddit suele exigir UA decente.
     headers = {
@@ -136,15 +247,16 @@ async def fetch_reddit_user_about(*, username: str, settings: AppSettings | None
         "User-Agent": "Mozilla/5.0 (compatible; OSINT-D2/1.0)",
     }
 
-    async with build_async_client(settings, extra_headers=headers) as client:
-        resp = await client.get(url)
+    client = get_shared_client(settings)
+    resp = await _get_with_backoff(client, url, headers=headers, settings=settings)
 
-    if resp.status_code == 404:
-        return None
-    if resp.status_code != 200:
-        return None
+    result = _parse_reddit_about(response_json(resp)) if resp.status_code == 200 else None
+    if resp.status_code in _CACHEABLE_STATUS:
+        API_CACHE.set(url, result)
+    return result
 
-    data = resp.json()
+
+def _parse_reddit_about(data: Any) -> dict[str, Any] | None:
     if not isinstance(data, dict):
         return None
 
@@ -176,11 +288,48 @@ async def fetch_reddit_user_about(*, username: str, settings: AppSettings | None
     }
 
 
+class _RedditCommentData(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    body: str
+    # Se conservan tal cual llegan (sin coerción), igual que antes con `.get()`.
+    subreddit: Any = None
+    created_utc: Any = None
+    permalink: Any = None
+
+
+class _RedditChild(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    data: _RedditCommentData
+
+
+_REDDIT_CHILDREN_ADAPTER = TypeAdapter(list[_RedditChild])
+
+
+def _parse_reddit_children(children: list[Any]) -> list[_RedditChild]:
+    """Valida los `children` en una sola llamada a pydantic-core; los malformados se descartan."""
+
+    try:
+        return _REDDIT_CHILDREN_ADAPTER.validate_python(children)
+    except ValidationError:
+        pass
+    # Camino lento solo si algún elemento no valida: conservar los válidos.
+    parsed: list[_RedditChild] = []
+    for child in children:
+        try:
+            parsed.append(_RedditChild.model_validate(child))
+        except ValidationError:
+            continue
+    return parsed
+
+
 async def fetch_reddit_recent_comments(
     *,
     username: str,
     limit: int = 10,
     settings: AppSettings | None = None,
+    bypass_cache: bool = False,
 ) -> dict[str, Any] | None:
     """Extrae comentarios recientes (texto crudo + subreddit).
 
@@ -189,19 +338,24 @@ async def fetch_reddit_recent_comments(
     - Puede devolver 429/403 dependiendo de Reddit.
     """
 
-    settings = settings or AppSettings()
-    url = f"https://www.reddit.com/user/{username}/comments.json?limit={max(1, int(limit))}"
+    settings = settings or get_settings()
+    limit = max(1, int(limit))
+    url = f"https://www.reddit.com/user/{username}/comments.json?limit={limit}"
     headers = {
         "Accept": "application/json",
         "User-Agent": "Mozilla/5.0 (compatible; OSINT-D2/1.0)",
     }
+    if not bypass_cache:
+        cached = API_CACHE.get(url, _MISS)
+        if cached is not _MISS:
+            return cached
 
     try:
-        async with build_async_client(settings, extra_headers=headers) as client:
-            resp = await client.get(url)
+        client = get_shared_client(settings)
+        resp = await _get_with_backoff(client, url, headers=headers, settings=settings)
         if resp.status_code != 200:
             return None
-        data = resp.json()
+        data = response_json(resp)
         if not isinstance(data, dict):
             return None
         payload = data.get("data")
@@ -213,28 +367,19 @@ async def fetch_reddit_recent_comments(
 
         comments: list[dict[str, Any]] = []
         subreddits: set[str] = set()
-        for child in children:
-            if not isinstance(child, dict):
+        # Reddit puede ignorar `limit` (o devolver 25 por defecto): no recorrer de más.
+        for child in _parse_reddit_children(children[:limit]):
+            c = child.data
+            if not c.body.strip():
                 continue
-            c = child.get("data")
-            if not isinstance(c, dict):
-                continue
-            body = c.get("body")
-            if not isinstance(body, str) or not body.strip():
-                continue
-            sr = c.get("subreddit")
+            sr = c.subreddit
             if isinstance(sr, str) and sr:
                 subreddits.add(sr)
-            comments.append(
-                {
-                    "body": body,
-                    "subreddit": sr,
-                    "created_utc": c.get("created_utc"),
-                    "permalink": c.get("permalink"),
-                }
-            )
-
-        return {"recent_comments": comments, "subreddits": sorted(subreddits)}
+            comments.append(c.model_dump())
+
+        result = {"recent_comments": comments, "subreddits": sorted(subreddits)}
+        API_CACHE.set(url, result)
+        return result
     except Exception:
         return None
 
@@ -244,15 +389,20 @@ async def fetch_reddit_deep(
     username: str,
     limit_comments: int = 10,
     settings: AppSettings | None = None,
+    bypass_cache: bool = False,
 ) -> dict[str, Any] | None:
     """Combina about.json + comentarios recientes."""
 
-    settings = settings or AppSettings()
-    about = await fetch_reddit_user_about(username=username, settings=settings)
+    settings = settings or get_settings()
+    about, comments = await asyncio.gather(
+        fetch_reddit_user_about(username=username, settings=settings, bypass_cache=bypass_cache),
+        fetch_reddit_recent_comments(
+            username=username, limit=limit_comments, settings=settings, bypass_cache=bypass_cache
+        ),
+    )
     if about is None:
         return None
 
-    comments = await fetch_reddit_recent_comments(username=username, limit=limit_comments, settings=settings)
     return {
         **about,
         **(comments or {}),
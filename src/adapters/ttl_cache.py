@@ -0,0 +1,66 @@
+"""Cache en memoria (TTL + LRU) para respuestas deterministas de fuentes externas.
+
+Por qué:
+- Gravatar, la API de GitHub o `about.json` de Reddit responden lo mismo para la
+  misma clave durante minutos/horas; repetir el GET en la misma sesión solo añade
+  latencia y consumo de rate limit.
+- Acotado en tamaño (LRU) y en tiempo (TTL) para no crecer sin límite.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+
+V = TypeVar("V")
+D = TypeVar("D")
+
+
+class TTLCache(Generic[V]):
+    """LRU con expiración por entrada.
+
+    Guarda y devuelve copias (`copy_value`, por defecto `copy.deepcopy`): los
+    llamadores pueden mutar el valor sin contaminar el cache. `None` es un valor
+    cacheable; para distinguir un fallo usar `get(key, default)` con un centinela.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 10_000,
+        ttl_seconds: float = 86_400.0,
+        clock: Callable[[], float] = time.monotonic,
+        copy_value: Callable[[V], V] = copy.deepcopy,
+    ) -> None:
+        self._maxsize = max(1, maxsize)
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._copy = copy_value
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: V | D | None = None) -> V | D | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            self._data.pop(key, None)
+            return default
+        self._data.move_to_end(key)
+        return self._copy(value)
+
+    def set(self, key: Hashable, value: V) -> None:
+        self._data[key] = (self._clock() + self._ttl, self._copy(value))
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,27 @@
+"""Presets de proveedores de IA (base_url + modelo) compartidos por la CLI.
+
+Tabla única e inmutable: `--ai-provider`, los wizards y `doctor setup-ai` leían
+cada uno su propia copia, reconstruida en cada llamada.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+
+AI_PROVIDER_PRESETS: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        # Nota: los modelos disponibles cambian según el proveedor/plan.
+        "deepseek": {"base_url": "https://api.deepseek.com", "model": "deepseek-chat"},
+        # Calidad (si no está disponible, el runtime hace fallback automático a un modelo más común):
+        "groq": {"base_url": "https://api.groq.com/openai/v1", "model": "llama-3.1-70b-versatile"},
+        "groq-70b": {"base_url": "https://api.groq.com/openai/v1", "model": "llama-3.1-70b-versatile"},
+        # Velocidad (más barato/rápido):
+        "groq-fast": {"base_url": "https://api.groq.com/openai/v1", "model": "llama-3.1-8b-instant"},
+        "openrouter": {"base_url": "https://openrouter.ai/api/v1", "model": "openai/gpt-4o-mini"},
+        "huggingface": {"base_url": "https://api-inference.huggingface.co/v1", "model": "meta-llama/Llama-3.1-8B-Instruct"},
+        # Local (gratis, privado, requiere instalar Ollama):
+        "ollama": {"base_url": "http://localhost:11434/v1", "model": "llama3"},
+    }
+)
@@ -5,25 +5,28 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
+import httpx
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from adapters.http_client import build_async_client
-from adapters.report_exporter import export_person_pdf
+from cli.ai_presets import AI_PROVIDER_PRESETS
 from core.config import AppSettings, write_user_env_vars
-from core.domain.language import Language
-from core.domain.models import PersonEntity
 
 app = typer.Typer(no_args_is_help=True, help="Environment diagnostics and configuration checks.")
 
 _console = Console()
 
 
-async def _check_http(url: str) -> tuple[bool, str]:
+# Sondas de red: comparten un cliente y un único event loop.
+_HTTP_PROBES: dict[str, str] = {
+    "HTTP connectivity": "https://github.com",
+}
+
+
+async def _check_http(client: httpx.AsyncClient, url: str) -> tuple[bool, str]:
     try:
-        async with build_async_client() as client:
-            response = await client.get(url)
+        response = await client.get(url)
         return True, f"HTTP {response.status_code}"
     except Exception as exc:
         return False, str(exc)
@@ -32,6 +35,11 @@ async def _check_http(url: str) -> tuple[bool, str]:
 def _check_pdf() -> tuple[bool, str]:
     """Attempt to generate a minimal PDF to detect WeasyPrint issues."""
 
+    # Import diferido: solo `doctor run` necesita el exportador (y WeasyPrint).
+    from adapters.report_exporter import export_person_pdf
+    from core.domain.language import Language
+    from core.domain.models import PersonEntity
+
     try:
         tmp = Path("reports") / "_doctor_test.pdf"
         person = PersonEntity(target="doctor", profiles=[])
@@ -45,10 +53,24 @@ def _check_pdf() -> tuple[bool, str]:
         return False, str(exc)
 
 
+async def _run_checks(settings: AppSettings) -> dict[str, tuple[bool, str]]:
+    """Ejecuta las sondas de red y el check de PDF (en un hilo) en paralelo."""
+
+    async with build_async_client(settings) as client:
+        names = [*_HTTP_PROBES, "WeasyPrint PDF"]
+        results = await asyncio.gather(
+            *(_check_http(client, url) for url in _HTTP_PROBES.values()),
+            asyncio.to_thread(_check_pdf),
+        )
+    return dict(zip(names, results))
+
+
 @app.command()
 def run() -> None:
     """Run baseline diagnostics and show recommended fixes."""
 
+    from rich.table import Table
+
     settings = AppSettings()
 
     table = Table(title="OSINT-D2 Doctor")
@@ -68,13 +90,11 @@ def run() -> None:
     table.add_row("AI base_url", "OK", settings.ai_base_url)
     table.add_row("AI model", "OK", settings.ai_model)
 
-    # Connectivity (best-effort)
-    ok_http, detail_http = asyncio.run(_check_http("https://github.com"))
-    table.add_row("HTTP connectivity", "OK" if ok_http else "FAIL", detail_http)
-
-    # PDF
-    ok_pdf, detail_pdf = _check_pdf()
-    table.add_row("WeasyPrint PDF", "OK" if ok_pdf else "FAIL", detail_pdf)
+    # Connectivity (best-effort) + PDF: un solo asyncio.run para todos los checks.
+    results = asyncio.run(_run_checks(settings))
+    for name, (ok, detail) in results.items():
+        table.add_row(name, "OK" if ok else "FAIL", detail)
+    ok_pdf = results["WeasyPrint PDF"][0]
 
     # Proxy (ScrapingAnt)
     proxy_mode = settings.effective_proxy_mode
@@ -109,24 +129,13 @@ def setup_ai() -> None:
         show_default=True,
     ).strip().lower()
 
-    presets: dict[str, dict[str, str]] = {
-        "deepseek": {"OSINT_D2_AI_BASE_URL": "https://api.deepseek.com", "OSINT_D2_AI_MODEL": "deepseek-chat"},
-        # Calidad (más lento, mejor para informes):
-        "groq": {"OSINT_D2_AI_BASE_URL": "https://api.groq.com/openai/v1", "OSINT_D2_AI_MODEL": "llama-3.1-70b-versatile"},
-        "groq-70b": {"OSINT_D2_AI_BASE_URL": "https://api.groq.com/openai/v1", "OSINT_D2_AI_MODEL": "llama-3.1-70b-versatile"},
-        # Velocidad:
-        "groq-fast": {"OSINT_D2_AI_BASE_URL": "https://api.groq.com/openai/v1", "OSINT_D2_AI_MODEL": "llama-3.1-8b-instant"},
-        "openrouter": {"OSINT_D2_AI_BASE_URL": "https://openrouter.ai/api/v1", "OSINT_D2_AI_MODEL": "openai/gpt-4o-mini"},
-        "huggingface": {"OSINT_D2_AI_BASE_URL": "https://api-inference.huggingface.co/v1", "OSINT_D2_AI_MODEL": "meta-llama/Llama-3.1-8B-Instruct"},
-        "ollama": {"OSINT_D2_AI_BASE_URL": "http://localhost:11434/v1", "OSINT_D2_AI_MODEL": "llama3"},
-    }
-
-    values = presets.get(provider, {}).copy()
-    if not values:
+    preset = AI_PROVIDER_PRESETS.get(provider)
+    if preset is None:
         _console.print("[yellow]Unknown provider preset. You can still enter custom values.[/yellow]")
+        preset = {}
 
-    base_url = typer.prompt("AI base URL", default=values.get("OSINT_D2_AI_BASE_URL", ""), show_default=True).strip()
-    model = typer.prompt("AI model", default=values.get("OSINT_D2_AI_MODEL", ""), show_default=True).strip()
+    base_url = typer.prompt("AI base URL", default=preset.get("base_url", ""), show_default=True).strip()
+    model = typer.prompt("AI model", default=preset.get("model", ""), show_default=True).strip()
     api_key = typer.prompt("AI API key", hide_input=True, confirmation_prompt=False).strip()
 
     if not base_url or not model:
@@ -35,12 +35,14 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 
-from adapters.ai_analyst import analyze_person
+from adapters.ai_analyst import aclose_ai_clients, analyze_person
+from adapters.http_client import close_shared_clients
 from adapters.json_exporter import export_person_json
-from adapters.report_exporter import export_person_html, export_person_pdf
+from adapters.report_exporter import export_person_html, export_person_pdf_async, render_person_html
+from cli.ai_presets import AI_PROVIDER_PRESETS
 from cli.doctor import app as doctor_app
 from cli.ui_components import build_analysis_panel, build_breaches_table, build_profiles_table, print_banner
-from core.config import AppSettings, write_user_env_vars
+from core.config import AppSettings, get_settings, write_user_env_vars
 from core.domain.language import Language
 from core.domain.models import PersonEntity
 from core.resources_loader import get_default_list_path
@@ -85,13 +87,15 @@ def _apply_proxy_overrides(
     if no_proxy:
         os.environ["OSINT_D2_PROXY_MODE"] = ""
         os.environ["OSINT_D2_PROXY_API_KEY"] = ""
-        return AppSettings()
+        get_settings.cache_clear()
+        return get_settings()
     if proxy:
         os.environ["OSINT_D2_PROXY_MODE"] = proxy
     if proxy_country:
         os.environ["OSINT_D2_PROXY_COUNTRY"] = proxy_country
     if proxy or proxy_country:
-        return AppSettings()
+        get_settings.cache_clear()
+        return get_settings()
     return settings
 
 
@@ -105,21 +109,6 @@ def _print_proxy_status(settings: AppSettings, console: Console) -> None:
         )
 
 
-AI_PROVIDER_PRESETS: dict[str, dict[str, str]] = {
-    # Nota: los modelos disponibles cambian según el proveedor/plan.
-    "deepseek": {"base_url": "https://api.deepseek.com", "model": "deepseek-chat"},
-    # Calidad (si no está disponible, el runtime hace fallback automático a un modelo más común):
-    "groq": {"base_url": "https://api.groq.com/openai/v1", "model": "llama-3.1-70b-versatile"},
-    "groq-70b": {"base_url": "https://api.groq.com/openai/v1", "model": "llama-3.1-70b-versatile"},
-    # Velocidad (más barato/rápido):
-    "groq-fast": {"base_url": "https://api.groq.com/openai/v1", "model": "llama-3.1-8b-instant"},
-    "openrouter": {"base_url": "https://openrouter.ai/api/v1", "model": "openai/gpt-4o-mini"},
-    "huggingface": {"base_url": "https://api-inference.huggingface.co/v1", "model": "meta-llama/Llama-3.1-8B-Instruct"},
-    # Local (gratis, privado, requiere instalar Ollama):
-    "ollama": {"base_url": "http://localhost:11434/v1", "model": "llama3"},
-}
-
-
 def _configure_ai_for_run(
     *,
     settings: AppSettings,
@@ -177,7 +166,8 @@ def _configure_ai_for_run(
         )
         console.print(f"[green]AI config saved to:[/green] {env_path}")
 
-    return AppSettings()
+    get_settings.cache_clear()
+    return get_settings()
 
 try:
     signal.signal(signal.SIGPIPE, signal.SIG_DFL)
@@ -349,7 +339,7 @@ def _print_breaches_table(*, person: PersonEntity) -> None:
         _console.print(table)
 
 
-def _handle_exports(
+async def _handle_exports(
     *,
     person: PersonEntity,
     console: Console,
@@ -363,15 +353,18 @@ def _handle_exports(
     safe_name = sanitize_target_for_filename(person.target)
 
     if export_pdf:
+        # Se renderiza una sola vez: el fallback HTML reutiliza el mismo documento.
+        html: str | None = None
         try:
             out_path = Path("reports") / f"{safe_name}.pdf"
-            export_person_pdf(person=person, output_path=out_path, language=language)
+            html = render_person_html(person=person, language=language)
+            await export_person_pdf_async(person=person, output_path=out_path, language=language, html=html)
             console.print(f"\n[green]PDF generated:[/green] {out_path}")
         except Exception as exc:
             console.print(f"\n[red]PDF export failed:[/red] {exc}")
             html_path = Path("reports") / f"{safe_name}.html"
             try:
-                export_person_html(person=person, output_path=html_path, language=language)
+                export_person_html(person=person, output_path=html_path, language=language, html=html)
                 console.print(f"[yellow]Fallback HTML generated:[/yellow] {html_path}")
             except Exception as html_exc:
                 console.print(f"[red]HTML export failed:[/red] {html_exc}")
@@ -526,6 +519,7 @@ async def _hunt_async(
         close_status()
         if progress:
             progress.__exit__(None, None, None)
+        await close_shared_clients()
 
     person = result.person
     primary_usernames: list[str] = list(usernames or []) or ([result.usernames[0]] if result.usernames else [])
@@ -563,7 +557,7 @@ async def _hunt_async(
             language=language,
         )
 
-    _handle_exports(
+    await _handle_exports(
         person=person,
         console=console,
         export_pdf=export_pdf,
@@ -604,6 +598,7 @@ async def _scan_async(
     finally:
         if status_ctx:
             status_ctx.__exit__(None, None, None)
+        await close_shared_clients()
 
     person = result.person
 
@@ -639,7 +634,7 @@ async def _scan_async(
             language=language,
         )
 
-    _handle_exports(
+    await _handle_exports(
         person=person,
         console=console,
         export_pdf=export_pdf,
@@ -684,6 +679,7 @@ async def _scan_email_async(
     finally:
         if status_ctx:
             status_ctx.__exit__(None, None, None)
+        await close_shared_clients()
 
     person = result.person
 
@@ -700,7 +696,7 @@ async def _scan_email_async(
             language=language,
         )
 
-    _handle_exports(
+    await _handle_exports(
         person=person,
         console=console,
         export_pdf=export_pdf,
@@ -765,6 +761,8 @@ async def _analyze_async(
             sys.stdout.flush()
     except Exception as exc:
         console.print(f"\n[red]AI analysis failed:[/red] {exc}")
+    finally:
+        await aclose_ai_clients()
 
     if output_format == OutputFormat.json and not human:
         sys.stdout.write(_dump_person_json(person=person, include_raw=include_raw_in_json))
@@ -1371,13 +1369,16 @@ async def _agent_async(
         on_step=on_step,
     )
 
-    with console.status("[bold green]Agent is thinking...", spinner="dots"):
-        result = await engine.run(
-            objective,
-            language=language,
-            max_steps=max_steps,
-            trust_anchors=trust_anchors,
-        )
+    try:
+        with console.status("[bold green]Agent is thinking...", spinner="dots"):
+            result = await engine.run(
+                objective,
+                language=language,
+                max_steps=max_steps,
+                trust_anchors=trust_anchors,
+            )
+    finally:
+        await close_shared_clients()
 
     console.print()
     person = result.person
@@ -1459,7 +1460,7 @@ async def _agent_async(
         )
 
     # Exports.
-    _handle_exports(
+    await _handle_exports(
         person=person,
         console=console,
         export_pdf=export_pdf,
@@ -1537,17 +1538,9 @@ def wizard() -> None:
                     default="deepseek",
                 ).strip().lower()
 
-                presets: dict[str, dict[str, str]] = {
-                    "deepseek": {"OSINT_D2_AI_BASE_URL": "https://api.deepseek.com", "OSINT_D2_AI_MODEL": "deepseek-chat"},
-                    "groq": {"OSINT_D2_AI_BASE_URL": "https://api.groq.com/openai/v1", "OSINT_D2_AI_MODEL": "llama-3.1-70b-versatile"},
-                    "groq-70b": {"OSINT_D2_AI_BASE_URL": "https://api.groq.com/openai/v1", "OSINT_D2_AI_MODEL": "llama-3.1-70b-versatile"},
-                    "groq-fast": {"OSINT_D2_AI_BASE_URL": "https://api.groq.com/openai/v1", "OSINT_D2_AI_MODEL": "llama-3.1-8b-instant"},
-                    "openrouter": {"OSINT_D2_AI_BASE_URL": "https://openrouter.ai/api/v1", "OSINT_D2_AI_MODEL": "openai/gpt-4o-mini"},
-                    "huggingface": {"OSINT_D2_AI_BASE_URL": "https://api-inference.huggingface.co/v1", "OSINT_D2_AI_MODEL": "meta-llama/Llama-3.1-8B-Instruct"},
-                }
-                preset = presets.get(provider, {})
-                base_url = Prompt.ask("AI base URL", default=preset.get("OSINT_D2_AI_BASE_URL", "")).strip()
-                model = Prompt.ask("AI model", default=preset.get("OSINT_D2_AI_MODEL", "")).strip()
+                preset = AI_PROVIDER_PRESETS.get(provider, {})
+                base_url = Prompt.ask("AI base URL", default=preset.get("base_url", "")).strip()
+                model = Prompt.ask("AI model", default=preset.get("model", "")).strip()
                 api_key = Prompt.ask("AI API key", password=True).strip()
 
                 if base_url and model and api_key:
@@ -1668,17 +1661,9 @@ def wizard() -> None:
                     default="groq",
                 ).strip().lower()
 
-                presets_classic: dict[str, dict[str, str]] = {
-                    "deepseek": {"OSINT_D2_AI_BASE_URL": "https://api.deepseek.com", "OSINT_D2_AI_MODEL": "deepseek-chat"},
-                    "groq": {"OSINT_D2_AI_BASE_URL": "https://api.groq.com/openai/v1", "OSINT_D2_AI_MODEL": "llama-3.1-70b-versatile"},
-                    "groq-70b": {"OSINT_D2_AI_BASE_URL": "https://api.groq.com/openai/v1", "OSINT_D2_AI_MODEL": "llama-3.1-70b-versatile"},
-                    "groq-fast": {"OSINT_D2_AI_BASE_URL": "https://api.groq.com/openai/v1", "OSINT_D2_AI_MODEL": "llama-3.1-8b-instant"},
-                    "openrouter": {"OSINT_D2_AI_BASE_URL": "https://openrouter.ai/api/v1", "OSINT_D2_AI_MODEL": "openai/gpt-4o-mini"},
-                    "huggingface": {"OSINT_D2_AI_BASE_URL": "https://api-inference.huggingface.co/v1", "OSINT_D2_AI_MODEL": "meta-llama/Llama-3.1-8B-Instruct"},
-                }
-                preset = presets_classic.get(provider, {})
-                base_url = Prompt.ask("AI base URL", default=preset.get("OSINT_D2_AI_BASE_URL", "")).strip()
-                model = Prompt.ask("AI model", default=preset.get("OSINT_D2_AI_MODEL", "")).strip()
+                preset = AI_PROVIDER_PRESETS.get(provider, {})
+                base_url = Prompt.ask("AI base URL", default=preset.get("base_url", "")).strip()
+                model = Prompt.ask("AI model", default=preset.get("model", "")).strip()
                 api_key = Prompt.ask("AI API key", password=True).strip()
 
                 if base_url and model and api_key:
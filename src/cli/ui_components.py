@@ -51,8 +51,9 @@ def build_analysis_panel(report: AnalysisReport) -> Panel:
     """Render the AI analysis report in a Rich panel."""
 
     title = Text("AI Analysis", style="bold bright_green")
-    body = Text()
-    body.append(report.summary.strip() + "\n")
+    # Número constante de spans (no uno por highlight). Sin `Text.from_markup`:
+    # el texto de la IA puede traer corchetes que Rich interpretaría como markup.
+    body = Text(report.summary.strip() + "\n")
 
     # Only append highlights if they aren't already embedded in the summary.
     summary_lower = report.summary.lower()
@@ -63,8 +64,7 @@ def build_analysis_panel(report: AnalysisReport) -> Panel:
     )
     if report.highlights and not highlights_in_summary:
         body.append("\nHighlights:\n", style="bold bright_green")
-        for h in report.highlights:
-            body.append(f"- {h}\n")
+        body.append("".join(f"- {h}\n" for h in report.highlights))
 
     body.append(f"\nConfidence: {report.confidence:.2f}")
     if report.model:
@@ -10,7 +10,9 @@ Nota: se implementará en la siguiente iteración.
 from __future__ import annotations
 
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field, SecretStr
@@ -41,41 +43,51 @@ def get_user_env_file() -> Path:
     return get_user_config_dir() / ".env"
 
 
+# Una línea `CLAVE=valor` por match; valor entre comillas dobles, simples o sin comillas.
+# Comentarios, líneas vacías o sin `=` simplemente no casan.
+_ENV_LINE_RE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(?:"([^"\n]*)"|'([^'\n]*)'|([^\n]*?))[ \t\r]*$""",
+    re.MULTILINE,
+)
+
+
 def _parse_env_lines(text: str) -> dict[str, str]:
-    data: dict[str, str] = {}
-    for raw_line in text.splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        if key:
-            data[key] = value
-    return data
+    # Solo una de las alternativas del valor participa: es siempre el último grupo.
+    return {m.group(1): m.group(m.lastindex) for m in _ENV_LINE_RE.finditer(text)}
 
 
 def write_user_env_vars(values: dict[str, str]) -> Path:
-    """Escribe/actualiza variables en el .env global del usuario."""
+    """Escribe/actualiza variables en el .env global del usuario.
+
+    Escritura atómica (fichero temporal + `os.replace`): un corte a mitad de
+    escritura no deja el .env (con la API key) truncado. Si el contenido no
+    cambia no se toca el disco.
+    """
 
     env_path = get_user_env_file()
     env_path.parent.mkdir(parents=True, exist_ok=True)
 
-    existing: dict[str, str] = {}
-    if env_path.exists():
-        try:
-            existing = _parse_env_lines(env_path.read_text(encoding="utf-8"))
-        except Exception:
-            existing = {}
+    try:
+        current = env_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        current = None
+    except Exception:
+        current = ""
 
+    existing = _parse_env_lines(current) if current else {}
     existing.update({k: v for k, v in values.items() if v is not None})
 
-    lines = ["# OSINT-D2 user config (.env)"]
-    for key in sorted(existing.keys()):
-        lines.append(f"{key}={existing[key]}")
-    env_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    content = "\n".join(
+        ["# OSINT-D2 user config (.env)", *(f"{key}={existing[key]}" for key in sorted(existing))]
+    ) + "\n"
+    if content != current:
+        tmp_path = env_path.with_name(env_path.name + ".tmp")
+        try:
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, env_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    get_settings.cache_clear()
     return env_path
 
 
@@ -94,6 +106,9 @@ class AppSettings(BaseSettings):
         # Orden: proyecto primero (dev), luego config global de usuario (PyInstaller).
         env_file=(".env", str(get_user_env_file())),
         env_file_encoding="utf-8",
+        # Inmutable: la instancia de `get_settings()` se comparte entre tareas/hilos.
+        # Para variar un valor, construir otra (`AppSettings(campo=...)`).
+        frozen=True,
     )
 
     http_timeout_seconds: float = Field(
@@ -134,6 +149,39 @@ class AppSettings(BaseSettings):
         description="Reintentos máximos ante fallos transitorios (rate limit, red).",
     )
 
+    ai_max_backoff_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        le=120,
+        description="Tope (segundos) del backoff exponencial entre reintentos IA (sin Retry-After).",
+    )
+
+    ai_rpm: int = Field(
+        default=0,
+        ge=0,
+        description="Requests por minuto al proveedor IA (throttling proactivo). 0 = sin límite.",
+    )
+    ai_tpm: int = Field(
+        default=0,
+        ge=0,
+        description="Tokens por minuto (estimados) al proveedor IA. 0 = sin límite.",
+    )
+
+    ai_keep_raw_text: bool = Field(
+        default=False,
+        description="Guardar el texto crudo de la respuesta IA en analysis.raw (debug).",
+    )
+
+    ai_cache_enabled: bool = Field(
+        default=True,
+        description="Reutilizar reportes IA previos para la misma evidencia (cache en disco).",
+    )
+    ai_cache_ttl_seconds: int = Field(
+        default=86_400,
+        ge=0,
+        description="Vigencia (segundos) de un reporte IA cacheado. 0 desactiva la lectura.",
+    )
+
     # Site-lists (data-driven, estilo WhatsMyName/email-data)
     sites_max_concurrency: int = Field(
         default=30,
@@ -145,6 +193,22 @@ class AppSettings(BaseSettings):
         ),
     )
 
+    scanner_concurrency: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Máximo de scanners dedicados (GitHub, GitLab, Gravatar…) ejecutándose a la vez.",
+    )
+    enrich_concurrency: int = Field(
+        default=50,
+        ge=1,
+        le=100,
+        description=(
+            "Máximo global de páginas de perfil descargadas a la vez por el enriquecedor HTML. "
+            "Cada host sigue acotado por `per_domain_concurrency`."
+        ),
+    )
+
     # ── Rate Limiting (responsible scanning) ──────────────────────────
     request_delay_ms: int = Field(
         default=200,
@@ -170,6 +234,16 @@ class AppSettings(BaseSettings):
         le=10,
         description="Reintentos máximos ante respuestas 429/503 con backoff exponencial.",
     )
+    hibp_concurrency: int = Field(
+        default=5,
+        ge=1,
+        le=20,
+        description="Consultas concurrentes máximas a Have I Been Pwned (breach-check).",
+    )
+    gravatar_api_key: SecretStr | None = Field(
+        default=None,
+        description="API key opcional de Gravatar (REST v3): sube el límite de rate.",
+    )
     sites_no_nsfw: bool = Field(
         default=True,
         description="Excluir categorías NSFW en site-lists.",
@@ -223,3 +297,16 @@ class AppSettings(BaseSettings):
         default=10,
         description="Max reasoning steps for the autonomous agent mode.",
     )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """`AppSettings` compartido del proceso (lee `.env` y valida una sola vez).
+
+    Es el fallback de los adapters (`settings or get_settings()`): sin él, cada
+    scanner/fetch sin settings explícitos releía ambos `.env`. Quien cambie
+    `os.environ` o los `.env` en caliente debe llamar a `get_settings.cache_clear()`
+    (`write_user_env_vars` ya lo hace).
+    """
+
+    return AppSettings()
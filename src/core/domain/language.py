@@ -8,9 +8,10 @@ imports with adapters.
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import Enum, unique
 
 
+@unique
 class Language(str, Enum):
     """Supported natural-language choices for user-facing output."""
 
@@ -30,23 +31,30 @@ class Language(str, Enum):
     def from_str(cls, value: str) -> "Language":
         """Parse a string into a Language, case-insensitive."""
 
-        value = value.strip().lower()
-        for lang in cls:
-            if value in (lang.value, lang.name.lower()):
-                return lang
-        raise ValueError(f"Unsupported language: {value}")
+        key = value.strip().lower()
+        lang = _LOOKUP.get(key)
+        if lang is None:
+            raise ValueError(f"Unsupported language: {key}")
+        return lang
 
     def label(self) -> str:
         """Human readable label for prompts and logging."""
-        Language = self.__class__
-        if self == Language.ENGLISH:
-            return "English"
-        elif self == Language.SPANISH:
-            return "Spanish"
-        elif self == Language.PORTUGUESE:
-            return "Portuguese"
-        elif self == Language.ARABIC:
-            return "Arabic"
-        elif self == Language.RUSSIAN:
-            return "Russian"
-        return Language(self.value).name.capitalize()
+
+        return _LABELS[self]
+
+
+# Lookup tables built once: `label()`/`from_str()` are a single dict access.
+# Members without an explicit label fall back to their capitalized name.
+_LABELS: dict[Language, str] = {
+    Language.ENGLISH: "English",
+    Language.SPANISH: "Spanish",
+    Language.PORTUGUESE: "Portuguese",
+    Language.ARABIC: "Arabic",
+    Language.RUSSIAN: "Russian",
+}
+_LABELS.update({lang: lang.name.capitalize() for lang in Language if lang not in _LABELS})
+
+_LOOKUP: dict[str, Language] = {
+    **{lang.name.lower(): lang for lang in Language},
+    **{lang.value: lang for lang in Language},
+}
@@ -12,11 +12,15 @@ Nota:
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any
 
 from pydantic import BaseModel, Field
 from pydantic.config import ConfigDict
 
+# `datetime.now(timezone.utc)` pre-enlazado (sin frame de lambda por instancia).
+_utc_now = partial(datetime.now, timezone.utc)
+
 
 class SocialProfile(BaseModel):
     """Representa un perfil social encontrado (o verificado como inexistente).
@@ -91,7 +95,7 @@ class AnalysisReport(BaseModel):
         description="Confianza normalizada (0..1) del análisis.",
     )
     generated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utc_now,
         description="Momento de generación del reporte (UTC).",
     )
     model: str | None = Field(
@@ -127,18 +131,6 @@ class PersonEntity(BaseModel):
         description="Reporte IA (presente solo si se ejecuta deep analysis).",
     )
 
-class HaveibeenpwnedProfiles(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-
-    email: str = Field(
-        ...,
-        description="Correo electrónico consultado en Have I Been Pwned.",
-    )
-    breaches: list[HaveibeenpwnedBreach] = Field(
-        default_factory=list,
-        description="Lista de brechas en las que se encontró el correo.",
-    )
-
 class HaveibeenpwnedBreach(BaseModel):
     model_config = ConfigDict(extra="ignore", populate_by_name=True)
 
@@ -172,3 +164,15 @@ class HaveibeenpwnedBreach(BaseModel):
         alias="DataClasses",
         description="Tipos de datos comprometidos en la brecha.",
     )
+
+class HaveibeenpwnedProfiles(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    email: str = Field(
+        ...,
+        description="Correo electrónico consultado en Have I Been Pwned.",
+    )
+    breaches: list[HaveibeenpwnedBreach] = Field(
+        default_factory=list,
+        description="Lista de brechas en las que se encontró el correo.",
+    )
@@ -12,12 +12,18 @@ from __future__ import annotations
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import httpx
 
 from core.config import get_user_config_dir
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 SHERLOCK_MANIFEST_URL = (
     "https://raw.githubusercontent.com/sherlock-project/sherlock/master/"
@@ -60,18 +66,61 @@ def get_default_list_path(filename: str) -> Path | None:
 
     root = _project_root()
     user_data = get_user_config_dir() / "data"
-    candidates = [
-        root / "data" / filename,
-        user_data / filename,
-        root.parent / "blackbird" / "data" / filename,
-        Path.cwd() / filename,
-    ]
-    for p in candidates:
-        if p.exists() and p.is_file():
-            return p
+    candidate_dirs = (
+        root / "data",
+        user_data,
+        root.parent / "blackbird" / "data",
+        Path.cwd(),
+    )
+    for directory in candidate_dirs:
+        if filename in _dir_files(directory):
+            return directory / filename
     return None
 
 
+def _dir_files(directory: Path) -> frozenset[str]:
+    # Un stat del directorio en vez de exists()+is_file() por candidato; el
+    # listado se memoiza por mtime (un fichero nuevo invalida la entrada).
+    try:
+        mtime_ns = directory.stat().st_mtime_ns
+    except OSError:
+        return frozenset()
+    return _scan_dir_files(str(directory), mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _scan_dir_files(directory: str, mtime_ns: int) -> frozenset[str]:
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(e.name for e in it if e.is_file())
+    except OSError:
+        return frozenset()
+
+
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    # Cliente síncrono perezoso y reutilizado: un `refresh` repetido en el mismo
+    # proceso aprovecha la conexión keep-alive (sin nuevo handshake TCP/TLS).
+    return httpx.Client(
+        timeout=30.0,
+        headers={
+            "User-Agent": "osint-d2/0.1 (+https://local)",
+            "Accept": "application/json",
+        },
+        follow_redirects=True,
+    )
+
+
+def _parse_json_bytes(raw: bytes) -> dict:
+    # Bytes directos al parser (sin decodificar a str antes); orjson si está.
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+@lru_cache(maxsize=2)
+def _read_manifest_cached(path: str, mtime_ns: int, size: int) -> dict:
+    return _parse_json_bytes(Path(path).read_bytes())
+
+
 def load_sherlock_data(*, refresh: bool = False, url: str = SHERLOCK_MANIFEST_URL) -> dict:
     """Carga el manifest de Sherlock (400+ sitios).
 
@@ -81,6 +130,10 @@ def load_sherlock_data(*, refresh: bool = False, url: str = SHERLOCK_MANIFEST_UR
 
     Devuelve:
     - dict con la estructura del manifest (con `$schema` si viene en el JSON).
+
+    El manifest leído de disco se memoiza por (ruta, mtime, tamaño): hunts
+    repetidos en el mismo proceso no vuelven a parsear varios MB de JSON. El dict
+    devuelto se comparte entre llamadas: tratarlo como solo lectura.
     """
 
     data_dir = _data_dir()
@@ -89,19 +142,21 @@ def load_sherlock_data(*, refresh: bool = False, url: str = SHERLOCK_MANIFEST_UR
     out_path = data_dir / "sherlock.json"
 
     if out_path.exists() and not refresh:
-        return json.loads(out_path.read_text(encoding="utf-8"))
-
-    resp = httpx.get(
-        url,
-        timeout=30.0,
-        headers={
-            "User-Agent": "osint-d2/0.1 (+https://local)",
-            "Accept": "application/json",
-        },
-        follow_redirects=True,
-    )
-    resp.raise_for_status()
-
-    data = resp.json()
-    out_path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        st = out_path.stat()
+        return _read_manifest_cached(str(out_path.resolve()), st.st_mtime_ns, st.st_size)
+
+    # Streaming a un temporal: el manifest no se materializa en memoria como
+    # respuesta + str + dict a la vez. Se valida (parsea) antes de sustituir el
+    # cache: una descarga cortada o inválida no pisa el `sherlock.json` bueno.
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    try:
+        with _http_client().stream("GET", url) as resp:
+            resp.raise_for_status()
+            with tmp_path.open("wb") as fh:
+                for chunk in resp.iter_bytes(65_536):
+                    fh.write(chunk)
+        data = _parse_json_bytes(tmp_path.read_bytes())
+        os.replace(tmp_path, out_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
     return data
@@ -260,7 +260,7 @@ async def execute_tool(
             return json.dumps({
                 "error": "breach_check is disabled. User must enable with --breach-check.",
             })
-        breach_profiles = enrich_profiles_with_breach_data([email])
+        breach_profiles = await enrich_profiles_with_breach_data([email], settings=settings)
         profiles = _compact_profiles(breach_profiles)
         return json.dumps({
             "target": email,
@@ -291,7 +291,7 @@ async def execute_tool(
                     "error": f"HTTP {resp.status_code}",
                 })
             html = resp.text or ""
-            meta = extract_html_metadata(html=html, base_url=str(resp.url))
+            meta = extract_html_metadata(html=html, base_url=resp.url)
             return json.dumps({
                 "url": str(resp.url),
                 "status_code": resp.status_code,
@@ -11,7 +11,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Iterable, Sequence
 
@@ -50,15 +52,15 @@ from adapters.site_lists import (
     run_email_sites,
     run_username_sites,
 )
-from adapters.sherlock_runner import run_sherlock_username
-from core.config import AppSettings
+from adapters.sherlock_runner import run_sherlock_username, sherlock_sites
+from core.config import AppSettings, get_settings
 from core.domain.models import PersonEntity, SocialProfile
 from core.resources_loader import get_default_list_path, load_sherlock_data
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SiteListOptions:
     """Configuration for the site-lists engine (WhatsMyName style)."""
 
@@ -70,7 +72,7 @@ class SiteListOptions:
     no_nsfw: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HuntRequest:
     """Parameters that control the hunt pipeline."""
 
@@ -84,7 +86,7 @@ class HuntRequest:
     use_breach_check: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineHooks:
     """Optional callbacks for UI layers (progress, warnings)."""
 
@@ -93,7 +95,7 @@ class PipelineHooks:
     sherlock_progress: Callable[[int, int, str], None] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Output of a pipeline invocation."""
 
@@ -134,11 +136,29 @@ _EMAIL_SCANNERS = (
     UbuntuKeyserverScanner,
 )
 
-_STRICT_SHERLOCK_DENYLIST: set[str] = {
+@lru_cache(maxsize=4)
+def _scanner_instances(classes: tuple[type, ...], settings: AppSettings) -> tuple:
+    """Instancias reutilizables de `classes` (sin estado por petición).
+
+    Los scanners leen `get_settings()` al construirse: la clave incluye esos
+    settings, así un override de CLI (`cache_clear`) crea instancias nuevas.
+    """
+
+    return tuple(scanner() for scanner in classes)
+
+
+@lru_cache(maxsize=None)
+def _scanner_names(cls: type) -> tuple[str, str]:
+    """(nombre de clase, red) de un scanner; constante por clase."""
+
+    return cls.__name__, cls.__name__.removesuffix("Scanner").lower()
+
+
+_STRICT_SHERLOCK_DENYLIST: frozenset[str] = frozenset({
     "avizo",
     "fanpop",
     "hubski",
-}
+})
 
 _STRICT_SUSPICIOUS_URL_PARTS: tuple[str, ...] = (
     "login",
@@ -154,20 +174,21 @@ _STRICT_SUSPICIOUS_URL_PARTS: tuple[str, ...] = (
     "vendor_not_found",
     "nastaveni-souhlasu",
 )
+# Una sola pasada sobre la URL en vez de un `in` por fragmento.
+_STRICT_SUSPICIOUS_RE = re.compile("|".join(re.escape(part) for part in _STRICT_SUSPICIOUS_URL_PARTS))
+
+
+# `\w` de `re` (str) equivale a `isalnum()` + "_": mismo criterio que el bucle
+# carácter a carácter de antes, resuelto en C.
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w.\-]")
+_FILENAME_AT_PLUS = str.maketrans({"@": "_", "+": "_"})
 
 
 def sanitize_target_for_filename(value: str) -> str:
     """Generate a filesystem-friendly slug for reports."""
 
-    out: list[str] = []
-    for ch in value.strip():
-        if ch.isalnum() or ch in ("-", "_", "."):
-            out.append(ch)
-        elif ch in ("@", "+"):
-            out.append("_")
-        else:
-            out.append("-")
-    cleaned = "".join(out).strip("-_")
+    translated = value.strip().translate(_FILENAME_AT_PLUS)
+    cleaned = _FILENAME_UNSAFE_RE.sub("-", translated).strip("-_")
     return cleaned or "target"
 
 
@@ -185,7 +206,13 @@ def dedupe_profiles(profiles: Iterable[SocialProfile]) -> list[SocialProfile]:
     return deduped
 
 
-def _strict_keep_profile(*, profile: SocialProfile, username: str) -> bool:
+def _strict_keep_profile(*, profile: SocialProfile, usernames: Sequence[str]) -> bool:
+    """¿Conservar `profile` en modo estricto para alguno de `usernames` (en minúsculas)?
+
+    Lo que depende solo del perfil (denylist, URL final, título, descripción) se
+    calcula una vez y luego se prueban todos los usernames.
+    """
+
     if not profile.exists:
         return False
 
@@ -197,22 +224,17 @@ def _strict_keep_profile(*, profile: SocialProfile, username: str) -> bool:
         return False
 
     final_url = str(metadata.get("final_url") or profile.url).lower()
-    if any(part in final_url for part in _STRICT_SUSPICIOUS_URL_PARTS):
+    if _STRICT_SUSPICIOUS_RE.search(final_url):
         return False
 
-    username_l = username.lower()
-    if username_l in final_url:
+    if any(username_l in final_url for username_l in usernames):
         return True
 
     title = metadata.get("title")
-    if isinstance(title, str) and username_l in title.lower():
-        return True
-
+    title_l = title.lower() if isinstance(title, str) else ""
     description = metadata.get("meta_description")
-    if isinstance(description, str) and username_l in description.lower():
-        return True
-
-    return False
+    description_l = description.lower() if isinstance(description, str) else ""
+    return any(username_l in title_l or username_l in description_l for username_l in usernames)
 
 
 async def hunt(
@@ -223,18 +245,31 @@ async def hunt(
 ) -> PipelineResult:
     hooks = hooks or PipelineHooks()
     warnings: list[str] = []
-    usernames = list({u.strip() for u in request.usernames or [] if u.strip()})
-    emails = list({e.strip().lower() for e in request.emails or [] if e.strip()})
+    # dict.fromkeys: dedupe en una pasada conservando el orden de entrada.
+    usernames = list(dict.fromkeys(u.strip() for u in request.usernames or [] if u.strip()))
+    emails = list(dict.fromkeys(e.strip().lower() for e in request.emails or [] if e.strip()))
 
-    username_scanners = [scanner() for scanner in _USERNAME_SCANNERS]
-    email_scanners = [scanner() for scanner in _EMAIL_SCANNERS]
+    username_scanners = _scanner_instances(_USERNAME_SCANNERS, get_settings())
+    email_scanners = _scanner_instances(_EMAIL_SCANNERS, get_settings())
 
     profiles: list[SocialProfile] = []
+    # Dedupe en línea (misma clave que `dedupe_profiles`): los duplicados se
+    # descartan al añadirse en vez de reconstruir la lista al final.
+    seen_keys: set[tuple[str, str, str]] = set()
     total_scan_errors: int = 0
-    all_usernames = set(usernames)
-    all_emails = set(emails)
-    scanned_usernames: set[str] = set()
-    scanned_emails: set[str] = set()
+    # Valores ya encolados (orden de descubrimiento): cada uno se escanea una vez.
+    all_usernames: dict[str, None] = {}
+    all_emails: dict[str, None] = {}
+    jobs: asyncio.Queue[tuple[int, object, str, str | None]] = asyncio.Queue()
+    scan_results: list[list[SocialProfile]] = []
+
+    def merge(new_profiles: Iterable[SocialProfile]) -> None:
+        for profile in new_profiles:
+            key = (profile.network_name, profile.username, str(profile.url))
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            profiles.append(profile)
 
     async def safe_scan(
         scanner: object,
@@ -242,8 +277,7 @@ async def hunt(
         *,
         derived_from: str | None = None,
     ) -> list[SocialProfile]:
-        name = scanner.__class__.__name__
-        network = name.removesuffix("Scanner").lower()
+        name, network = _scanner_names(type(scanner))
         try:
             result = await scanner.scan(value)  # type: ignore[attr-defined]
             collected: list[SocialProfile]
@@ -263,8 +297,9 @@ async def hunt(
             metadata: dict[str, object] = {"error": str(exc), "scanner": name}
             if derived_from:
                 metadata["derived_from"] = derived_from
+            # Datos construidos aquí mismo (no salida de un adapter): sin revalidar.
             return [
-                SocialProfile(
+                SocialProfile.model_construct(
                     url=fallback_url,
                     username=value,
                     network_name=network,
@@ -273,81 +308,89 @@ async def hunt(
                 )
             ]
 
-    def extract_extras(perfiles: Iterable[SocialProfile]) -> tuple[set[str], set[str]]:
-        extra_usernames: set[str] = set()
-        extra_emails: set[str] = set()
+    def extract_extras(perfiles: Iterable[SocialProfile]) -> tuple[dict[str, None], dict[str, None]]:
+        extra_usernames: dict[str, None] = {}
+        extra_emails: dict[str, None] = {}
         for profile in perfiles:
             metadata = profile.metadata if isinstance(profile.metadata, dict) else {}
             for key in ("other_emails", "emails", "email"):
                 val = metadata.get(key)
                 if isinstance(val, str):
-                    extra_emails.add(val)
+                    extra_emails[val] = None
                 elif isinstance(val, list):
-                    extra_emails.update([v for v in val if isinstance(v, str)])
+                    extra_emails.update(dict.fromkeys(v for v in val if isinstance(v, str)))
             for key in ("other_users", "usernames"):
                 val = metadata.get(key)
                 if isinstance(val, str):
-                    extra_usernames.add(val)
+                    extra_usernames[val] = None
                 elif isinstance(val, list):
-                    extra_usernames.update([v for v in val if isinstance(v, str)])
+                    extra_usernames.update(dict.fromkeys(v for v in val if isinstance(v, str)))
             for key in ("other_websites", "websites", "website"):
                 val = metadata.get(key)
                 if isinstance(val, str) and not val.startswith("http"):
-                    extra_usernames.add(val)
+                    extra_usernames[val] = None
                 elif isinstance(val, list):
                     for v in val:
                         if isinstance(v, str) and not v.startswith("http"):
-                            extra_usernames.add(v)
-        cleaned_emails = {e.strip().lower() for e in extra_emails if e and "@" in e}
-        cleaned_usernames = {u.strip() for u in extra_usernames if u.strip()}
+                            extra_usernames[v] = None
+        cleaned_emails = dict.fromkeys(e.strip().lower() for e in extra_emails if e and "@" in e)
+        cleaned_usernames = dict.fromkeys(u.strip() for u in extra_usernames if u.strip())
         return cleaned_usernames, cleaned_emails
 
-    while True:
-        new_usernames = list(all_usernames - scanned_usernames)
-        new_emails = list(all_emails - scanned_emails)
-        if not new_usernames and not new_emails:
-            break
-
-        if new_usernames:
-            scan_tasks = [
-                safe_scan(scanner, username)
-                for username in new_usernames
-                for scanner in username_scanners
-            ]
-            scan_results = await asyncio.gather(*scan_tasks)
-            for result in scan_results:
-                profiles.extend(result)
-            scanned_usernames.update(new_usernames)
-
-        if new_emails:
-            email_tasks = [
-                safe_scan(scanner, email)
-                for email in new_emails
-                for scanner in email_scanners
-            ]
-            email_results = await asyncio.gather(*email_tasks)
-            for result in email_results:
-                profiles.extend(result)
-            scanned_emails.update(new_emails)
-
-            if request.scan_localpart:
-                localparts = [email.split("@", 1)[0] for email in new_emails]
-                local_tasks = [
-                    safe_scan(scanner, localpart, derived_from="email_localpart")
-                    for localpart in localparts
-                    for scanner in username_scanners
-                ]
-                local_results = await asyncio.gather(*local_tasks)
-                for result in local_results:
-                    profiles.extend(result)
-                all_usernames.update(localparts)
-
-        extra_usernames, extra_emails = extract_extras(profiles)
-        all_usernames.update(extra_usernames)
-        all_emails.update(extra_emails)
-
-    usernames = sorted(all_usernames)
-    emails = sorted(all_emails)
+    def enqueue(scanners: Sequence[object], value: str, derived_from: str | None = None) -> None:
+        for scanner in scanners:
+            jobs.put_nowait((len(scan_results), scanner, value, derived_from))
+            scan_results.append([])
+
+    def submit(new_usernames: Iterable[str], new_emails: Iterable[str]) -> None:
+        fresh_usernames = [u for u in new_usernames if u not in all_usernames]
+        fresh_emails = [e for e in new_emails if e not in all_emails]
+        all_usernames.update(dict.fromkeys(fresh_usernames))
+        all_emails.update(dict.fromkeys(fresh_emails))
+        for username in fresh_usernames:
+            enqueue(username_scanners, username)
+        for email in fresh_emails:
+            enqueue(email_scanners, email)
+        if fresh_emails and request.scan_localpart:
+            localparts = dict.fromkeys(email.split("@", 1)[0] for email in fresh_emails)
+            for localpart in [lp for lp in localparts if lp not in all_usernames]:
+                all_usernames[localpart] = None
+                enqueue(username_scanners, localpart, "email_localpart")
+
+    async def worker() -> None:
+        while True:
+            index, scanner, value, derived_from = await jobs.get()
+            try:
+                result = await safe_scan(scanner, value, derived_from=derived_from)
+                scan_results[index] = result
+                # Los extras de cada resultado (incluidos duplicados: su metadata
+                # puede aportar) se encolan en cuanto llegan, sin esperar a que
+                # termine el scanner más lento de la "ronda".
+                submit(*extract_extras(result))
+            except Exception:
+                # Un worker no puede morir con trabajos en cola: `jobs.join()`
+                # esperaría para siempre. Se registra y se sigue con el siguiente.
+                logger.exception("Hunt worker failed processing %s for %s", type(scanner).__name__, value)
+            finally:
+                jobs.task_done()
+
+    # `scanner_concurrency` workers sobre una cola: acota las corrutinas vivas y
+    # solapa la expansión con los scans que siguen en curso.
+    submit(usernames, emails)
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, settings.scanner_concurrency))]
+    try:
+        await jobs.join()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    # Merge en orden de encolado: ante duplicados gana siempre el mismo perfil,
+    # sin depender del orden de llegada.
+    for result in scan_results:
+        merge(result)
+
+    usernames = list(all_usernames)
+    emails = list(all_emails)
 
     max_concurrency = request.site_lists.max_concurrency or settings.sites_max_concurrency
     no_nsfw_effective = (
@@ -378,7 +421,7 @@ async def hunt(
                     categories=request.site_lists.categories,
                     no_nsfw=no_nsfw_effective,
                 )
-                profiles.extend(site_profiles)
+                merge(site_profiles)
                 total_scan_errors += site_errors
 
         if emails:
@@ -402,21 +445,14 @@ async def hunt(
                     categories=request.site_lists.categories,
                     no_nsfw=no_nsfw_effective,
                 )
-                profiles.extend(email_site_profiles)
+                merge(email_site_profiles)
                 total_scan_errors += email_site_errors
 
     if request.use_sherlock and usernames:
         manifest = request.sherlock_manifest or load_sherlock_data(refresh=False)
-        total = 0
-        for username in usernames:
-            for site_name, info in manifest.items():
-                if site_name == "$schema":
-                    continue
-                if not isinstance(info, dict):
-                    continue
-                if no_nsfw_effective and bool(info.get("isNSFW")):
-                    continue
-                total += 1
+        # El filtro de sitios no depende del username: se cuenta una vez (y la
+        # compilación del manifest la reutiliza `run_sherlock_username`).
+        total = len(sherlock_sites(manifest, no_nsfw=no_nsfw_effective)) * len(usernames)
         if total and hooks.sherlock_start:
             hooks.sherlock_start(total)
 
@@ -429,34 +465,31 @@ async def hunt(
             no_nsfw=no_nsfw_effective,
             progress_callback=progress_cb,
         )
-        profiles.extend(sherlock_profiles)
+        merge(sherlock_profiles)
         total_scan_errors += sherlock_errors
 
-    profiles = dedupe_profiles(profiles)
-
     if request.use_breach_check:
         from adapters.breach_check import enrich_profiles_with_breach_data
 
-        breach_profiles = enrich_profiles_with_breach_data(emails=emails)
-        profiles.extend(breach_profiles)
-        profiles = dedupe_profiles(profiles)
+        breach_profiles = await enrich_profiles_with_breach_data(emails=emails, settings=settings)
+        merge(breach_profiles)
 
     if request.strict and usernames:
+        usernames_l = [username.lower() for username in usernames]
         profiles = [
             profile
             for profile in profiles
-            if any(_strict_keep_profile(profile=profile, username=username) for username in usernames)
+            if _strict_keep_profile(profile=profile, usernames=usernames_l)
         ]
 
-    await enrich_profiles_from_html(
-        profiles=profiles,
-        settings=settings,
-        max_concurrency=min(20, max_concurrency),
-    )
+    await enrich_profiles_from_html(profiles=profiles, settings=settings)
 
     extra_usernames, extra_emails = extract_extras(profiles)
-    usernames = sorted({*usernames, *extra_usernames})
-    emails = sorted({*emails, *extra_emails})
+    # Orden de descubrimiento (entradas primero), sin ordenar alfabéticamente.
+    all_usernames.update(extra_usernames)
+    all_emails.update(extra_emails)
+    usernames = list(all_usernames)
+    emails = list(all_emails)
 
     target_parts = []
     if usernames:
@@ -134,7 +134,7 @@ class TestExecuteToolBreachCheck:
                 metadata={"breaches": {"breach1": {"date": "2020-01-01"}}},
             )
         ]
-        mock_breach = MagicMock(return_value=breach_profiles)
+        mock_breach = AsyncMock(return_value=breach_profiles)
 
         with patch("core.services.agent_tools.enrich_profiles_with_breach_data", mock_breach):
             result = await execute_tool(
@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+from types import SimpleNamespace
+
 import pytest
 
-from adapters.ai_analyst import _heuristic_analysis, _summary_has_six_sections
+from adapters.ai_analyst import (
+    _CLIENT_CACHE,
+    _ai_cache_key,
+    _backoff_delay,
+    _extract_json_object,
+    _get_client,
+    _hedged_completion,
+    _read_completion_stream,
+    aclose_ai_clients,
+    analyze_person,
+    analyze_persons,
+    _heuristic_analysis,
+    _load_cached_report,
+    _parse_report_payload,
+    _store_cached_report,
+    _summary_has_six_sections,
+)
+from core.config import AppSettings
 from core.domain.language import Language
-from core.domain.models import PersonEntity, SocialProfile
+from core.domain.models import AnalysisReport, PersonEntity, SocialProfile
 
 
 # ---------------------------------------------------------------------------
@@ -34,6 +55,63 @@ class TestSummaryHasSixSections:
         assert _summary_has_six_sections(summary=good, language=language) is True
 
 
+# ---------------------------------------------------------------------------
+# _extract_json_object
+# ---------------------------------------------------------------------------
+
+class TestExtractJsonObject:
+    def test_fenced_block(self):
+        text = 'Sure:\n```json\n{"summary": "x"}\n```'
+        assert _extract_json_object(text) == '{"summary": "x"}'
+
+    def test_bare_object(self):
+        assert _extract_json_object('  {"a": 1}  ') == '{"a": 1}'
+
+    def test_object_surrounded_by_prose(self):
+        text = 'Here you go: {"summary": "has } brace", "highlights": []} Hope it helps {:'
+        assert _extract_json_object(text) == '{"summary": "has } brace", "highlights": []}'
+
+    def test_no_object_raises(self):
+        with pytest.raises(ValueError):
+            _extract_json_object("no json here {oops")
+
+    def test_parse_payload_from_prose(self):
+        text = 'Report: {"summary": "ok", "highlights": ["a"]} -- end'
+        parsed = _parse_report_payload(text)
+        assert parsed.summary == "ok"
+        assert parsed.highlights == ["a"]
+
+
+# ---------------------------------------------------------------------------
+# _backoff_delay
+# ---------------------------------------------------------------------------
+
+class TestBackoffDelay:
+    def test_grows_exponentially_within_jitter(self):
+        assert 0.25 <= _backoff_delay(0) <= 0.75
+        assert 2.0 <= _backoff_delay(3) <= 6.0
+
+    def test_is_capped(self):
+        assert _backoff_delay(30) <= 15.0
+
+    def test_cap_is_configurable(self):
+        assert all(_backoff_delay(8, cap=2.0) <= 3.0 for _ in range(20))
+
+    def test_retry_after_http_date(self):
+        from email.utils import format_datetime
+        from datetime import datetime, timedelta, timezone
+
+        exc = Exception("rate limited")
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        exc.response = SimpleNamespace(headers={"retry-after": format_datetime(when, usegmt=True)})
+        assert 28.0 <= _backoff_delay(0, exc) <= 30.5
+
+    def test_honors_retry_after(self):
+        exc = Exception("rate limited")
+        exc.response = SimpleNamespace(headers={"retry-after": "7"})
+        assert 7.0 <= _backoff_delay(0, exc) <= 7.35
+
+
 # ---------------------------------------------------------------------------
 # _heuristic_analysis
 # ---------------------------------------------------------------------------
@@ -81,3 +159,454 @@ class TestHeuristicAnalysis:
         person = _make_person()
         report = _heuristic_analysis(person=person, language=Language.ENGLISH, reason="missing_api_key")
         assert "missing_api_key" in report.summary
+
+
+# ---------------------------------------------------------------------------
+# AI response cache
+# ---------------------------------------------------------------------------
+
+class TestAICache:
+    def test_key_is_stable_and_order_insensitive(self):
+        a = _ai_cache_key(system_prompt="sys", user_payload={"a": 1, "b": 2}, model="m", language=Language.ENGLISH)
+        b = _ai_cache_key(system_prompt="sys", user_payload={"b": 2, "a": 1}, model="m", language=Language.ENGLISH)
+        assert a == b
+
+    def test_key_changes_with_model_and_language(self):
+        base = _ai_cache_key(system_prompt="sys", user_payload={}, model="m", language=Language.ENGLISH)
+        assert base != _ai_cache_key(system_prompt="sys", user_payload={}, model="m2", language=Language.ENGLISH)
+        assert base != _ai_cache_key(system_prompt="sys", user_payload={}, model="m", language=Language.SPANISH)
+
+    def test_roundtrip(self, tmp_path):
+        report = AnalysisReport(summary="## 1. x\n## 6. y", highlights=["h"], confidence=0.7, model="m")
+        _store_cached_report(cache_dir=tmp_path, key="k", report=report)
+        loaded = _load_cached_report(cache_dir=tmp_path, key="k", ttl_seconds=60)
+        assert loaded is not None
+        assert loaded.summary == report.summary
+        assert loaded.highlights == ["h"]
+
+    def test_expired_or_missing_entry(self, tmp_path):
+        report = AnalysisReport(summary="s", model="m")
+        _store_cached_report(cache_dir=tmp_path, key="k", report=report)
+        assert _load_cached_report(cache_dir=tmp_path, key="k", ttl_seconds=0) is None
+        assert _load_cached_report(cache_dir=tmp_path, key="missing", ttl_seconds=60) is None
+
+    def test_corrupt_entry_is_ignored(self, tmp_path):
+        (tmp_path / "k.json").write_text("{not json", encoding="utf-8")
+        assert _load_cached_report(cache_dir=tmp_path, key="k", ttl_seconds=60) is None
+
+    def test_hit_served_from_memory_as_copy(self, tmp_path):
+        report = AnalysisReport(summary="s", highlights=["h"], model="m")
+        _store_cached_report(cache_dir=tmp_path, key="k", report=report)
+        (tmp_path / "k.json").unlink()
+
+        first = _load_cached_report(cache_dir=tmp_path, key="k", ttl_seconds=60)
+        assert first is not None and first.summary == "s"
+        first.highlights.append("mutated")
+        second = _load_cached_report(cache_dir=tmp_path, key="k", ttl_seconds=60)
+        assert second.highlights == ["h"]
+
+
+# ---------------------------------------------------------------------------
+# Shared AsyncOpenAI clients
+# ---------------------------------------------------------------------------
+
+class TestSharedClient:
+    @pytest.mark.asyncio
+    async def test_client_is_reused_within_loop(self):
+        a = _get_client(api_key="k", base_url="http://localhost:1", timeout=5.0)
+        b = _get_client(api_key="k", base_url="http://localhost:1", timeout=5.0)
+        c = _get_client(api_key="other", base_url="http://localhost:1", timeout=5.0)
+        try:
+            assert a is b
+            assert a is not c
+        finally:
+            await aclose_ai_clients()
+        assert a.is_closed()
+        assert not _CLIENT_CACHE
+
+    @pytest.mark.asyncio
+    async def test_cache_key_does_not_hold_api_key(self):
+        _get_client(api_key="sk-super-secret", base_url="http://localhost:1", timeout=5.0)
+        try:
+            assert all("sk-super-secret" not in map(str, key) for key in _CLIENT_CACHE)
+        finally:
+            await aclose_ai_clients()
+
+
+# ---------------------------------------------------------------------------
+# analyze_person (provider mocked)
+# ---------------------------------------------------------------------------
+
+_GOOD_CONTENT = json.dumps({
+    "summary": "## 1. Identity\nx\n## 2. Geo\n## 3. Psych\n## 4. Tech\n## 5. Values\n## 6. OpSec\ny",
+    "highlights": ["Reuses the same handle across networks."],
+    "confidence": 0.8,
+})
+
+
+class _FakeStream:
+    def __init__(self, content: str, chunk_size: int = 7):
+        self.pieces = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self._gen()
+
+    async def _gen(self):
+        for piece in self.pieces:
+            self.consumed += 1
+            delta = SimpleNamespace(content=piece)
+            yield SimpleNamespace(id="fake", model="fake-model", choices=[SimpleNamespace(delta=delta, finish_reason=None)])
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeCompletions:
+    def __init__(self, *contents: str):
+        self.contents = list(contents)
+        self.calls: list[dict] = []
+        self.streams: list[_FakeStream] = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        content = self.contents[min(len(self.calls), len(self.contents)) - 1]
+        stream = _FakeStream(content)
+        self.streams.append(stream)
+        return stream
+
+
+def _fake_client(monkeypatch, *contents: str) -> _FakeCompletions:
+    completions = _FakeCompletions(*(contents or (_GOOD_CONTENT,)))
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr("adapters.ai_analyst._get_client", lambda **_: client)
+    return completions
+
+
+def _settings(**overrides: object) -> AppSettings:
+    values: dict[str, object] = {"ai_api_key": "test-key", "ai_cache_enabled": False, "ai_max_retries": 0}
+    values.update(overrides)
+    return AppSettings(**values)
+
+
+class TestAnalyzePerson:
+    @pytest.mark.asyncio
+    async def test_builds_payload_from_confirmed_profiles(self, monkeypatch):
+        completions = _fake_client(monkeypatch)
+        person = PersonEntity(target="alice", profiles=[
+            SocialProfile(url="https://github.com/Alice?tab=repos", username="Alice", network_name="GitHub",
+                          exists=True, metadata={"name": "Alice A.", "company": "ACME"}),
+            SocialProfile(url="https://gitlab.com/alice", username="alice", network_name="gitlab", exists=True),
+            SocialProfile(url="https://hibp/alice@example.com", username="Alice@Example.com", network_name="hibp",
+                          exists=True, metadata={"breaches": {"breaches": [{"Title": "Adobe", "Domain": "adobe.com"}]}}),
+            SocialProfile(url="https://nope.com/alice", username="alice", network_name="nope", exists=False),
+        ])
+
+        report = await analyze_person(person=person, language=Language.ENGLISH, settings=_settings())
+
+        assert report.model == "deepseek-chat"
+        assert report.highlights == ["Reuses the same handle across networks."]
+        payload = json.loads(completions.calls[0]["messages"][1]["content"])
+        assert payload["evidence_count"] == 3
+        assert payload["confirmed_networks"] == ["github", "gitlab", "hibp"]
+        assert payload["confirmed_urls"][0] == "https://github.com/Alice"
+        assert payload["signals"]["emails"] == ["alice@example.com"]
+        assert payload["signals"]["handles"] == ["Alice", "alice"]
+        assert payload["signals"]["reused_handles"] == ["alice"]
+        assert payload["signals"]["breach_summary"][0]["count"] == 1
+        github = payload["profiles"][0]
+        assert github["signals"] == {"display_name": "Alice A.", "company": "ACME"}
+        assert "signals" not in payload["profiles"][1]
+        assert "bio" not in github
+        assert payload["profiles"][2]["hibp_breaches"]["top"][0]["title"] == "Adobe"
+
+    @pytest.mark.asyncio
+    async def test_caps_profiles_by_token_budget(self, monkeypatch):
+        completions = _fake_client(monkeypatch)
+        bio = "x" * 400
+        profiles = [
+            SocialProfile(url=f"https://site{i}.com/bob", username="bob", network_name=f"site{i}",
+                          exists=True, bio=bio)
+            for i in range(200)
+        ]
+        profiles.append(SocialProfile(url="https://talky.com/bob", username="bob", network_name="talky",
+                                      exists=True, metadata={"comments": ["hello world"]}))
+        person = PersonEntity(target="bob", profiles=profiles)
+
+        await analyze_person(person=person, language=Language.ENGLISH, settings=_settings())
+
+        payload = json.loads(completions.calls[0]["messages"][1]["content"])
+        assert 0 < payload["evidence_count"] < 200
+        assert len(payload["profiles"]) == payload["evidence_count"]
+        assert payload["profiles_omitted"] == 201 - payload["evidence_count"]
+        # Text-bearing evidence is prioritised over bare profiles.
+        assert payload["profiles"][0]["network"] == "talky"
+        assert payload["signals"]["has_text_samples"] is True
+        assert len(payload["confirmed_urls"]) == 60
+        assert len(payload["confirmed_networks"]) == 201
+
+    @pytest.mark.asyncio
+    async def test_small_profiles_are_not_truncated_by_count(self, monkeypatch):
+        completions = _fake_client(monkeypatch)
+        person = PersonEntity(target="bob", profiles=[
+            SocialProfile(url=f"https://site{i}.com/bob", username="bob", network_name=f"site{i}", exists=True)
+            for i in range(45)
+        ])
+
+        await analyze_person(person=person, language=Language.ENGLISH, settings=_settings())
+
+        payload = json.loads(completions.calls[0]["messages"][1]["content"])
+        assert payload["evidence_count"] == 45
+        assert "profiles_omitted" not in payload
+
+    @pytest.mark.asyncio
+    async def test_max_tokens_scales_with_evidence(self, monkeypatch):
+        completions = _fake_client(monkeypatch)
+        small = _make_person(confirmed=1, unconfirmed=0)
+        big = PersonEntity(target="bob", profiles=[
+            SocialProfile(url=f"https://site{i}.com/bob", username="bob", network_name=f"site{i}",
+                          exists=True, bio="x" * 400)
+            for i in range(40)
+        ])
+
+        await analyze_person(person=small, language=Language.ENGLISH, settings=_settings())
+        await analyze_person(person=big, language=Language.ENGLISH, settings=_settings())
+
+        assert [c["max_tokens"] for c in completions.calls] == [1200, 1800]
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_falls_back_to_heuristic(self, monkeypatch):
+        _fake_client(monkeypatch, "not json at all")
+        person = _make_person(confirmed=1, unconfirmed=0)
+
+        report = await analyze_person(person=person, language=Language.ENGLISH, settings=_settings())
+
+        assert report.model == "heuristic"
+
+    @pytest.mark.asyncio
+    async def test_requests_json_mode_for_known_providers(self, monkeypatch):
+        completions = _fake_client(monkeypatch)
+        person = _make_person(confirmed=1, unconfirmed=0)
+
+        await analyze_person(person=person, language=Language.ENGLISH, settings=_settings())
+
+        assert completions.calls[0]["response_format"] == {"type": "json_object"}
+
+    @pytest.mark.asyncio
+    async def test_no_json_mode_for_unknown_providers(self, monkeypatch):
+        completions = _fake_client(monkeypatch)
+        person = _make_person(confirmed=1, unconfirmed=0)
+        settings = _settings(ai_base_url="http://localhost:11434/v1")
+
+        await analyze_person(person=person, language=Language.ENGLISH, settings=settings)
+
+        assert "response_format" not in completions.calls[0]
+
+    @pytest.mark.asyncio
+    async def test_no_confirmed_profiles_skips_provider(self, monkeypatch):
+        completions = _fake_client(monkeypatch)
+        person = _make_person(confirmed=0, unconfirmed=2)
+
+        report = await analyze_person(person=person, language=Language.ENGLISH, settings=_settings())
+
+        assert completions.calls == []
+        assert report.model == "heuristic"
+        assert report.raw["reason"] == "no_profiles"
+
+    @pytest.mark.asyncio
+    async def test_analyze_persons_keeps_input_order(self, monkeypatch):
+        in_flight = {"now": 0, "peak": 0}
+
+        async def create(**kwargs):
+            target = json.loads(kwargs["messages"][1]["content"])["target_query"]
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            # El primero termina último: el orden de salida no depende del de llegada.
+            await asyncio.sleep(0.03 if target == "t0" else 0.01)
+            in_flight["now"] -= 1
+            summary = f"## 1. {target}\n## 2. a\n## 3. b\n## 4. c\n## 5. d\n## 6. e"
+            return _FakeStream(json.dumps({"summary": summary, "highlights": [target], "confidence": 0.5}))
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        monkeypatch.setattr("adapters.ai_analyst._get_client", lambda **_: client)
+        persons = [_make_person(confirmed=1, unconfirmed=0) for _ in range(4)]
+        for i, person in enumerate(persons):
+            person.target = f"t{i}"
+
+        reports = await analyze_persons(persons, language=Language.ENGLISH, settings=_settings(), concurrency=2)
+
+        assert [r.highlights for r in reports] == [[f"t{i}"] for i in range(4)]
+        assert in_flight["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_throttle_acquired_before_each_request(self, monkeypatch):
+        completions = _fake_client(monkeypatch)
+        costs: list[int] = []
+
+        async def acquire(self, tokens: int = 0) -> None:
+            costs.append(tokens)
+
+        monkeypatch.setattr("adapters.rate_limiter.TokenBucket.acquire", acquire)
+        settings = _settings(ai_tpm=10_000)
+
+        await analyze_person(person=_make_person(confirmed=1, unconfirmed=0), language=Language.ENGLISH, settings=settings)
+
+        assert len(costs) == len(completions.calls) == 1
+        assert costs[0] > completions.calls[0]["max_tokens"]
+
+
+class TestHedgedCompletion:
+    @pytest.mark.asyncio
+    async def test_fast_response_does_not_hedge(self):
+        completions = _FakeCompletions(_GOOD_CONTENT)
+        client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        content, _, _ = await _hedged_completion(client, hedge_delay=5.0, model="m")
+
+        assert content == _GOOD_CONTENT
+        assert len(completions.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_response_is_hedged_and_first_success_wins(self):
+        import asyncio
+
+        streams: list[_FakeStream] = []
+
+        async def create(**kwargs):
+            stream = _FakeStream("fast" if streams else "slow")
+            streams.append(stream)
+            if len(streams) == 1:
+                await asyncio.sleep(10)
+            return stream
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        content, _, _ = await _hedged_completion(client, hedge_delay=0.01, model="m")
+
+        assert content == "fast"
+        assert len(streams) == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_stream_read_is_hedged_and_loser_closed(self):
+        """The race covers reading the stream, not just opening it."""
+        import asyncio
+
+        class _SlowStream(_FakeStream):
+            async def _gen(self):
+                await asyncio.sleep(10)
+                async for chunk in super()._gen():
+                    yield chunk
+
+        streams: list[_FakeStream] = []
+
+        async def create(**kwargs):
+            stream = _FakeStream("fast") if streams else _SlowStream("slow")
+            streams.append(stream)
+            return stream
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        content, _, _ = await _hedged_completion(client, hedge_delay=0.01, model="m")
+
+        assert content == "fast"
+        assert len(streams) == 2
+        assert all(stream.closed for stream in streams)
+
+    @pytest.mark.asyncio
+    async def test_hedge_waits_for_throttle(self):
+        import asyncio
+
+        events: list[str] = []
+
+        async def create(**kwargs):
+            events.append("create")
+            if events.count("create") == 1:
+                await asyncio.sleep(10)
+            return _FakeStream("ok")
+
+        async def before_hedge() -> None:
+            events.append("throttle")
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        await _hedged_completion(client, hedge_delay=0.01, before_hedge=before_hedge, model="m")
+
+        assert events == ["create", "throttle", "create"]
+
+
+class TestStreamingResponse:
+    @pytest.mark.asyncio
+    async def test_streamed_chunks_are_joined(self, monkeypatch):
+        completions = _fake_client(monkeypatch)
+        person = _make_person(confirmed=1, unconfirmed=0)
+
+        report = await analyze_person(person=person, language=Language.ENGLISH, settings=_settings())
+
+        assert completions.calls[0]["stream"] is True
+        assert completions.streams[0].closed
+        assert report.raw["model"] == "fake-model"
+        assert "raw_text" not in report.raw
+        assert report.summary.startswith("## 1. Identity")
+
+    @pytest.mark.asyncio
+    async def test_usage_from_final_empty_choices_chunk(self):
+        """OpenAI-style streams send usage in a last chunk with choices == []."""
+
+        class _UsageStream(_FakeStream):
+            async def _gen(self):
+                async for chunk in super()._gen():
+                    yield chunk
+                usage = SimpleNamespace(model_dump=lambda: {"prompt_tokens": 10, "completion_tokens": 5})
+                yield SimpleNamespace(id="fake", model="fake-model", choices=[], usage=usage)
+
+        stream = _UsageStream(_GOOD_CONTENT)
+
+        content, meta, template_hit = await _read_completion_stream(stream)
+
+        assert content == _GOOD_CONTENT
+        assert template_hit is False
+        assert meta["usage"] == {"prompt_tokens": 10, "completion_tokens": 5}
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_requests_stream_usage_only_where_supported(self, monkeypatch):
+        completions = _fake_client(monkeypatch)
+        person = _make_person(confirmed=1, unconfirmed=0)
+
+        await analyze_person(person=person, language=Language.ENGLISH,
+                             settings=_settings(ai_base_url="https://api.deepseek.com"))
+        await analyze_person(person=person, language=Language.ENGLISH,
+                             settings=_settings(ai_base_url="http://localhost:11434/v1"))
+
+        assert completions.calls[0]["stream_options"] == {"include_usage": True}
+        assert "stream_options" not in completions.calls[1]
+
+    @pytest.mark.asyncio
+    async def test_raw_text_kept_on_request(self, monkeypatch):
+        _fake_client(monkeypatch)
+        settings = _settings(ai_keep_raw_text=True)
+
+        report = await analyze_person(person=_make_person(confirmed=1, unconfirmed=0), language=Language.ENGLISH,
+                                      settings=settings)
+
+        assert report.raw["raw_text"] == _GOOD_CONTENT
+
+    @pytest.mark.asyncio
+    async def test_template_aborts_stream_and_retries(self, monkeypatch):
+        template = json.dumps({
+            "summary": "Markdown text with the six sections above.",
+            "highlights": ["3-5 high-impact deductions."],
+            "confidence": 0.5,
+        }) + " " * 500
+        completions = _fake_client(monkeypatch, template, _GOOD_CONTENT)
+        person = _make_person(confirmed=1, unconfirmed=0)
+        settings = _settings(ai_max_retries=1)
+
+        report = await analyze_person(person=person, language=Language.ENGLISH, settings=settings)
+
+        assert len(completions.calls) == 2
+        first = completions.streams[0]
+        assert first.closed
+        assert first.consumed < len(first.pieces)
+        assert report.model == "deepseek-chat"
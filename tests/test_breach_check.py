@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from adapters.breach_check import _build_hibp_headers
+import pytest
+
+from adapters.breach_check import _build_hibp_headers, _parse_breaches
 
 
 class TestBuildHibpHeaders:
@@ -31,3 +33,136 @@ class TestBuildHibpHeaders:
         rid = h["request-id"]
         assert rid.startswith("|")
         assert "." in rid
+
+
+class TestParseBreaches:
+    _VALID = {
+        "Title": "Adobe", "Domain": "adobe.com", "BreachDate": "2013-10-04",
+        "PwnCount": 1, "Description": "d", "DataClasses": ["Emails"],
+    }
+
+    def test_valid_list(self):
+        breaches = _parse_breaches([self._VALID, {**self._VALID, "Title": "LinkedIn"}])
+        assert [b.title for b in breaches] == ["Adobe", "LinkedIn"]
+
+    def test_malformed_items_are_skipped(self):
+        breaches = _parse_breaches([{"Title": "broken"}, "junk", self._VALID])
+        assert [b.title for b in breaches] == ["Adobe"]
+
+    def test_non_list_payload(self):
+        assert _parse_breaches({"Title": "Adobe"}) == []
+        assert _parse_breaches(None) == []
+
+
+# ---------------------------------------------------------------------------
+# enrich_profiles_with_breach_data (HTTP mocked)
+# ---------------------------------------------------------------------------
+
+def _mock_httpx(monkeypatch, handler):
+    import httpx
+
+    import adapters.breach_check as breach_check
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(breach_check, "tls_client", None)
+    monkeypatch.setattr(
+        breach_check.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+
+class TestEnrichProfilesWithBreachData:
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order_and_isolate_failures(self, monkeypatch):
+        import httpx
+
+        from adapters.breach_check import enrich_profiles_with_breach_data
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            email = request.url.path.rsplit("/", 1)[-1]
+            if email.startswith("pwned"):
+                return httpx.Response(200, json={"Breaches": [{
+                    "Title": "Adobe", "Domain": "adobe.com", "BreachDate": "2013-10-04",
+                    "PwnCount": 152445165, "Description": "d", "DataClasses": ["Emails"],
+                }, {"Title": "broken"}]})
+            return httpx.Response(404)
+
+        _mock_httpx(monkeypatch, handler)
+        profiles = await enrich_profiles_with_breach_data(["clean@x.com", "pwned@x.com"])
+
+        assert [p.username for p in profiles] == ["clean@x.com", "pwned@x.com"]
+        assert profiles[0].exists is False
+        assert profiles[0].metadata["error"] == "hibp_http_404"
+        assert profiles[1].exists is True
+        assert profiles[1].metadata["breach_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_input_makes_no_requests(self, monkeypatch):
+        from adapters.breach_check import enrich_profiles_with_breach_data
+
+        def handler(request):  # pragma: no cover - must not be called
+            raise AssertionError("unexpected request")
+
+        _mock_httpx(monkeypatch, handler)
+        assert await enrich_profiles_with_breach_data([]) == []
+
+    @pytest.mark.asyncio
+    async def test_tls_session_is_reused_across_calls(self, monkeypatch):
+        from types import SimpleNamespace
+
+        import adapters.breach_check as breach_check
+
+        created: list[object] = []
+
+        class _Session:
+            def __init__(self, **kwargs):
+                created.append(self)
+
+            def get(self, url, headers=None):
+                return SimpleNamespace(status_code=404, json=lambda: None)
+
+        monkeypatch.setattr(breach_check, "tls_client", SimpleNamespace(Session=_Session))
+        monkeypatch.setattr(breach_check, "_TLS_SESSION", None)
+
+        await breach_check.enrich_profiles_with_breach_data(["a@x.com"])
+        await breach_check.enrich_profiles_with_breach_data(["b@x.com", "c@x.com"])
+
+        assert len(created) == 1
+
+    @pytest.mark.asyncio
+    async def test_tls_session_calls_never_overlap(self, monkeypatch):
+        import threading
+        import time
+        from types import SimpleNamespace
+
+        import adapters.breach_check as breach_check
+        from core.config import get_settings
+
+        state = {"active": 0, "peak": 0, "calls": 0}
+        guard = threading.Lock()
+
+        class _Session:
+            def __init__(self, **kwargs):
+                pass
+
+            def get(self, url, headers=None):
+                with guard:
+                    state["active"] += 1
+                    state["calls"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                time.sleep(0.01)
+                with guard:
+                    state["active"] -= 1
+                return SimpleNamespace(status_code=404, json=lambda: None)
+
+        monkeypatch.setattr(breach_check, "tls_client", SimpleNamespace(Session=_Session))
+        monkeypatch.setattr(breach_check, "_TLS_SESSION", None)
+
+        settings = get_settings().model_copy(update={"hibp_concurrency": 8})
+        emails = [f"user{i}@x.com" for i in range(8)]
+        profiles = await breach_check.enrich_profiles_with_breach_data(emails, settings=settings)
+
+        assert len(profiles) == 8
+        assert state["calls"] == 8
+        assert state["peak"] == 1
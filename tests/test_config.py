@@ -0,0 +1,82 @@
+"""Tests for settings loading: shared AppSettings cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from core.config import _parse_env_lines, get_settings, write_user_env_vars
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings():
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+class TestGetSettings:
+    def test_returns_same_instance(self):
+        assert get_settings() is get_settings()
+
+    def test_shared_instance_is_immutable(self):
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            get_settings().http_timeout_seconds = 1.0
+
+    def test_write_user_env_vars_invalidates_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        before = get_settings()
+
+        write_user_env_vars({"OSINT_D2_PROXY_COUNTRY": "us"})
+
+        assert (tmp_path / "osint-d2" / ".env").exists()
+        assert get_settings() is not before
+
+
+class TestParseEnvLines:
+    def test_quoted_unquoted_comments_and_crlf(self):
+        text = (
+            "# OSINT-D2 user config (.env)\n"
+            "\n"
+            "OSINT_D2_AI_MODEL = gpt-4o-mini \n"
+            'OSINT_D2_AI_BASE_URL="https://api.example.com/v1"\r\n'
+            "OSINT_D2_AI_API_KEY='sk-x=y'\n"
+            "OSINT_D2_PROXY_MODE=\n"
+            "not a pair\n"
+        )
+
+        assert _parse_env_lines(text) == {
+            "OSINT_D2_AI_MODEL": "gpt-4o-mini",
+            "OSINT_D2_AI_BASE_URL": "https://api.example.com/v1",
+            "OSINT_D2_AI_API_KEY": "sk-x=y",
+            "OSINT_D2_PROXY_MODE": "",
+        }
+
+    def test_write_user_env_vars_round_trip(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        write_user_env_vars({"B": "2"})
+        path = write_user_env_vars({"A": "1"})
+
+        assert _parse_env_lines(path.read_text(encoding="utf-8")) == {"A": "1", "B": "2"}
+
+    def test_write_is_atomic_and_skips_identical_content(self, monkeypatch, tmp_path):
+        import os
+
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        path = write_user_env_vars({"A": "1"})
+        replaced: list[tuple[str, str]] = []
+        real_replace = os.replace
+
+        def spy(src, dst):
+            replaced.append((str(src), str(dst)))
+            real_replace(src, dst)
+
+        monkeypatch.setattr("core.config.os.replace", spy)
+        write_user_env_vars({"A": "1"})
+        assert replaced == []
+
+        write_user_env_vars({"A": "2"})
+        assert replaced == [(str(path) + ".tmp", str(path))]
+        assert _parse_env_lines(path.read_text(encoding="utf-8")) == {"A": "2"}
+        assert sorted(p.name for p in path.parent.iterdir()) == [".env"]
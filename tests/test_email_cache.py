@@ -0,0 +1,82 @@
+"""Tests for the in-memory TTL/LRU cache and hashing helpers used by email scanners."""
+
+from __future__ import annotations
+
+from adapters.email_sources._cache import ProfileTTLCache
+from core.domain.models import SocialProfile
+
+
+def _profile(name: str) -> SocialProfile:
+    return SocialProfile(url=f"https://x/{name}", username=name, network_name="gravatar", exists=True)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestProfileTTLCache:
+    def test_hit_returns_copy(self):
+        cache = ProfileTTLCache()
+        cache.set("k", _profile("a"))
+        hit = cache.get("k")
+        hit.metadata["x"] = 1
+        assert cache.get("k").metadata == {}
+
+    def test_entries_expire(self):
+        clock = _Clock()
+        cache = ProfileTTLCache(ttl_seconds=10, clock=clock)
+        cache.set("k", _profile("a"))
+        clock.now = 9.9
+        assert cache.get("k") is not None
+        clock.now = 10.0
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = ProfileTTLCache(maxsize=2)
+        cache.set("a", _profile("a"))
+        cache.set("b", _profile("b"))
+        cache.get("a")  # "b" pasa a ser el menos reciente
+        cache.set("c", _profile("c"))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+
+class TestEmailSha256:
+    def test_normalizes_and_memoizes(self):
+        import hashlib
+
+        from adapters.email_sources._hashing import email_sha256
+
+        email_sha256.cache_clear()
+        expected = hashlib.sha256(b"jane@example.com").hexdigest()
+
+        assert email_sha256(" Jane@Example.com ") == expected
+        assert email_sha256(" Jane@Example.com ") == expected
+        assert email_sha256.cache_info().hits == 1
+
+
+class TestTTLCache:
+    def test_cached_none_is_distinguishable_from_miss(self):
+        from adapters.ttl_cache import TTLCache
+
+        miss = object()
+        cache: TTLCache[dict | None] = TTLCache()
+        assert cache.get("k", miss) is miss
+        cache.set("k", None)
+        assert cache.get("k", miss) is None
+
+    def test_values_are_copied(self):
+        from adapters.ttl_cache import TTLCache
+
+        cache: TTLCache[dict] = TTLCache()
+        value = {"items": [1]}
+        cache.set("k", value)
+        value["items"].append(2)
+        cache.get("k")["items"].append(3)
+        assert cache.get("k") == {"items": [1]}
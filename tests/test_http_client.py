@@ -2,7 +2,18 @@
 
 from __future__ import annotations
 
-from adapters.http_client import _build_proxy_url, build_async_client
+import httpx
+import pytest
+
+from adapters.http_client import (
+    _SHARED_CLIENTS,
+    _build_proxy_url,
+    build_async_client,
+    close_shared_clients,
+    extract_html_metadata,
+    get_shared_client,
+    response_json,
+)
 from core.config import AppSettings
 
 
@@ -171,6 +182,85 @@ class TestBuildAsyncClient:
             "TLS verification must be enabled even when a proxy is configured"
         )
 
+    def test_default_pool_keeps_httpx_caps(self):
+        client = build_async_client(AppSettings(proxy_api_key=None))
+        pool = client._transport._pool
+        assert pool._max_connections == 100
+        assert pool._max_keepalive_connections == 20
+
+
+# ---------------------------------------------------------------------------
+# get_shared_client
+# ---------------------------------------------------------------------------
+
+class TestSharedClient:
+    @pytest.mark.asyncio
+    async def test_reused_for_same_settings(self):
+        settings = AppSettings(proxy_api_key=None)
+        a = get_shared_client(settings)
+        b = get_shared_client(AppSettings(proxy_api_key=None))
+        c = get_shared_client(AppSettings(proxy_api_key=None, user_agent="other-agent"))
+        try:
+            assert a is b
+            assert a is not c
+        finally:
+            await close_shared_clients()
+        assert a.is_closed and c.is_closed
+        assert not _SHARED_CLIENTS
+
+    @pytest.mark.asyncio
+    async def test_http2_only_when_h2_available(self, monkeypatch):
+        import adapters.http_client as http_client
+
+        monkeypatch.setattr(http_client, "h2", None)
+        client = get_shared_client(AppSettings(proxy_api_key=None))
+        try:
+            assert client._transport._pool._http2 is False
+            assert client._transport._pool._keepalive_expiry == 30.0
+        finally:
+            await close_shared_clients()
+
+    @pytest.mark.asyncio
+    async def test_key_does_not_hold_proxy_secret(self):
+        get_shared_client(AppSettings(proxy_api_key="LIVE_SECRET_KEY", proxy_username="u"))
+        try:
+            assert all("LIVE_SECRET_KEY" not in str(key) for key in _SHARED_CLIENTS)
+        finally:
+            await close_shared_clients()
+
+    @pytest.mark.asyncio
+    async def test_does_not_persist_cookies(self):
+        seen: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("cookie"))
+            return httpx.Response(200, headers={"set-cookie": "sessionid=abc; Path=/"})
+
+        client = get_shared_client(AppSettings(proxy_api_key=None))
+        client._transport = httpx.MockTransport(handler)
+        try:
+            await client.get("https://www.instagram.com/alice/")
+            await client.get("https://www.instagram.com/bob/")
+        finally:
+            await close_shared_clients()
+
+        assert seen == [None, None]
+        assert not client.cookies
+
+
+class TestResponseJson:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_matches_httpx_json(self, monkeypatch, use_orjson):
+        import adapters.http_client as http_client
+
+        if not use_orjson:
+            monkeypatch.setattr(http_client, "orjson", None)
+        resp = httpx.Response(200, json={"name": "Jané", "repos": [1, 2]})
+        assert response_json(resp) == resp.json()
+
+        with pytest.raises(ValueError):
+            response_json(httpx.Response(200, content=b"<html>"))
+
 
 # ---------------------------------------------------------------------------
 # effective_proxy_mode
@@ -227,3 +317,54 @@ class TestSecretStrRedaction:
         repr_str = repr(settings)
         assert "secret123" not in repr_str
         assert "sk-secret" not in repr_str
+
+
+class TestExtractHtmlMetadataOgImage:
+    _HTML = '<html><head><meta property="og:image" content="{src}"></head><body></body></html>'
+
+    @pytest.mark.parametrize(
+        "base_url",
+        ["https://example.com/users/jane", httpx.URL("https://example.com/users/jane")],
+    )
+    def test_relative_og_image_is_resolved(self, base_url):
+        meta = extract_html_metadata(html=self._HTML.format(src="../img/a.png"), base_url=base_url)
+        assert meta["og_image"] == "https://example.com/img/a.png"
+
+    def test_absolute_og_image_is_kept(self):
+        src = "https://cdn.example.net/a.png"
+        meta = extract_html_metadata(html=self._HTML.format(src=src), base_url=httpx.URL("https://example.com/"))
+        assert meta["og_image"] == src
+
+
+class TestHeadMetadataParserBody:
+    _HTML = (
+        "<html><head><title>Jane</title>"
+        '<meta name="description" content="Bio"><style>.x{content:"css@style.example"}</style></head>'
+        "<body><p>Write to jane@example.com</p>"
+        '<a href="mailto:press@example.org">press</a>'
+        '<a href="https://gitlab.com/jane">GitLab</a><a href="/about">about</a>'
+        '<script>var s = "bot@tracker.example";</script>'
+        "<p>also on twitter.com/jane_d</p></body></html>"
+    )
+
+    def test_matches_extract_html_metadata(self):
+        from adapters.http_client import HeadMetadataParser
+
+        parser = HeadMetadataParser(collect_body=True)
+        for i in range(0, len(self._HTML), 17):
+            parser.feed(self._HTML[i:i + 17])
+        parser.close()
+
+        incremental = parser.metadata(base_url="https://example.com/jane")
+        assert incremental == extract_html_metadata(html=self._HTML, base_url="https://example.com/jane")
+        assert incremental["emails"] == ["jane@example.com", "press@example.org"]
+        assert incremental["external_links"] == ["https://gitlab.com/jane"]
+        assert {s["network"] for s in incremental["social_links"]} == {"gitlab", "twitter"}
+
+    def test_head_only_by_default(self):
+        from adapters.http_client import HeadMetadataParser
+
+        parser = HeadMetadataParser()
+        parser.feed(self._HTML)
+
+        assert set(parser.metadata()) == {"title", "meta_description"}
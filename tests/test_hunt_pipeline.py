@@ -87,6 +87,66 @@ class TestExpansionLoop:
         assert "primary" in scanned_users
         assert "discovered_user" in scanned_users
 
+    @pytest.mark.asyncio
+    async def test_scans_run_concurrently_within_bound(self):
+        """Usernames, emails and localparts share one bounded pool of scan workers."""
+        import asyncio
+
+        state = {"active": 0, "peak": 0}
+
+        class SlowScanner:
+            async def scan(self, value: str):
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.01)
+                state["active"] -= 1
+                return _profile(network="slow", username=value)
+
+        with patch(
+            "core.services.identity_pipeline._USERNAME_SCANNERS",
+            (SlowScanner, SlowScanner, SlowScanner),
+        ), patch(
+            "core.services.identity_pipeline._EMAIL_SCANNERS",
+            (SlowScanner, SlowScanner),
+        ):
+            settings = AppSettings(scanner_concurrency=4)
+            request = HuntRequest(
+                usernames=["alpha", "beta"],
+                emails=["gamma@example.com"],
+                scan_localpart=True,
+                site_lists=SiteListOptions(enabled=False),
+                use_sherlock=False,
+            )
+            result = await hunt(settings=settings, request=request)
+
+        assert state["peak"] == 4
+        assert {"alpha", "beta", "gamma"} <= {p.username for p in result.person.profiles}
+
+    @pytest.mark.asyncio
+    async def test_chained_expansion_scans_each_value_once(self):
+        """Extras found in later rounds are still picked up (a -> b -> c)."""
+        chain = {"a": "b", "b": "c"}
+        scanned: list[str] = []
+
+        class ChainScanner:
+            async def scan(self, value: str):
+                scanned.append(value)
+                meta = {"other_users": [chain[value]]} if value in chain else {}
+                return _profile(network="chain", username=value, **meta)
+
+        with patch(
+            "core.services.identity_pipeline._USERNAME_SCANNERS",
+            (ChainScanner,),
+        ), patch(
+            "core.services.identity_pipeline._EMAIL_SCANNERS",
+            (),
+        ):
+            request = HuntRequest(usernames=["a"], emails=[], scan_localpart=False, use_sherlock=False)
+            result = await hunt(settings=AppSettings(), request=request)
+
+        assert scanned == ["a", "b", "c"]
+        assert result.usernames == ["a", "b", "c"]
+
     @pytest.mark.asyncio
     async def test_expansion_terminates_when_nothing_new(self):
         """The loop should terminate when no new usernames/emails are found."""
@@ -121,6 +181,43 @@ class TestExpansionLoop:
         assert len(result.person.profiles) == 1
 
 
+    @pytest.mark.asyncio
+    async def test_worker_survives_errors_after_scan(self):
+        """A failure while expanding a result is logged and does not stall the queue."""
+        import asyncio
+
+        failures = {"left": 1}
+
+        class ExplodingStr(str):
+            def strip(self, *args):
+                # Only the first call fails: the expansion inside the worker.
+                if failures["left"]:
+                    failures["left"] -= 1
+                    raise RuntimeError("boom")
+                return str.strip(self, *args)
+
+        class OddMetadataScanner:
+            async def scan(self, value: str):
+                profile = _profile(network="odd", username=value)
+                if value == "bad":
+                    profile.metadata = {"other_users": [ExplodingStr("alias")]}
+                return profile
+
+        with patch(
+            "core.services.identity_pipeline._USERNAME_SCANNERS",
+            (OddMetadataScanner,),
+        ), patch(
+            "core.services.identity_pipeline._EMAIL_SCANNERS",
+            (),
+        ), patch("core.services.identity_pipeline.logger.exception") as log_exception:
+            request = HuntRequest(usernames=["bad", "good"], emails=[], scan_localpart=False, use_sherlock=False)
+            result = await asyncio.wait_for(
+                hunt(settings=AppSettings(scanner_concurrency=1), request=request), timeout=5
+            )
+
+        assert log_exception.call_count == 1
+        assert "good" in {p.username for p in result.person.profiles}
+
 # ---------------------------------------------------------------------------
 # Sherlock integration
 # ---------------------------------------------------------------------------
@@ -177,6 +274,47 @@ class TestSherlockIntegration:
         networks = {p.network_name for p in result.person.profiles}
         assert "reddit" in networks
 
+    @pytest.mark.asyncio
+    async def test_progress_total_counts_eligible_sites_per_username(self):
+        manifest = {
+            "$schema": "schema.json",
+            "SafeA": {"url": "http://a/{}"},
+            "SafeB": {"url": "http://b/{}", "isNSFW": False},
+            "Adult": {"url": "http://n/{}", "isNSFW": True},
+            "Broken": "not-a-dict",
+        }
+        totals: list[int] = []
+
+        class EmptyScanner:
+            async def scan(self, value: str):
+                return _profile(network="empty", username=value)
+
+        with patch(
+            "core.services.identity_pipeline._USERNAME_SCANNERS",
+            (EmptyScanner,),
+        ), patch(
+            "core.services.identity_pipeline._EMAIL_SCANNERS",
+            (),
+        ), patch(
+            "core.services.identity_pipeline.run_sherlock_username",
+            AsyncMock(return_value=([], 0)),
+        ):
+            request = HuntRequest(
+                usernames=["one", "two", "three"],
+                emails=[],
+                scan_localpart=False,
+                use_sherlock=True,
+                sherlock_manifest=manifest,
+                site_lists=SiteListOptions(enabled=False, no_nsfw=True),
+            )
+            await hunt(
+                settings=AppSettings(),
+                request=request,
+                hooks=PipelineHooks(sherlock_start=totals.append),
+            )
+
+        assert totals == [2 * 3]
+
 
 # ---------------------------------------------------------------------------
 # Site-list integration
@@ -238,7 +376,7 @@ class TestBreachCheckIntegration:
         """When use_breach_check=True, enrich_profiles_with_breach_data is called."""
 
         breach_profile = _profile(network="hibp", username="test@test.com")
-        mock_breach = MagicMock(return_value=[breach_profile])
+        mock_breach = AsyncMock(return_value=[breach_profile])
 
         class EmptyScanner:
             async def scan(self, value: str):
@@ -270,7 +408,7 @@ class TestBreachCheckIntegration:
             )
             await hunt(settings=settings, request=request)
 
-        mock_breach.assert_called_once_with(emails=["test@test.com"])
+        mock_breach.assert_awaited_once_with(emails=["test@test.com"], settings=settings)
 
 
 # ---------------------------------------------------------------------------
@@ -310,3 +448,114 @@ class TestPipelineDeduplication:
 
         github_profiles = [p for p in result.person.profiles if p.network_name == "github"]
         assert len(github_profiles) == 1
+
+    @pytest.mark.asyncio
+    async def test_dropped_duplicate_still_contributes_extras(self):
+        """A duplicate is not kept, but its metadata still feeds the expansion."""
+
+        class PlainScanner:
+            async def scan(self, value: str):
+                return _profile(network="github", username=value)
+
+        class RicherDuplicateScanner:
+            async def scan(self, value: str):
+                meta = {"other_users": ["alias"]} if value == "user" else {}
+                return _profile(network="github", username=value, **meta)
+
+        with patch(
+            "core.services.identity_pipeline._USERNAME_SCANNERS",
+            (PlainScanner, RicherDuplicateScanner),
+        ), patch(
+            "core.services.identity_pipeline._EMAIL_SCANNERS",
+            (),
+        ):
+            request = HuntRequest(usernames=["user"], emails=[], scan_localpart=False, use_sherlock=False)
+            result = await hunt(settings=AppSettings(), request=request)
+
+        assert [p.username for p in result.person.profiles] == ["user", "alias"]
+        assert "other_users" not in result.person.profiles[0].metadata
+
+    @pytest.mark.asyncio
+    async def test_scanners_are_built_once_across_hunts(self):
+        built: list[int] = []
+
+        class CountingScanner:
+            def __init__(self) -> None:
+                built.append(1)
+
+            async def scan(self, value: str):
+                return _profile(network="counting", username=value)
+
+        with patch(
+            "core.services.identity_pipeline._USERNAME_SCANNERS",
+            (CountingScanner,),
+        ), patch(
+            "core.services.identity_pipeline._EMAIL_SCANNERS",
+            (),
+        ):
+            for name in ("first", "second"):
+                request = HuntRequest(usernames=[name], emails=[], scan_localpart=False, use_sherlock=False)
+                await hunt(settings=AppSettings(), request=request)
+
+        assert len(built) == 1
+
+    @pytest.mark.asyncio
+    async def test_usernames_keep_input_then_discovery_order(self):
+        class AliasScanner:
+            async def scan(self, value: str):
+                meta = {"other_users": ["beta", "zeta"]} if value == "zeta" else {}
+                return _profile(network="alias", username=value, **meta)
+
+        with patch(
+            "core.services.identity_pipeline._USERNAME_SCANNERS",
+            (AliasScanner,),
+        ), patch(
+            "core.services.identity_pipeline._EMAIL_SCANNERS",
+            (),
+        ):
+            request = HuntRequest(
+                usernames=["zeta", " alpha ", "zeta"], emails=[], scan_localpart=False, use_sherlock=False
+            )
+            result = await hunt(settings=AppSettings(), request=request)
+
+        assert result.usernames == ["zeta", "alpha", "beta"]
+        assert result.person.target == "zeta/alpha/beta"
+
+    @pytest.mark.asyncio
+    async def test_expansion_does_not_wait_for_slow_scans(self):
+        """Extras are scanned while an unrelated slow scan is still running."""
+        import asyncio
+
+        events: list[str] = []
+
+        class MixedScanner:
+            async def scan(self, value: str):
+                if value == "slow":
+                    await asyncio.sleep(0.05)
+                events.append(value)
+                meta = {"other_users": ["found"]} if value == "fast" else {}
+                return _profile(network="mixed", username=value, **meta)
+
+        with patch(
+            "core.services.identity_pipeline._USERNAME_SCANNERS",
+            (MixedScanner,),
+        ), patch(
+            "core.services.identity_pipeline._EMAIL_SCANNERS",
+            (),
+        ):
+            request = HuntRequest(usernames=["slow", "fast"], emails=[], scan_localpart=False, use_sherlock=False)
+            result = await hunt(settings=AppSettings(scanner_concurrency=2), request=request)
+
+        assert events == ["fast", "found", "slow"]
+        # Profiles keep submission order, not completion order.
+        assert [p.username for p in result.person.profiles] == ["slow", "fast", "found"]
+
+
+class TestPipelineDataclasses:
+    def test_use_slots(self):
+        from core.services.identity_pipeline import PipelineResult
+
+        for cls in (SiteListOptions, HuntRequest, PipelineHooks, PipelineResult):
+            assert "__slots__" in cls.__dict__
+        with pytest.raises(AttributeError):
+            HuntRequest(usernames=["x"], emails=[]).unknown = True  # type: ignore[attr-defined]
@@ -52,6 +52,14 @@ class TestSanitizeTarget:
     def test_preserves_alphanumeric_and_dots(self):
         assert sanitize_target_for_filename("user.name_123") == "user.name_123"
 
+    def test_matches_per_char_rules(self):
+        value = " ángel@x+y/z:ñ\u0301 日本_.-é\t"
+        expected = "".join(
+            ch if ch.isalnum() or ch in "-_." else "_" if ch in "@+" else "-"
+            for ch in value.strip()
+        ).strip("-_")
+        assert sanitize_target_for_filename(value) == expected
+
     def test_unicode_handled(self):
         result = sanitize_target_for_filename("ángel")
         assert isinstance(result, str)
@@ -151,7 +159,7 @@ class TestStrictKeepProfile:
             exists=True,
             metadata={"source": "builtin"},
         )
-        assert _strict_keep_profile(profile=p, username="u") is True
+        assert _strict_keep_profile(profile=p, usernames=["u"]) is True
 
     def test_sherlock_valid_url_kept(self):
         p = self._sherlock_profile(
@@ -159,7 +167,7 @@ class TestStrictKeepProfile:
             username="doble2",
             final_url="https://reddit.com/user/doble2",
         )
-        assert _strict_keep_profile(profile=p, username="doble2") is True
+        assert _strict_keep_profile(profile=p, usernames=["doble2"]) is True
 
     def test_sherlock_login_url_rejected(self):
         p = self._sherlock_profile(
@@ -167,7 +175,7 @@ class TestStrictKeepProfile:
             username="doble2",
             final_url="https://somesite.com/login?redirect=/doble2",
         )
-        assert _strict_keep_profile(profile=p, username="doble2") is False
+        assert _strict_keep_profile(profile=p, usernames=["doble2"]) is False
 
     def test_sherlock_consent_url_rejected(self):
         p = self._sherlock_profile(
@@ -175,7 +183,7 @@ class TestStrictKeepProfile:
             username="u",
             final_url="https://somesite.com/consent?u=doble2",
         )
-        assert _strict_keep_profile(profile=p, username="u") is False
+        assert _strict_keep_profile(profile=p, usernames=["u"]) is False
 
     def test_sherlock_denied_network_rejected(self):
         p = self._sherlock_profile(
@@ -183,11 +191,11 @@ class TestStrictKeepProfile:
             username="doble2",
             final_url="https://fanpop.com/doble2",
         )
-        assert _strict_keep_profile(profile=p, username="doble2") is False
+        assert _strict_keep_profile(profile=p, usernames=["doble2"]) is False
 
     def test_not_exists_rejected(self):
         p = self._sherlock_profile(network="x", username="u", exists=False)
-        assert _strict_keep_profile(profile=p, username="u") is False
+        assert _strict_keep_profile(profile=p, usernames=["u"]) is False
 
     def test_username_not_in_url_checks_title(self):
         p = SocialProfile(
@@ -201,8 +209,17 @@ class TestStrictKeepProfile:
                 "title": "doble2's profile page",
             },
         )
-        assert _strict_keep_profile(profile=p, username="doble2") is True
+        assert _strict_keep_profile(profile=p, usernames=["doble2"]) is True
+
 
+    def test_any_username_can_match(self):
+        p = self._sherlock_profile(
+            network="somesite",
+            username="alias",
+            final_url="https://somesite.com/alias",
+        )
+        assert _strict_keep_profile(profile=p, usernames=["doble2", "alias"]) is True
+        assert _strict_keep_profile(profile=p, usernames=["doble2", "other"]) is False
 
 # ---------------------------------------------------------------------------
 # Data type construction
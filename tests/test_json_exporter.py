@@ -0,0 +1,53 @@
+"""Tests for JSON export of PersonEntity."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import adapters.json_exporter as json_exporter
+from adapters.json_exporter import export_person_json
+from core.domain.models import PersonEntity, SocialProfile
+
+
+def _sample_person() -> PersonEntity:
+    return PersonEntity(
+        target="josé",
+        profiles=[
+            SocialProfile(
+                url="https://github.com/jose",
+                username="jose",
+                network_name="github",
+                exists=True,
+                bio="Desarrollador — señor",
+                metadata={"b": 1, "a": [1.5, None]},
+            ),
+        ],
+    )
+
+
+class TestExportPersonJson:
+    def test_round_trips_and_keeps_utf8(self, tmp_path):
+        path = export_person_json(person=_sample_person(), output_path=tmp_path / "out" / "p.json")
+
+        raw = path.read_text(encoding="utf-8")
+        assert raw.endswith("}\n")
+        assert "señor" in raw
+        assert json.loads(raw)["profiles"][0]["metadata"] == {"a": [1.5, None], "b": 1}
+
+    def test_nested_keys_are_sorted(self, tmp_path):
+        raw = export_person_json(person=_sample_person(), output_path=tmp_path / "p.json").read_text(encoding="utf-8")
+
+        assert raw.index('"a": [') < raw.index('"b": 1')
+        assert raw.index('"profiles"') < raw.index('"target"')
+
+    @pytest.mark.skipif(json_exporter.orjson is None, reason="orjson no instalado")
+    def test_orjson_output_matches_stdlib(self, tmp_path, monkeypatch):
+        person = _sample_person()
+        fast = export_person_json(person=person, output_path=tmp_path / "fast.json").read_bytes()
+
+        monkeypatch.setattr(json_exporter, "orjson", None)
+        slow = export_person_json(person=person, output_path=tmp_path / "slow.json").read_bytes()
+
+        assert fast == slow
@@ -0,0 +1,22 @@
+"""Tests for the Language enum lookups."""
+
+from __future__ import annotations
+
+import pytest
+
+from core.domain.language import Language
+
+
+class TestLanguage:
+    @pytest.mark.parametrize("raw", ["es", " ES ", "spanish", "Spanish"])
+    def test_from_str_accepts_value_or_name(self, raw: str):
+        assert Language.from_str(raw) is Language.SPANISH
+
+    def test_from_str_rejects_unknown(self):
+        with pytest.raises(ValueError, match="Unsupported language: xx"):
+            Language.from_str(" XX ")
+
+    def test_every_member_has_a_label(self):
+        assert Language.ENGLISH.label() == "English"
+        assert Language.RUSSIAN.label() == "Russian"
+        assert all(lang.label() for lang in Language)
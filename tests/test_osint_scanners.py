@@ -9,8 +9,8 @@ their deep fetch functions.
 
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
-from contextlib import asynccontextmanager
 
 import pytest
 import httpx
@@ -20,23 +20,33 @@ import httpx
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _mock_response(*, status_code: int = 200, text: str = "", url: str = "https://example.com", headers: dict | None = None) -> MagicMock:
+def _mock_response(
+    *,
+    status_code: int = 200,
+    text: str = "",
+    url: str = "https://example.com",
+    headers: dict | None = None,
+    json_body: object = None,
+) -> MagicMock:
+    if json_body is not None:
+        text = json.dumps(json_body)
     resp = MagicMock(spec=httpx.Response)
     resp.status_code = status_code
     resp.text = text
+    resp.content = text.encode()
     resp.url = httpx.URL(url)
     resp.headers = headers or {}
-    resp.json.return_value = {}
+    resp.json.return_value = {} if json_body is None else json_body
     return resp
 
 
-@asynccontextmanager
-async def _mock_client(response: MagicMock):
-    """Context manager that yields a mock AsyncClient."""
+def _mock_shared_client(response: MagicMock) -> AsyncMock:
+    """Mock del cliente compartido (``get_shared_client``)."""
     client = AsyncMock()
     client.get = AsyncMock(return_value=response)
+    client.head = AsyncMock(return_value=response)
     client.post = AsyncMock(return_value=response)
-    yield client
+    return client
 
 
 # ---------------------------------------------------------------------------
@@ -49,7 +59,7 @@ class TestXScanner:
         from adapters.osint_sources.x import XScanner
 
         resp = _mock_response(status_code=200, url="https://x.com/testuser")
-        with patch("adapters.osint_sources.x.build_async_client", return_value=_mock_client(resp)):
+        with patch("adapters.osint_sources.x.get_shared_client", return_value=_mock_shared_client(resp)):
             scanner = XScanner()
             profile = await scanner.scan("testuser")
 
@@ -62,11 +72,25 @@ class TestXScanner:
         from adapters.osint_sources.x import XScanner
 
         resp = _mock_response(status_code=404, url="https://x.com/nonexistent")
-        with patch("adapters.osint_sources.x.build_async_client", return_value=_mock_client(resp)):
+        client = _mock_shared_client(resp)
+        with patch("adapters.osint_sources.x.get_shared_client", return_value=client):
             scanner = XScanner()
             profile = await scanner.scan("nonexistent")
 
         assert profile.exists is False
+        client.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_get_when_head_is_blocked(self):
+        from adapters.osint_sources.x import XScanner
+
+        client = _mock_shared_client(_mock_response(status_code=200, url="https://x.com/testuser"))
+        client.head = AsyncMock(return_value=_mock_response(status_code=403))
+        with patch("adapters.osint_sources.x.get_shared_client", return_value=client):
+            profile = await XScanner().scan("testuser")
+
+        assert profile.exists is True
+        client.get.assert_awaited_once()
 
 
 # ---------------------------------------------------------------------------
@@ -80,7 +104,7 @@ class TestGitLabScanner:
 
         html = "<html><head><title>John Doe · GitLab</title></head><body></body></html>"
         resp = _mock_response(status_code=200, text=html, url="https://gitlab.com/johndoe")
-        with patch("adapters.osint_sources.gitlab.build_async_client", return_value=_mock_client(resp)):
+        with patch("adapters.osint_sources.gitlab.get_shared_client", return_value=_mock_shared_client(resp)):
             scanner = GitLabScanner()
             profile = await scanner.scan("johndoe")
 
@@ -88,18 +112,237 @@ class TestGitLabScanner:
         assert profile.network_name == "gitlab"
         assert profile.metadata.get("name") == "John Doe"
 
+    @pytest.mark.asyncio
+    async def test_title_with_attributes_and_entities(self):
+        from adapters.osint_sources.gitlab import GitLabScanner
+
+        html = '<html><head><TITLE data-x="1">O&#39;Brien &amp; Co · GitLab</TITLE></head></html>'
+        resp = _mock_response(status_code=200, text=html, url="https://gitlab.com/obrien")
+        with patch("adapters.osint_sources.gitlab.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await GitLabScanner().scan("obrien")
+
+        assert profile.metadata["name"] == "O'Brien & Co"
+
     @pytest.mark.asyncio
     async def test_not_exists_on_404(self):
         from adapters.osint_sources.gitlab import GitLabScanner
 
         resp = _mock_response(status_code=404, url="https://gitlab.com/nobody")
-        with patch("adapters.osint_sources.gitlab.build_async_client", return_value=_mock_client(resp)):
+        with patch("adapters.osint_sources.gitlab.get_shared_client", return_value=_mock_shared_client(resp)):
             scanner = GitLabScanner()
             profile = await scanner.scan("nobody")
 
         assert profile.exists is False
 
 
+# ---------------------------------------------------------------------------
+# Medium / About.me Scanners (parseo HTML)
+# ---------------------------------------------------------------------------
+
+class TestMediumScanner:
+    _HTML = (
+        '<html><head><meta property="og:title" content="Jane Roe – Medium">'
+        '<meta name="description" content="Writer">'
+        '<meta property="og:image" content="https://cdn.medium.com/jane.png"></head>'
+        "<body><h2>Post A</h2><h3>Intro A</h3><h2> </h2><h2>Post B</h2><h3>Intro B</h3></body></html>"
+    )
+
+    @pytest.mark.asyncio
+    async def test_extracts_meta_and_posts(self):
+        from adapters.osint_sources.medium import MediumScanner
+
+        resp = _mock_response(status_code=200, text=self._HTML, url="https://medium.com/@jane")
+        with patch("adapters.osint_sources.medium.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await MediumScanner().scan("jane")
+
+        assert profile.exists is True
+        assert profile.metadata["name"] == "Jane Roe"
+        assert profile.metadata["description"] == "Writer"
+        assert profile.metadata["avatar_url"] == "https://cdn.medium.com/jane.png"
+        assert profile.metadata["recent_posts"] == [
+            {"title": "Post A", "content": "Intro A"},
+            {"title": "Post B", "content": "Intro B"},
+        ]
+        # El cuerpo se decodifica una sola vez vía `.text`.
+        resp.aread.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_generic_medium_title_is_not_a_profile(self):
+        from adapters.osint_sources.medium import MediumScanner
+
+        html = '<html><head><meta property="og:title" content="Medium"></head></html>'
+        resp = _mock_response(status_code=200, text=html, url="https://medium.com/@ghost")
+        with patch("adapters.osint_sources.medium.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await MediumScanner().scan("ghost")
+
+        assert profile.exists is False
+        assert profile.metadata["name"] is None
+
+
+class TestPinterestScanner:
+    _HTML = (
+        '<html><body><div data-test-id="profile-name"><div>Jane Roe</div></div>'
+        '<span class="x1 y2" data-test-id="main-user-description-text">Pins about maps</span>'
+        '<img alt="Jane Roe" class="iFOUS5" draggable="true" src="https://i.pinimg.com/jane.jpg"/>'
+        '<div data-test-id="website-icon-and-url"><span>jane.dev</span></div></body></html>'
+    )
+
+    @pytest.mark.asyncio
+    async def test_extracts_profile_fields(self):
+        from adapters.osint_sources.pinterest import PinterestScanner
+
+        resp = _mock_response(status_code=200, text=self._HTML, url="https://www.pinterest.com/jane/")
+        with patch("adapters.osint_sources.pinterest.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await PinterestScanner().scan("jane")
+
+        assert profile.exists is True
+        assert profile.metadata["name"] == "Jane Roe"
+        assert profile.metadata["description"] == "Pins about maps"
+        assert profile.metadata["avatar_url"] == "https://i.pinimg.com/jane.jpg"
+        assert profile.metadata["other_websites"] == "jane.dev"
+
+    @pytest.mark.asyncio
+    async def test_description_text_and_avatar_with_special_name(self):
+        from adapters.osint_sources.pinterest import PinterestScanner
+
+        html = (
+            '<div data-test-id="profile-name"><div>J. (Roe)+ [x]</div></div>'
+            '<span data-test-id="main-user-description-text"> Maps &amp; <b>pins</b> </span>'
+            '<img alt="someone else" class="iFOUS5" src="https://i.pinimg.com/other.jpg"/>'
+            '<img alt="J. (Roe)+ [x]" class="iFOUS5" src="https://i.pinimg.com/jr.jpg"/>'
+        )
+        resp = _mock_response(status_code=200, text=html, url="https://www.pinterest.com/jr/")
+        with patch("adapters.osint_sources.pinterest.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await PinterestScanner().scan("jr")
+
+        assert profile.metadata["description"] == "Maps & pins"
+        assert profile.metadata["avatar_url"] == "https://i.pinimg.com/jr.jpg"
+
+    @pytest.mark.asyncio
+    async def test_page_is_parsed_once(self):
+        from adapters.osint_sources import pinterest
+
+        resp = _mock_response(status_code=200, text=self._HTML, url="https://www.pinterest.com/jane/")
+        with patch.object(pinterest, "get_shared_client", return_value=_mock_shared_client(resp)), \
+             patch.object(pinterest, "parse_html", wraps=pinterest.parse_html) as parse:
+            profile = await pinterest.PinterestScanner().scan("jane")
+
+        parse.assert_called_once()
+        assert profile.metadata["other_websites"] == "jane.dev"
+
+    @pytest.mark.asyncio
+    async def test_head_404_skips_body_download(self):
+        from adapters.osint_sources.pinterest import PinterestScanner
+
+        client = _mock_shared_client(_mock_response(status_code=404))
+        with patch("adapters.osint_sources.pinterest.get_shared_client", return_value=client):
+            profile = await PinterestScanner().scan("ghost")
+
+        assert profile.exists is False
+        client.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_missing_profile_name_means_not_found(self):
+        from adapters.osint_sources.pinterest import PinterestScanner
+
+        resp = _mock_response(status_code=200, text="<html><body>Log in</body></html>")
+        with patch("adapters.osint_sources.pinterest.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await PinterestScanner().scan("ghost")
+
+        assert profile.exists is False
+
+
+class TestTwitchScanner:
+    @pytest.mark.asyncio
+    async def test_reads_meta_tags(self):
+        from adapters.osint_sources.twitch import TwitchScanner
+
+        html = (
+            '<html><head><meta property="og:title" content="janeplays - Twitch">'
+            '<meta name="description" content="Speedruns">'
+            '<meta property="og:image" content="https://static-cdn.jtvnw.net/jane.png"></head></html>'
+        )
+        resp = _mock_response(status_code=200, text=html, url="https://www.twitch.tv/janeplays")
+        with patch("adapters.osint_sources.twitch.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await TwitchScanner().scan("janeplays")
+
+        assert profile.exists is True
+        assert profile.metadata["name"] == "janeplays"
+        assert profile.metadata["description"] == "Speedruns"
+        assert profile.metadata["avatar_url"] == "https://static-cdn.jtvnw.net/jane.png"
+
+    @pytest.mark.asyncio
+    async def test_not_found_status(self):
+        from adapters.osint_sources.twitch import TwitchScanner
+
+        resp = _mock_response(status_code=404)
+        with patch("adapters.osint_sources.twitch.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await TwitchScanner().scan("ghost")
+
+        assert profile.exists is False
+
+
+class TestAboutMeScanner:
+    @pytest.mark.asyncio
+    async def test_extracts_profile_fields(self):
+        from adapters.osint_sources.aboutme import AboutMeScanner
+
+        html = (
+            "<html><head><title>Jane Roe - Lisbon, Portugal | about.me</title>"
+            '<meta property="og:description" content="Short bio">'
+            '<meta property="og:image" content="https://about.me/jane.jpg"></head>'
+            '<body><section class="bio"><p>Long description</p></section></body></html>'
+        )
+        resp = _mock_response(status_code=200, text=html, url="https://about.me/jane")
+        with patch("adapters.osint_sources.aboutme.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await AboutMeScanner().scan("jane")
+
+        assert profile.exists is True
+        assert profile.metadata["name"] == "Jane Roe"
+        assert profile.metadata["bio"] == "Short bio"
+        assert profile.metadata["description"] == "Long description"
+        assert profile.metadata["avatar_url"] == "https://about.me/jane.jpg"
+        assert profile.metadata["location"] == "Lisbon, Portugal"
+
+    @pytest.mark.asyncio
+    async def test_not_found_skips_parsing(self):
+        from adapters.osint_sources.aboutme import AboutMeScanner
+
+        resp = _mock_response(status_code=404, url="https://about.me/nobody")
+        with patch("adapters.osint_sources.aboutme.get_shared_client", return_value=_mock_shared_client(resp)), \
+                patch("adapters.osint_sources.aboutme.parse_html") as parse:
+            profile = await AboutMeScanner().scan("nobody")
+
+        assert profile.exists is False
+        assert profile.metadata == {"status_code": 404, "final_url": "https://about.me/nobody"}
+        parse.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reads_json_ld_block(self):
+        from adapters.osint_sources.aboutme import AboutMeScanner
+
+        ld = (
+            '{"@context": "https://schema.org", "@graph": [{"@type": "Person",'
+            ' "address": {"addressLocality": "Porto", "addressCountry": "PT"},'
+            ' "jobTitle": "Engineer", "knowsAbout": ["OSINT", "Go"],'
+            ' "sameAs": ["https://github.com/jane"]}]}'
+        )
+        html = (
+            "<html><head><title>Jane Roe | about.me</title>"
+            f'<script type="application/ld+json">{ld}</script></head></html>'
+        )
+        resp = _mock_response(status_code=200, text=html, url="https://about.me/jane")
+        with patch("adapters.osint_sources.aboutme.get_shared_client", return_value=_mock_shared_client(resp)):
+            profiles = await AboutMeScanner().scan("jane")
+
+        main, link = profiles
+        assert main.metadata["location"] == "Porto, PT"
+        assert main.metadata["jobTitle"] == "Engineer"
+        assert main.metadata["interests"] == ["OSINT", "Go"]
+        assert link.network_name == "aboutme_social_link"
+        assert link.url == "https://github.com/jane"
+
+
 # ---------------------------------------------------------------------------
 # GitHub Scanner (mocks fetch_github_deep)
 # ---------------------------------------------------------------------------
@@ -183,6 +426,244 @@ class TestRedditScanner:
         assert profile.exists is False
 
 
+# ---------------------------------------------------------------------------
+# specific_scrapers (cliente compartido)
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def _clear_api_cache():
+    from adapters.specific_scrapers import API_CACHE
+
+    API_CACHE.clear()
+    yield
+    API_CACHE.clear()
+
+
+@pytest.mark.usefixtures("_clear_api_cache")
+class TestSpecificScrapersSharedClient:
+    @pytest.mark.asyncio
+    async def test_github_deep_reuses_shared_client_with_api_headers(self):
+        from adapters.specific_scrapers import fetch_github_deep
+
+        resp = _mock_response(url="https://api.github.com/users/octocat", json_body={"login": "octocat"})
+        client = _mock_shared_client(resp)
+
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client):
+            data = await fetch_github_deep(username="octocat")
+
+        assert data is not None
+        assert data["login"] == "octocat"
+        # Perfil + eventos sobre el mismo cliente, con el Accept de la API por petición.
+        assert client.get.await_count == 2
+        for call in client.get.await_args_list:
+            assert call.kwargs["headers"]["Accept"] == "application/vnd.github+json"
+
+    @pytest.mark.asyncio
+    async def test_reddit_about_not_found(self):
+        from adapters.specific_scrapers import fetch_reddit_user_about
+
+        client = _mock_shared_client(_mock_response(status_code=404))
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client):
+            assert await fetch_reddit_user_about(username="nobody") is None
+
+        assert "User-Agent" in client.get.await_args.kwargs["headers"]
+
+    @pytest.mark.asyncio
+    async def test_github_deep_requests_run_concurrently(self):
+        import asyncio
+
+        from adapters.specific_scrapers import fetch_github_deep
+
+        in_flight = 0
+        peak = 0
+
+        async def get(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _mock_response(
+                url=url, json_body=[] if url.endswith("/events/public") else {"login": "octocat"}
+            )
+
+        client = AsyncMock()
+        client.get = AsyncMock(side_effect=get)
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client):
+            data = await fetch_github_deep(username="octocat")
+
+        assert data == {**data, "login": "octocat", "recent_commits": []}
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_github_deep_missing_user(self):
+        from adapters.specific_scrapers import fetch_github_deep
+
+        client = _mock_shared_client(_mock_response(status_code=404))
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client):
+            assert await fetch_github_deep(username="ghost") is None
+
+    @pytest.mark.asyncio
+    async def test_definitive_responses_are_cached(self):
+        from adapters.specific_scrapers import fetch_github_user
+
+        resp = _mock_response(url="https://api.github.com/users/octocat", json_body={"login": "octocat"})
+        client = _mock_shared_client(resp)
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client):
+            first = await fetch_github_user(username="octocat")
+            first["login"] = "mutated"
+            second = await fetch_github_user(username="octocat")
+            await fetch_github_user(username="octocat", bypass_cache=True)
+
+        assert second["login"] == "octocat"
+        assert client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_cached_but_rate_limit_is_not(self):
+        from adapters.specific_scrapers import fetch_reddit_user_about
+
+        client = _mock_shared_client(_mock_response(status_code=404))
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client):
+            assert await fetch_reddit_user_about(username="ghost") is None
+            assert await fetch_reddit_user_about(username="ghost") is None
+        assert client.get.await_count == 1
+
+        from core.config import AppSettings
+
+        no_retry = AppSettings(retry_max_attempts=0)
+        client = _mock_shared_client(_mock_response(status_code=429))
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client):
+            assert await fetch_reddit_user_about(username="busy", settings=no_retry) is None
+            assert await fetch_reddit_user_about(username="busy", settings=no_retry) is None
+        assert client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_429_honoring_retry_after(self):
+        from adapters.specific_scrapers import fetch_reddit_user_about
+
+        limited = _mock_response(status_code=429, headers={"Retry-After": "2"})
+        ok = _mock_response(url="https://www.reddit.com/user/jane/about.json", json_body={"data": {"name": "jane"}})
+        client = _mock_shared_client(ok)
+        client.get = AsyncMock(side_effect=[limited, ok])
+        sleep = AsyncMock()
+
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client), \
+             patch("adapters.specific_scrapers.asyncio.sleep", sleep):
+            data = await fetch_reddit_user_about(username="jane")
+
+        assert data["name"] == "jane"
+        assert client.get.await_count == 2
+        assert 2.0 <= sleep.await_args.args[0] < 3.0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts_or_long_retry_after(self):
+        from core.config import AppSettings
+        from adapters.specific_scrapers import fetch_github_user
+
+        client = _mock_shared_client(_mock_response(status_code=503))
+        sleep = AsyncMock()
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client), \
+             patch("adapters.specific_scrapers.asyncio.sleep", sleep):
+            assert await fetch_github_user(username="a", settings=AppSettings(retry_max_attempts=2)) is None
+        assert client.get.await_count == 3
+        assert sleep.await_count == 2
+
+        client = _mock_shared_client(_mock_response(status_code=429, headers={"Retry-After": "90"}))
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client), \
+             patch("adapters.specific_scrapers.asyncio.sleep", sleep):
+            assert await fetch_github_user(username="b") is None
+        assert client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_lookups_are_bounded_per_host(self):
+        import asyncio
+
+        from core.config import AppSettings
+        from adapters.specific_scrapers import fetch_github_user
+
+        in_flight = 0
+        peak = 0
+
+        async def get(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _mock_response(url=url, json_body={"login": url.rsplit("/", 1)[-1]})
+
+        client = AsyncMock()
+        client.get = AsyncMock(side_effect=get)
+        settings = AppSettings(per_domain_concurrency=2)
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client):
+            results = await asyncio.gather(
+                *(fetch_github_user(username=f"user{i}", settings=settings) for i in range(8))
+            )
+
+        assert [r["login"] for r in results] == [f"user{i}" for i in range(8)]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_reddit_comments_stop_at_limit(self):
+        from adapters.specific_scrapers import fetch_reddit_recent_comments
+
+        children = [{"data": {"body": f"c{i}", "subreddit": f"sr{i}"}} for i in range(25)]
+        resp = _mock_response(json_body={"data": {"children": children}})
+        client = _mock_shared_client(resp)
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client):
+            data = await fetch_reddit_recent_comments(username="jane", limit=2)
+
+        assert client.get.await_args.args[0].endswith("comments.json?limit=2")
+        assert [c["body"] for c in data["recent_comments"]] == ["c0", "c1"]
+        assert data["subreddits"] == ["sr0", "sr1"]
+
+    @pytest.mark.asyncio
+    async def test_reddit_comments_skip_malformed_children(self):
+        from adapters.specific_scrapers import fetch_reddit_recent_comments
+
+        children = [
+            "junk",
+            {"kind": "more"},
+            {"data": None},
+            {"data": {"body": 42}},
+            {"data": {"body": "   "}},
+            {"data": {"body": "ok", "subreddit": "python", "created_utc": 1.5, "permalink": "/r/x", "ups": 3}},
+            {"data": {"body": "no sr", "subreddit": ""}},
+        ]
+        client = _mock_shared_client(_mock_response(json_body={"data": {"children": children}}))
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client):
+            data = await fetch_reddit_recent_comments(username="jane", limit=25)
+
+        assert data["recent_comments"] == [
+            {"body": "ok", "subreddit": "python", "created_utc": 1.5, "permalink": "/r/x"},
+            {"body": "no sr", "subreddit": "", "created_utc": None, "permalink": None},
+        ]
+        assert data["subreddits"] == ["python"]
+
+    @pytest.mark.asyncio
+    async def test_reddit_deep_reuses_one_client(self):
+        from adapters.specific_scrapers import fetch_reddit_deep
+
+        about = _mock_response(
+            url="https://www.reddit.com/user/jane/about.json",
+            json_body={"data": {"name": "jane", "subreddit": {"title": "Jane"}}},
+        )
+        comments = _mock_response(
+            url="https://www.reddit.com/user/jane/comments.json",
+            json_body={"data": {"children": [{"data": {"body": "hola", "subreddit": "python"}}]}},
+        )
+        client = _mock_shared_client(about)
+        client.get = AsyncMock(side_effect=[about, comments])
+
+        with patch("adapters.specific_scrapers.get_shared_client", return_value=client):
+            data = await fetch_reddit_deep(username="jane")
+
+        assert data is not None
+        assert data["name"] == "jane"
+        assert data["subreddits"] == ["python"]
+        assert client.get.await_count == 2
+
+
 # ---------------------------------------------------------------------------
 # Keybase Scanner
 # ---------------------------------------------------------------------------
@@ -193,7 +674,7 @@ class TestKeybaseScanner:
         from adapters.osint_sources.keybase import KeybaseScanner
 
         resp = _mock_response(status_code=200, url="https://keybase.io/user1")
-        with patch("adapters.osint_sources.keybase.build_async_client", return_value=_mock_client(resp)):
+        with patch("adapters.osint_sources._profile_page.get_shared_client", return_value=_mock_shared_client(resp)):
             scanner = KeybaseScanner()
             profile = await scanner.scan("user1")
 
@@ -205,13 +686,41 @@ class TestKeybaseScanner:
         from adapters.osint_sources.keybase import KeybaseScanner
 
         resp = _mock_response(status_code=404, url="https://keybase.io/nobody")
-        with patch("adapters.osint_sources.keybase.build_async_client", return_value=_mock_client(resp)):
+        with patch("adapters.osint_sources._profile_page.get_shared_client", return_value=_mock_shared_client(resp)):
             scanner = KeybaseScanner()
             profile = await scanner.scan("nobody")
 
         assert profile.exists is False
 
 
+class TestProfilePageScanners:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("scanner_name", "expected_url", "network"),
+        [
+            ("BehanceScanner", "https://www.behance.net/jane", "behance"),
+            ("DevToScanner", "https://dev.to/jane", "devto"),
+            ("DribbbleScanner", "https://dribbble.com/jane", "dribbble"),
+            ("GitHubGistScanner", "https://gist.github.com/jane", "github_gist"),
+            ("KaggleScanner", "https://www.kaggle.com/jane", "kaggle"),
+            ("NpmScanner", "https://www.npmjs.com/~jane", "npm"),
+            ("ProductHuntScanner", "https://www.producthunt.com/@jane", "producthunt"),
+            ("SoundCloudScanner", "https://soundcloud.com/jane", "soundcloud"),
+        ],
+    )
+    async def test_declared_url_and_network(self, scanner_name, expected_url, network):
+        import adapters.osint_sources as sources
+
+        client = _mock_shared_client(_mock_response(status_code=200, url=expected_url))
+        with patch("adapters.osint_sources._profile_page.get_shared_client", return_value=client):
+            profile = await getattr(sources, scanner_name)().scan("jane")
+
+        client.get.assert_awaited_once_with(expected_url)
+        assert profile.exists is True
+        assert profile.network_name == network
+        assert profile.metadata == {"status_code": 200, "final_url": expected_url}
+
+
 # ---------------------------------------------------------------------------
 # Telegram Scanner
 # ---------------------------------------------------------------------------
@@ -229,13 +738,33 @@ class TestTelegramScanner:
         </body></html>"""
 
         resp = _mock_response(status_code=200, text=html, url="https://t.me/chadfowler")
-        with patch("adapters.osint_sources.telegram.build_async_client", return_value=_mock_client(resp)):
+        with patch("adapters.osint_sources.telegram.get_shared_client", return_value=_mock_shared_client(resp)):
             scanner = TelegramScanner()
             profile = await scanner.scan("chadfowler")
 
         assert profile.exists is True
         assert profile.network_name == "telegram"
         assert profile.metadata.get("name") == "Chad Fowler"
+        assert profile.metadata.get("avatar_url") == "https://cdn.telegram.org/avatar.jpg"
+
+    @pytest.mark.asyncio
+    async def test_unescapes_entities_without_html_parser(self):
+        from adapters.osint_sources import _html
+        from adapters.osint_sources.telegram import TelegramScanner
+
+        html = (
+            '<meta property="og:title" content="Jos&eacute; &amp; Co">'
+            '<meta property="og:image" content="https://cdn.telegram.org/a.jpg?x=1&amp;y=2">'
+            '<div class="tgme_page_title"><span dir="auto">Jos&eacute; &amp; Co</span></div>'
+        )
+        resp = _mock_response(status_code=200, text=html, url="https://t.me/jose")
+        with patch("adapters.osint_sources.telegram.get_shared_client", return_value=_mock_shared_client(resp)), \
+             patch.object(_html, "parse_html", side_effect=AssertionError("parser used")):
+            profile = await TelegramScanner().scan("jose")
+
+        assert profile.exists is True
+        assert profile.metadata["name"] == "José & Co"
+        assert profile.metadata["avatar_url"] == "https://cdn.telegram.org/a.jpg?x=1&y=2"
 
     @pytest.mark.asyncio
     async def test_not_exists_when_contact_page(self):
@@ -246,8 +775,313 @@ class TestTelegramScanner:
         </head><body></body></html>"""
 
         resp = _mock_response(status_code=200, text=html, url="https://t.me/nobody")
-        with patch("adapters.osint_sources.telegram.build_async_client", return_value=_mock_client(resp)):
+        with patch("adapters.osint_sources.telegram.get_shared_client", return_value=_mock_shared_client(resp)):
             scanner = TelegramScanner()
             profile = await scanner.scan("nobody")
 
         assert profile.exists is False
+
+
+# ---------------------------------------------------------------------------
+# Gravatar profile (REST v3)
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def _clear_gravatar_cache():
+    from adapters.email_sources._cache import GRAVATAR_CACHE
+
+    GRAVATAR_CACHE.clear()
+    yield
+    GRAVATAR_CACHE.clear()
+
+
+@pytest.mark.usefixtures("_clear_gravatar_cache")
+class TestGravatarProfileScanner:
+    @pytest.mark.asyncio
+    async def test_parses_v3_profile_and_sends_api_key(self):
+        import hashlib
+        import json
+
+        from adapters.email_sources.gravatar_profile import GravatarProfileScanner
+        from core.config import AppSettings
+
+        sha = hashlib.sha256(b"jane@example.com").hexdigest()
+        resp = _mock_response(status_code=200, url=f"https://api.gravatar.com/v3/profiles/{sha}")
+        resp.json.return_value = {
+            "display_name": "Jane Doe",
+            "description": "Security researcher",
+            "avatar_url": "https://0.gravatar.com/avatar/x",
+            "verified_accounts": [{"service_label": "GitHub", "url": "https://github.com/jane"}],
+        }
+        resp.content = json.dumps(resp.json.return_value).encode()
+        client = _mock_shared_client(resp)
+        with patch("adapters.email_sources.gravatar_profile.get_shared_client", return_value=client):
+            profile = await GravatarProfileScanner(AppSettings(gravatar_api_key="gk")).scan(" Jane@Example.com ")
+
+        url = client.get.call_args.args[0]
+        assert url.endswith(f"/v3/profiles/{sha}")
+        assert client.get.call_args.kwargs["headers"]["Authorization"] == "Bearer gk"
+        assert profile.exists is True
+        assert profile.bio == "Security researcher"
+        assert profile.metadata["display_name"] == "Jane Doe"
+        assert profile.metadata["email_sha256"] == sha
+        assert profile.metadata["urls"] == [{"title": "GitHub", "value": "https://github.com/jane"}]
+
+    @pytest.mark.asyncio
+    async def test_not_found(self):
+        from adapters.email_sources.gravatar_profile import GravatarProfileScanner
+
+        resp = _mock_response(status_code=404)
+        client = _mock_shared_client(resp)
+        with patch("adapters.email_sources.gravatar_profile.get_shared_client", return_value=client):
+            profile = await GravatarProfileScanner().scan("nobody@example.com")
+
+        assert profile.exists is False
+        assert "Authorization" not in client.get.call_args.kwargs["headers"]
+
+    @pytest.mark.asyncio
+    async def test_malformed_body_is_reported_and_not_cached(self):
+        from adapters.email_sources.gravatar_profile import GravatarProfileScanner
+
+        resp = _mock_response(status_code=200, text="<html>maintenance</html>")
+        client = _mock_shared_client(resp)
+        with patch("adapters.email_sources.gravatar_profile.get_shared_client", return_value=client):
+            scanner = GravatarProfileScanner()
+            profile = await scanner.scan("m@example.com")
+            await scanner.scan("m@example.com")
+
+        assert "parse_error" in profile.metadata
+        assert profile.bio is None
+        assert client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_served_from_cache(self):
+        from adapters.email_sources.gravatar_profile import GravatarProfileScanner
+
+        resp = _mock_response(status_code=404)
+        client = _mock_shared_client(resp)
+        with patch("adapters.email_sources.gravatar_profile.get_shared_client", return_value=client):
+            scanner = GravatarProfileScanner()
+            first = await scanner.scan("a@example.com")
+            first.metadata["mutated"] = True
+            second = await scanner.scan("A@example.com ")
+            await scanner.scan("a@example.com", bypass_cache=True)
+
+        assert client.get.await_count == 2
+        assert "mutated" not in second.metadata
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_response_is_not_cached(self):
+        from adapters.email_sources.gravatar import GravatarScanner
+
+        resp = _mock_response(status_code=429)
+        client = _mock_shared_client(resp)
+        client.head = AsyncMock(return_value=resp)
+        with patch("adapters.email_sources.gravatar.get_shared_client", return_value=client):
+            scanner = GravatarScanner()
+            await scanner.scan("b@example.com")
+            await scanner.scan("b@example.com")
+
+        assert client.head.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_avatar_checked_with_head(self):
+        from adapters.email_sources.gravatar import GravatarScanner
+
+        resp = _mock_response(status_code=200, url="https://www.gravatar.com/avatar/x?s=200&d=404")
+        client = _mock_shared_client(resp)
+        client.head = AsyncMock(return_value=resp)
+        with patch("adapters.email_sources.gravatar.get_shared_client", return_value=client):
+            profile = await GravatarScanner().scan("c@example.com")
+
+        assert profile.exists is True
+        client.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_get_when_head_unsupported(self):
+        from adapters.email_sources.gravatar import GravatarScanner
+
+        client = _mock_shared_client(_mock_response(status_code=404))
+        client.head = AsyncMock(return_value=_mock_response(status_code=405))
+        with patch("adapters.email_sources.gravatar.get_shared_client", return_value=client):
+            profile = await GravatarScanner().scan("d@example.com")
+
+        assert profile.exists is False
+        assert profile.metadata["status_code"] == 404
+
+
+# ---------------------------------------------------------------------------
+# keys.openpgp.org
+# ---------------------------------------------------------------------------
+
+class TestOpenPGPKeysScanner:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("status", "text", "expected"),
+        [
+            (200, "<html>1 key found: ABCD</html>", True),
+            (200, "<html>No keys found for that query</html>", False),
+            (200, "<p>No matching keys</p>", False),
+            (404, "", False),
+        ],
+    )
+    async def test_marker_heuristic(self, status, text, expected):
+        from adapters.email_sources.pgp_keys_openpgp import OpenPGPKeysScanner
+
+        resp = _mock_response(status_code=status, text=text)
+        with patch("adapters.email_sources.pgp_keys_openpgp.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await OpenPGPKeysScanner().scan("someone@example.com")
+
+        assert profile.exists is expected
+
+
+class TestUbuntuKeyserverScanner:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("status", "body", "expected"),
+        [
+            (200, b"<pre>pub  rsa4096/ABCD</pre>", True),
+            (200, b"<h1>No results found</h1>", False),
+            (404, b"", False),
+        ],
+    )
+    async def test_marker_checked_on_raw_bytes(self, status, body, expected):
+        from adapters.email_sources.pgp_ubuntu_keyserver import UbuntuKeyserverScanner
+
+        resp = _mock_response(status_code=status)
+        resp.content = body
+        with patch("adapters.email_sources.pgp_ubuntu_keyserver.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await UbuntuKeyserverScanner().scan("someone@example.com")
+
+        assert profile.exists is expected
+
+# ---------------------------------------------------------------------------
+# Instagram / Facebook (decodificación del body solo si hace falta)
+# ---------------------------------------------------------------------------
+
+def _undecodable_response(*, status_code: int, url: str) -> MagicMock:
+    from unittest.mock import PropertyMock
+
+    resp = _mock_response(status_code=status_code, url=url)
+    type(resp).text = PropertyMock(side_effect=AssertionError("body decoded"))
+    return resp
+
+
+class TestMetaScannersSkipBodyDecode:
+    @pytest.mark.asyncio
+    async def test_instagram_missing_profile(self):
+        from adapters.osint_sources.instagram import InstagramScanner
+
+        resp = _undecodable_response(status_code=404, url="https://www.instagram.com/ghost/")
+        with patch("adapters.osint_sources.instagram.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await InstagramScanner().scan("ghost")
+
+        assert profile.exists is False
+
+    @pytest.mark.asyncio
+    async def test_facebook_login_redirect(self):
+        from adapters.osint_sources.facebook import FacebookScanner
+
+        resp = _undecodable_response(status_code=200, url="https://www.facebook.com/login/?next=ghost")
+        with patch("adapters.osint_sources.facebook.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await FacebookScanner().scan("ghost")
+
+        assert profile.exists is False
+        assert profile.metadata["blocked"] is True
+
+    @pytest.mark.asyncio
+    async def test_instagram_existing_profile_reads_og_tags(self):
+        from adapters.osint_sources.instagram import InstagramScanner
+
+        html = '<meta property="og:description" content="Hi"><title>Jane (@jane)</title>'
+        resp = _mock_response(status_code=200, text=html, url="https://www.instagram.com/jane/")
+        with patch("adapters.osint_sources.instagram.get_shared_client", return_value=_mock_shared_client(resp)):
+            profile = await InstagramScanner().scan("jane")
+
+        assert profile.exists is True
+        assert profile.bio == "Hi"
+        assert profile.metadata["title"] == "Jane (@jane)"
+
+
+# ---------------------------------------------------------------------------
+# scan_all (ejecución concurrente)
+# ---------------------------------------------------------------------------
+
+class TestScanAll:
+    @pytest.mark.asyncio
+    async def test_keeps_order_and_returns_exceptions(self):
+        import asyncio
+
+        from adapters.osint_sources import scan_all
+        from core.domain.models import SocialProfile
+
+        class _Ok:
+            def __init__(self, network: str, delay: float) -> None:
+                self.network, self.delay = network, delay
+
+            async def scan(self, username: str) -> SocialProfile:
+                await asyncio.sleep(self.delay)
+                return SocialProfile(url=f"https://{self.network}.com/{username}", username=username,
+                                     network_name=self.network, exists=True)
+
+        class _Boom:
+            async def scan(self, username: str) -> SocialProfile:
+                raise RuntimeError("down")
+
+        results = await scan_all("jane", [_Ok("slow", 0.02), _Boom(), _Ok("fast", 0)])
+
+        assert results[0].network_name == "slow"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2].network_name == "fast"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        import asyncio
+
+        from adapters.osint_sources import scan_all
+
+        state = {"active": 0, "peak": 0}
+
+        class _Tracked:
+            async def scan(self, username: str):
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.01)
+                state["active"] -= 1
+                return []
+
+        await scan_all("jane", [_Tracked() for _ in range(8)], concurrency=3)
+
+        assert state["peak"] == 3
+
+
+def test_bs4_features_prefers_lxml_when_installed(monkeypatch):
+    import sys
+    import types
+
+    from adapters.osint_sources._html import bs4_features
+
+    try:
+        bs4_features.cache_clear()
+        monkeypatch.setitem(sys.modules, "lxml", None)
+        assert bs4_features() == "html.parser"
+
+        bs4_features.cache_clear()
+        monkeypatch.setitem(sys.modules, "lxml", types.ModuleType("lxml"))
+        assert bs4_features() == "lxml"
+    finally:
+        bs4_features.cache_clear()
+
+def test_importing_scanners_does_not_load_html_parsers():
+    """bs4/selectolax se cargan al parsear, no al importar los scanners."""
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, adapters.osint_sources, adapters.email_sources; "
+        "print(any(m in sys.modules for m in ('bs4', 'selectolax')))"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    assert out.stdout.strip() == "False"
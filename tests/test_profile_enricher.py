@@ -5,12 +5,13 @@ Covers:
 - Skips non-existing profiles
 - Skips profiles with existing bio
 - Handles HTTP errors gracefully
+- Collects emails and links from the (capped) body
 """
 
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 import httpx
@@ -30,9 +31,12 @@ def _mock_response(*, status_code: int = 200, text: str = "", url: str = "https:
 
 @asynccontextmanager
 async def _mock_client_cm(response: MagicMock):
-    client = AsyncMock()
-    client.get = AsyncMock(return_value=response)
-    yield client
+    # Cliente httpx real sobre MockTransport: el enricher lee la respuesta en streaming.
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(response.status_code, text=response.text)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        yield client
 
 
 # ---------------------------------------------------------------------------
@@ -110,6 +114,19 @@ class TestEnrichProfilesFromHTML:
         # Bio should remain unchanged
         assert profile.bio == "Already has a bio"
 
+    @pytest.mark.asyncio
+    async def test_no_candidates_skips_client_creation(self):
+        """Sin perfiles que enriquecer no se construye el cliente HTTP."""
+        profiles = [
+            SocialProfile(url="https://a.example/u", username="u", network_name="a", exists=False, metadata={}),
+            SocialProfile(url="https://b.example/u", username="u", network_name="b", exists=True, metadata={}, image_url="https://b.example/i.png"),
+        ]
+
+        with patch("adapters.profile_enricher.build_async_client") as build:
+            await enrich_profiles_from_html(profiles=profiles, settings=AppSettings())
+
+        build.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handles_http_error_gracefully(self):
         """HTTP 500 should not crash the enricher."""
@@ -145,9 +162,11 @@ class TestEnrichProfilesFromHTML:
 
         @asynccontextmanager
         async def failing_client(*args, **kwargs):
-            client = AsyncMock()
-            client.get = AsyncMock(side_effect=ConnectionError("simulated"))
-            yield client
+            def handler(request: httpx.Request) -> httpx.Response:
+                raise httpx.ConnectError("simulated", request=request)
+
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                yield client
 
         with patch("adapters.profile_enricher.build_async_client", return_value=failing_client()):
             await enrich_profiles_from_html(
@@ -156,3 +175,186 @@ class TestEnrichProfilesFromHTML:
             )
 
         assert profile.bio is None
+
+    @pytest.mark.asyncio
+    async def test_stops_reading_at_scan_limit(self):
+        """Reading stops at the 64 KiB cap; a huge body is never fully downloaded."""
+        head = (
+            "<html><head><title>Jane &amp; Co</title>"
+            '<meta name="description" content="Head bio">'
+            '<meta property="og:image" content="/img/a.png"></head>'
+        )
+        # Un body enorme que nunca debería leerse completo.
+        body_chunks = [b"<body>" + b"x" * 1024 for _ in range(512)]
+        served: list[int] = []
+
+        async def stream():
+            yield head.encode()
+            for i, chunk in enumerate(body_chunks):
+                served.append(i)
+                yield chunk
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=stream(), headers={"content-type": "text/html; charset=utf-8"})
+
+        @asynccontextmanager
+        async def client_cm(*args, **kwargs):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                yield client
+
+        profile = SocialProfile(
+            url="https://example.com/users/jane",
+            username="jane",
+            network_name="example",
+            exists=True,
+            metadata={},
+        )
+        with patch("adapters.profile_enricher.build_async_client", return_value=client_cm()):
+            await enrich_profiles_from_html(profiles=[profile], settings=AppSettings())
+
+        assert profile.bio == "Head bio"
+        assert profile.image_url == "https://example.com/img/a.png"
+        assert profile.metadata["title"] == "Jane & Co"
+        assert len(served) < len(body_chunks)
+
+    @pytest.mark.asyncio
+    async def test_collects_emails_and_links_from_body(self):
+        html = (
+            "<html><head><title>Jane</title></head><body>"
+            "<p>Contact: jane.doe@example.com</p>"
+            '<a href="mailto:press@example.org">press</a>'
+            '<img src="/img/logo@2x.png">'
+            '<script>var tracker = "noreply@analytics.example";</script>'
+            '<a href="https://github.com/janedoe">GitHub</a>'
+            "</body></html>"
+        )
+        resp = _mock_response(status_code=200, text=html, url="https://example.com/jane")
+        profile = SocialProfile(
+            url="https://example.com/jane",
+            username="jane",
+            network_name="example",
+            exists=True,
+            metadata={},
+        )
+
+        with patch("adapters.profile_enricher.build_async_client", return_value=_mock_client_cm(resp)):
+            await enrich_profiles_from_html(profiles=[profile], settings=AppSettings())
+
+        assert profile.metadata["emails"] == ["jane.doe@example.com", "press@example.org"]
+        assert profile.metadata["external_links"] == ["https://github.com/janedoe"]
+        assert {"network": "github", "url": "https://github.com/janedoe", "username": "janedoe"} in (
+            profile.metadata["social_links"]
+        )
+
+
+class TestEnricherConcurrency:
+    @pytest.mark.asyncio
+    async def test_same_host_is_bounded_per_domain(self):
+        """Muchos perfiles del mismo host respetan `per_domain_concurrency`."""
+        import asyncio
+
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200, text='<html><head><meta name="description" content="bio"></head>')
+
+        @asynccontextmanager
+        async def client_cm(*args, **kwargs):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                yield client
+
+        profiles = [
+            SocialProfile(
+                url=f"https://{host}/u{i}",
+                username=f"u{i}",
+                network_name=host,
+                exists=True,
+                metadata={},
+            )
+            for host in ("a.example", "b.example")
+            for i in range(6)
+        ]
+        settings = AppSettings(per_domain_concurrency=2, request_delay_ms=0, request_jitter_ms=0)
+        with patch("adapters.profile_enricher.build_async_client", return_value=client_cm()):
+            await enrich_profiles_from_html(profiles=profiles, settings=settings, max_concurrency=20)
+
+        assert all(p.bio == "bio" for p in profiles)
+        assert peak == {"a.example": 2, "b.example": 2}
+
+    @pytest.mark.asyncio
+    async def test_request_delay_is_not_applied(self):
+        """The limiter only bounds concurrency: no per-host delay between requests."""
+        import time
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text='<html><head><meta name="description" content="bio"></head>')
+
+        @asynccontextmanager
+        async def client_cm(*args, **kwargs):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                yield client
+
+        profiles = [
+            SocialProfile(url=f"https://a.example/u{i}", username=f"u{i}", network_name="a", exists=True, metadata={})
+            for i in range(4)
+        ]
+        settings = AppSettings(per_domain_concurrency=1, request_delay_ms=2000, request_jitter_ms=0)
+        started = time.monotonic()
+        with patch("adapters.profile_enricher.build_async_client", return_value=client_cm()):
+            await enrich_profiles_from_html(profiles=profiles, settings=settings)
+
+        assert time.monotonic() - started < 1.0
+        assert all(p.bio == "bio" for p in profiles)
+
+
+class TestEnricherContentType:
+    @pytest.mark.asyncio
+    async def test_non_html_response_is_not_read(self):
+        read: list[int] = []
+
+        async def stream():
+            read.append(1)
+            yield b'<html><head><meta name="description" content="nope"></head>'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=stream(), headers={"content-type": "image/png"})
+
+        @asynccontextmanager
+        async def client_cm(*args, **kwargs):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                yield client
+
+        profile = SocialProfile(
+            url="https://example.com/avatar.png",
+            username="jane",
+            network_name="example",
+            exists=True,
+            metadata={},
+        )
+        with patch("adapters.profile_enricher.build_async_client", return_value=client_cm()):
+            await enrich_profiles_from_html(profiles=[profile], settings=AppSettings())
+
+        assert profile.bio is None
+        assert read == []
+
+    @pytest.mark.parametrize(
+        ("content_type", "expected"),
+        [
+            (None, True),
+            ("text/html; charset=utf-8", True),
+            ("Application/XHTML+XML", True),
+            ("text/plain", True),
+            ("application/json", False),
+            ("application/pdf", False),
+        ],
+    )
+    def test_is_html(self, content_type, expected):
+        from adapters.profile_enricher import _is_html
+
+        assert _is_html(content_type) is expected
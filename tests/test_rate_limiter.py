@@ -10,6 +10,7 @@ import pytest
 
 from adapters.rate_limiter import (
     DomainRateLimiter,
+    TokenBucket,
     extract_domain,
     parse_retry_after,
     request_with_retry,
@@ -221,6 +222,63 @@ class TestDomainRateLimiterThrottle:
         assert gap >= 0.08  # Pequeño margen por timing del OS
 
 
+# ---------------------------------------------------------------------------
+# TokenBucket
+# ---------------------------------------------------------------------------
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_disabled_never_waits(self, monkeypatch):
+        clock = _FakeClock()
+        monkeypatch.setattr("adapters.rate_limiter.asyncio.sleep", clock.sleep)
+        bucket = TokenBucket(clock=clock)
+        assert not bucket.enabled
+        for _ in range(100):
+            await bucket.acquire(10_000)
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_rpm_spaces_requests_after_burst(self, monkeypatch):
+        clock = _FakeClock()
+        monkeypatch.setattr("adapters.rate_limiter.asyncio.sleep", clock.sleep)
+        bucket = TokenBucket(rpm=2, clock=clock)
+        await bucket.acquire()
+        await bucket.acquire()
+        assert clock.sleeps == []
+        await bucket.acquire()
+        assert clock.now == pytest.approx(30.0)
+
+    @pytest.mark.asyncio
+    async def test_tpm_waits_for_token_budget(self, monkeypatch):
+        clock = _FakeClock()
+        monkeypatch.setattr("adapters.rate_limiter.asyncio.sleep", clock.sleep)
+        bucket = TokenBucket(tpm=600, clock=clock)
+        await bucket.acquire(500)
+        await bucket.acquire(200)  # faltan 100 tokens -> 10 s a 10 tokens/s
+        assert clock.now == pytest.approx(10.0)
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_only_waits_for_full_bucket(self, monkeypatch):
+        clock = _FakeClock()
+        monkeypatch.setattr("adapters.rate_limiter.asyncio.sleep", clock.sleep)
+        bucket = TokenBucket(tpm=100, clock=clock)
+        await bucket.acquire(5_000)
+        assert clock.sleeps == []
+
+
 # ---------------------------------------------------------------------------
 # request_with_retry
 # ---------------------------------------------------------------------------
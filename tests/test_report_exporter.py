@@ -52,3 +52,120 @@ class TestRenderPersonHtml:
         html = render_person_html(person=person, language=Language.ENGLISH)
         assert "<html" in html
         assert "nobody" in html
+
+    def test_confirmed_rows_show_source_without_mutating_profiles(self):
+        person = PersonEntity(
+            target="testuser",
+            profiles=[
+                SocialProfile(
+                    url="https://github.com/testuser",
+                    username="testuser",
+                    network_name="github",
+                    exists=True,
+                    metadata={"source": "sherlock"},
+                ),
+            ],
+        )
+        html = render_person_html(person=person, language=Language.ENGLISH)
+        assert "<td>sherlock</td>" in html
+        assert not hasattr(person.profiles[0], "_source")
+
+    def test_unconfirmed_sources_list_sherlock_first(self):
+        person = PersonEntity(
+            target="testuser",
+            profiles=[
+                SocialProfile(
+                    url=f"https://{src}.example/testuser",
+                    username="testuser",
+                    network_name=src,
+                    exists=False,
+                    metadata={"source": src},
+                )
+                for src in ("zeta", "sherlock", "alpha")
+            ],
+        )
+        html = render_person_html(person=person, language=Language.ENGLISH)
+        positions = [html.index(f": {src} (1)") for src in ("sherlock", "alpha", "zeta")]
+        assert positions == sorted(positions)
+
+    def test_bytecode_cache_falls_back_to_memory(self):
+        from unittest.mock import patch
+
+        from adapters.report_exporter import _bytecode_cache
+
+        with patch("adapters.report_exporter.FileSystemBytecodeCache", side_effect=RuntimeError("no tmp")):
+            assert _bytecode_cache() is None
+
+    def test_jinja_environment_is_reused(self):
+        from adapters.report_exporter import _get_env
+
+        render_person_html(person=_sample_person(), language=Language.ENGLISH)
+        env = _get_env()
+        render_person_html(person=_sample_person(), language=Language.SPANISH)
+        assert _get_env() is env
+
+
+class TestExportReuse:
+    def test_html_export_uses_prerendered_document(self, tmp_path):
+        from unittest.mock import patch
+
+        from adapters.report_exporter import export_person_html
+
+        with patch("adapters.report_exporter.render_person_html") as render:
+            path = export_person_html(
+                person=_sample_person(),
+                output_path=tmp_path / "r.html",
+                language=Language.ENGLISH,
+                html="<html>pre</html>",
+            )
+
+        render.assert_not_called()
+        assert path.read_text(encoding="utf-8") == "<html>pre</html>"
+
+    @pytest.mark.asyncio
+    async def test_pdf_async_runs_off_the_event_loop(self, tmp_path):
+        import threading
+        from unittest.mock import patch
+
+        from adapters.report_exporter import export_person_pdf_async
+
+        seen: dict[str, object] = {}
+
+        def fake_export(**kwargs):
+            seen["thread"] = threading.current_thread()
+            seen["html"] = kwargs["html"]
+            return kwargs["output_path"]
+
+        with patch("adapters.report_exporter.export_person_pdf", side_effect=fake_export):
+            out = await export_person_pdf_async(
+                person=_sample_person(),
+                output_path=tmp_path / "r.pdf",
+                language=Language.ENGLISH,
+                html="<html></html>",
+            )
+
+        assert out == tmp_path / "r.pdf"
+        assert seen["html"] == "<html></html>"
+        assert seen["thread"] is not threading.main_thread()
+
+    def test_pdf_uses_lazily_imported_weasyprint(self, tmp_path):
+        from unittest.mock import MagicMock, patch
+
+        from adapters.report_exporter import export_person_pdf
+
+        weasy_html = MagicMock()
+        with patch("adapters.report_exporter._weasyprint_html", return_value=weasy_html), \
+             patch("adapters.report_exporter._font_config", return_value="fonts"):
+            export_person_pdf(
+                person=_sample_person(),
+                output_path=tmp_path / "r.pdf",
+                language=Language.ENGLISH,
+                html="<html></html>",
+            )
+
+        assert weasy_html.call_args.kwargs["string"] == "<html></html>"
+        weasy_html.return_value.write_pdf.assert_called_once_with(str(tmp_path / "r.pdf"), font_config="fonts")
+
+        with patch("adapters.report_exporter._weasyprint_html", return_value=None):
+            with pytest.raises(ImportError, match="WeasyPrint is not available"):
+                export_person_pdf(person=_sample_person(), output_path=tmp_path / "x.pdf", language=Language.ENGLISH)
@@ -14,11 +14,25 @@ import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from core.resources_loader import load_sherlock_data, get_default_list_path
 
 
+def _stream_response(*, status_code: int = 200, json_body: object = None) -> MagicMock:
+    """Mock de ``Client.stream`` que entrega una respuesta real (por trozos)."""
+
+    response = httpx.Response(
+        status_code,
+        content=json.dumps(json_body).encode() if json_body is not None else b"",
+        request=httpx.Request("GET", "https://example.com/data.json"),
+    )
+    stream = MagicMock()
+    stream.return_value.__enter__.return_value = response
+    return stream
+
+
 # ---------------------------------------------------------------------------
 # load_sherlock_data — cached path
 # ---------------------------------------------------------------------------
@@ -44,12 +58,29 @@ class TestLoadSherlockCached:
         cache_file = data_dir / "sherlock.json"
         cache_file.write_text("{}", encoding="utf-8")
 
-        mock_get = MagicMock()
+        mock_stream = MagicMock()
         with patch("core.resources_loader._data_dir", return_value=data_dir), \
-             patch("core.resources_loader.httpx.get", mock_get):
+             patch("core.resources_loader._http_client", return_value=MagicMock(stream=mock_stream)):
             load_sherlock_data(refresh=False)
 
-        mock_get.assert_not_called()
+        mock_stream.assert_not_called()
+
+
+class TestLoadSherlockMemoized:
+    def test_reuses_parse_until_file_changes(self, tmp_path: Path):
+        import os
+
+        cache_file = tmp_path / "sherlock.json"
+        cache_file.write_text('{"A": {}}', encoding="utf-8")
+
+        with patch("core.resources_loader._data_dir", return_value=tmp_path):
+            first = load_sherlock_data()
+            assert load_sherlock_data() is first
+
+            cache_file.write_text('{"B": {}}', encoding="utf-8")
+            st = cache_file.stat()
+            os.utime(cache_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            assert load_sherlock_data() == {"B": {}}
 
 
 # ---------------------------------------------------------------------------
@@ -63,13 +94,9 @@ class TestLoadSherlockDownload:
         data_dir.mkdir()
 
         expected = {"DownloadedSite": {"url": "http://dl/{}", "errorType": "status_code"}}
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = expected
-        mock_resp.raise_for_status = MagicMock()
 
         with patch("core.resources_loader._data_dir", return_value=data_dir), \
-             patch("core.resources_loader.httpx.get", return_value=mock_resp):
+             patch("core.resources_loader._http_client", return_value=MagicMock(stream=_stream_response(json_body=expected))):
             result = load_sherlock_data(refresh=False)
 
         assert result == expected
@@ -85,18 +112,49 @@ class TestLoadSherlockDownload:
         cache_file.write_text('{"old": true}', encoding="utf-8")
 
         new_data = {"NewSite": {"url": "http://new/{}"}}
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = new_data
-        mock_resp.raise_for_status = MagicMock()
 
         with patch("core.resources_loader._data_dir", return_value=data_dir), \
-             patch("core.resources_loader.httpx.get", return_value=mock_resp):
+             patch("core.resources_loader._http_client", return_value=MagicMock(stream=_stream_response(json_body=new_data))):
             result = load_sherlock_data(refresh=True)
 
         assert result == new_data
 
 
+class TestLoadSherlockJsonBackends:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, tmp_path: Path, monkeypatch, use_orjson: bool):
+        import core.resources_loader as resources_loader
+
+        if not use_orjson:
+            monkeypatch.setattr(resources_loader, "orjson", None)
+        data = {"Sité": {"url": "http://x/{}", "isNSFW": False}}
+
+        with patch("core.resources_loader._data_dir", return_value=tmp_path), \
+             patch("core.resources_loader._http_client", return_value=MagicMock(stream=_stream_response(json_body=data))):
+            assert load_sherlock_data(refresh=True) == data
+            assert load_sherlock_data(refresh=False) == data
+
+        # Se guardan los bytes descargados tal cual, sin temporales sueltos.
+        assert json.loads((tmp_path / "sherlock.json").read_bytes()) == data
+        assert [p.name for p in tmp_path.iterdir()] == ["sherlock.json"]
+
+    def test_invalid_download_keeps_previous_cache(self, tmp_path: Path):
+        cache_file = tmp_path / "sherlock.json"
+        cache_file.write_text('{"old": true}', encoding="utf-8")
+        stream = _stream_response()
+        stream.return_value.__enter__.return_value = httpx.Response(
+            200, content=b'{"truncated": ', request=httpx.Request("GET", "https://example.com")
+        )
+
+        with patch("core.resources_loader._data_dir", return_value=tmp_path), \
+             patch("core.resources_loader._http_client", return_value=MagicMock(stream=stream)):
+            with pytest.raises(ValueError):
+                load_sherlock_data(refresh=True)
+
+        assert cache_file.read_text(encoding="utf-8") == '{"old": true}'
+        assert [p.name for p in tmp_path.iterdir()] == ["sherlock.json"]
+
+
 # ---------------------------------------------------------------------------
 # load_sherlock_data — download failure
 # ---------------------------------------------------------------------------
@@ -107,16 +165,8 @@ class TestLoadSherlockDownloadFailure:
         data_dir = tmp_path / "data"
         data_dir.mkdir()
 
-        import httpx
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Server Error",
-            request=MagicMock(),
-            response=MagicMock(status_code=500),
-        )
-
         with patch("core.resources_loader._data_dir", return_value=data_dir), \
-             patch("core.resources_loader.httpx.get", return_value=mock_resp):
+             patch("core.resources_loader._http_client", return_value=MagicMock(stream=_stream_response(status_code=500))):
             with pytest.raises(httpx.HTTPStatusError):
                 load_sherlock_data(refresh=False)
 
@@ -147,3 +197,31 @@ class TestGetDefaultListPath:
             result = get_default_list_path("nonexistent_file.json")
 
         assert result is None
+
+    def test_sees_file_created_after_first_lookup(self, tmp_path: Path):
+        """The per-directory listing cache is invalidated by the directory mtime."""
+        import os
+
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+
+        with patch("core.resources_loader._project_root", return_value=tmp_path), \
+             patch("core.resources_loader.get_user_config_dir", return_value=tmp_path / "config"):
+            assert get_default_list_path("late.json") is None
+            (data_dir / "late.json").write_text("[]", encoding="utf-8")
+            os.utime(data_dir, ns=(0, data_dir.stat().st_mtime_ns + 1_000_000_000))
+            assert get_default_list_path("late.json") == data_dir / "late.json"
+
+    def test_ignores_directories_with_the_same_name(self, tmp_path: Path):
+        (tmp_path / "data" / "sites.json").mkdir(parents=True)
+
+        with patch("core.resources_loader._project_root", return_value=tmp_path), \
+             patch("core.resources_loader.get_user_config_dir", return_value=tmp_path / "config"):
+            assert get_default_list_path("sites.json") is None
+
+
+class TestDownloadClient:
+    def test_client_is_reused(self):
+        from core.resources_loader import _http_client
+
+        assert _http_client() is _http_client()
@@ -90,6 +90,10 @@ class TestSafeScanErrorFallback:
         assert error_profiles[0].exists is False
         assert "simulated network failure" in str(error_profiles[0].metadata["error"])
         assert result.scan_errors >= 1
+        # Construido sin revalidar, pero con todos los campos y defaults del modelo.
+        dumped = error_profiles[0].model_dump(mode="json")
+        assert dumped["url"] == "https://failing.com/testuser"
+        assert dumped["bio"] is None and dumped["image_url"] is None
 
 
 # ---------------------------------------------------------------------------
@@ -183,3 +187,40 @@ class TestSiteListErrorCounting:
         )
         assert error_count >= 1
         assert isinstance(found, list)
+
+    @pytest.mark.asyncio
+    async def test_status_mismatch_skips_body_decode(self):
+        """Un status distinto de e_code descarta el sitio sin leer `resp.text`."""
+        from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+        import httpx
+
+        from adapters.site_lists.models import UsernameSite
+        from adapters.site_lists.runner import run_username_sites
+
+        resp = MagicMock(spec=httpx.Response)
+        resp.status_code = 404
+        text = PropertyMock(side_effect=AssertionError("body decoded"))
+        type(resp).text = text
+
+        sites = [
+            UsernameSite(
+                name="Miss",
+                uri_check="https://miss.test/{account}",
+                e_code=200,
+                e_string="profile",
+            ),
+        ]
+        with patch("adapters.site_lists.runner.request_with_retry", AsyncMock(return_value=resp)):
+            found, error_count = await run_username_sites(
+                usernames=["testuser"],
+                sites=sites,
+                settings=AppSettings(),
+                max_concurrency=5,
+                categories=None,
+                no_nsfw=False,
+            )
+
+        assert found == []
+        assert error_count == 0
+        text.assert_not_called()
@@ -7,6 +7,7 @@ Covers:
 - NSFW filtering
 - Progress callback
 - Error counting (from #34 fix)
+- Manifest compilation (sherlock_sites)
 """
 
 from __future__ import annotations
@@ -18,7 +19,7 @@ import pytest
 import httpx
 
 from core.config import AppSettings
-from adapters.sherlock_runner import run_sherlock_username
+from adapters.sherlock_runner import run_sherlock_username, sherlock_sites
 
 
 def _mock_response(*, status_code: int = 200, text: str = "", url: str = "https://example.com") -> MagicMock:
@@ -305,3 +306,45 @@ class TestSherlockProgressCallback:
         totals = {c[1] for c in progress_calls}
         assert 2 in totals  # 2 sites × 1 username = 2 total
         assert isinstance(found, list)  # Verify return type
+
+
+# ---------------------------------------------------------------------------
+# Manifest compilation
+# ---------------------------------------------------------------------------
+
+class TestSherlockSites:
+    def test_normalizes_entries_once(self):
+        manifest = {
+            "$schema": "schema.json",
+            "Some Site": {
+                "url": "https://s/{}",
+                "errorType": ["status_code", 3],
+                "errorCode": 404,
+                "request_method": "head",
+                "headers": {"X": "1"},
+            },
+            "Adult": {"url": "https://n/{}", "errorType": "message", "isNSFW": True},
+            "NoUrl": {"errorCode": "bad"},
+            "Broken": "not-a-dict",
+        }
+
+        sites = sherlock_sites(manifest, no_nsfw=False)
+
+        assert [s.name for s in sites] == ["Some Site", "Adult", "NoUrl"]
+        first = sites[0]
+        assert first.network_name == "some-site"
+        assert first.error_types == ("status_code",)
+        assert first.error_codes == (404,)
+        assert first.request_method == "HEAD"
+        assert first.headers == {"X": "1"}
+        assert sites[2].url_template is None
+        assert sites[2].error_codes is None
+        assert [s.name for s in sherlock_sites(manifest, no_nsfw=True)] == ["Some Site", "NoUrl"]
+
+    def test_reuses_compilation_for_same_manifest(self):
+        manifest = {"A": {"url": "https://a/{}"}}
+
+        assert sherlock_sites(manifest, no_nsfw=False) is sherlock_sites(manifest, no_nsfw=False)
+        assert sherlock_sites({"A": {"url": "https://a/{}"}}, no_nsfw=False) is not sherlock_sites(
+            manifest, no_nsfw=False
+        )
@@ -0,0 +1,67 @@
+"""Tests for site-list JSON loading."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from adapters.site_lists import load_email_sites, load_username_sites
+
+
+class TestLoadSites:
+    def test_loads_username_sites(self, tmp_path):
+        path = tmp_path / "wmn-data.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "sites": [
+                        {
+                            "name": "Ejemplo",
+                            "uri_check": "https://example.com/{account}",
+                            "e_code": 200,
+                            "e_string": "perfil",
+                            "cat": "social",
+                        }
+                    ]
+                }
+            ),
+            encoding="utf-8",
+        )
+        loaded = load_username_sites(path)
+        assert [s.name for s in loaded.sites] == ["Ejemplo"]
+        assert loaded.sites[0].m_code is None
+
+    def test_loads_email_sites_with_unicode(self, tmp_path):
+        path = tmp_path / "email-data.json"
+        path.write_text(
+            '{"sites": [{"name": "Señal", "uri_check": "https://x.test/{account}", '
+            '"e_code": 200, "e_string": "ñ", "input_operation": "sha256"}]}',
+            encoding="utf-8",
+        )
+        site = load_email_sites(path).sites[0]
+        assert site.name == "Señal"
+        assert site.method == "GET"
+        assert site.input_operation == "sha256"
+
+    def test_invalid_site_is_rejected(self, tmp_path):
+        path = tmp_path / "bad.json"
+        path.write_text('{"sites": [{"name": "x", "uri_check": "u", "e_code": 42, "e_string": "s"}]}', encoding="utf-8")
+        with pytest.raises(ValidationError):
+            load_username_sites(path)
+
+    def test_reloads_only_when_file_changes(self, tmp_path):
+        import os
+
+        path = tmp_path / "wmn-data.json"
+        site = {"name": "A", "uri_check": "https://a.test/{account}", "e_code": 200, "e_string": "a"}
+        path.write_text(json.dumps({"sites": [site]}), encoding="utf-8")
+
+        first = load_username_sites(path)
+        assert load_username_sites(path) is first
+
+        path.write_text(json.dumps({"sites": [site, {**site, "name": "B"}]}), encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert [s.name for s in load_username_sites(path).sites] == ["A", "B"]
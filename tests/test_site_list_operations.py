@@ -0,0 +1,28 @@
+"""Tests for site-list input operations."""
+
+from __future__ import annotations
+
+import hashlib
+
+from adapters.site_lists.operations import apply_input_operation
+
+
+class TestApplyInputOperation:
+    def test_hashes_match_hashlib(self):
+        email = "user@example.com"
+        assert apply_input_operation(email, "md5") == hashlib.md5(email.encode()).hexdigest()
+        assert apply_input_operation(email, "hash-sha1") == hashlib.sha1(email.encode()).hexdigest()
+        assert apply_input_operation(email, "SHA256") == hashlib.sha256(email.encode()).hexdigest()
+
+    def test_unknown_and_missing_operations_return_input(self):
+        assert apply_input_operation("a@b.c", None) == "a@b.c"
+        assert apply_input_operation("a@b.c", "rot13") == "a@b.c"
+        assert apply_input_operation("a+b@c.d", "urlencode") == "a%2Bb%40c.d"
+
+    def test_repeated_operation_is_memoized(self):
+        apply_input_operation.cache_clear()
+        for _ in range(5):
+            apply_input_operation("memo@example.com", "sha256")
+        info = apply_input_operation.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
@@ -0,0 +1,38 @@
+"""Tests for Rich UI components."""
+
+from __future__ import annotations
+
+from rich.console import Console
+
+from cli.ui_components import build_analysis_panel
+from core.domain.models import AnalysisReport
+
+
+def _render(panel) -> str:
+    console = Console(width=120, record=True, color_system=None)
+    console.print(panel)
+    return console.export_text()
+
+
+class TestBuildAnalysisPanel:
+    def test_renders_highlights_literally(self):
+        report = AnalysisReport(
+            summary="Same person across [github] and reddit.",
+            highlights=["uses [bold]tag[/bold] literally", "second"],
+            confidence=0.8,
+            model="m1",
+        )
+        body = build_analysis_panel(report).renderable
+
+        text = _render(build_analysis_panel(report))
+        assert "[github]" in text
+        assert "- uses [bold]tag[/bold] literally" in text
+        assert "- second" in text
+        assert "Confidence: 0.80" in text
+        assert "Model: m1" in text
+        # Spans constantes: título de highlights + modelo, no uno por highlight.
+        assert len(body.spans) == 2
+
+    def test_skips_highlights_embedded_in_summary(self):
+        report = AnalysisReport(summary="Highlights: already here", highlights=["x"])
+        assert "Highlights:\n" not in build_analysis_panel(report).renderable.plain